@@ -0,0 +1,208 @@
+"""
+Bounding volume hierarchy (AABB tree) for fast ray-triangle picking.
+
+The tree is built once per model when it is loaded and stored as flat
+structure-of-arrays so traversal only touches contiguous numpy buffers.
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+
+# Maximum number of triangles stored in a single leaf node
+BVH_LEAF_SIZE = 8
+
+
+class TriangleBVH:
+    """
+    AABB tree over the triangles of a mesh.
+
+    Nodes are stored as parallel arrays. Interior nodes reference their
+    children through node_left/node_right; leaves reference a contiguous
+    run of tri_order via tri_start/tri_count (tri_count is 0 for interior
+    nodes).
+    """
+
+    def __init__(self, vertices, indices, leaf_size: int = BVH_LEAF_SIZE):
+        """
+        Build the tree with a top-down midpoint split.
+
+        Args:
+            vertices: Vertex positions, shape (N, 3) or flat
+            indices: Triangle indices, shape (M, 3) or flat
+            leaf_size: Maximum triangles per leaf
+        """
+        verts = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        tris = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+
+        # Per-triangle corner positions, shape (M, 3) each
+        self.v0 = verts[tris[:, 0]]
+        self.v1 = verts[tris[:, 1]]
+        self.v2 = verts[tris[:, 2]]
+
+        tri_min = np.minimum(np.minimum(self.v0, self.v1), self.v2)
+        tri_max = np.maximum(np.maximum(self.v0, self.v1), self.v2)
+        centroids = (self.v0 + self.v1 + self.v2) / 3.0
+
+        num_tris = len(tris)
+        self.tri_order = np.arange(num_tris, dtype=np.int64)
+
+        node_min, node_max = [], []
+        node_left, node_right = [], []
+        tri_start, tri_count = [], []
+
+        def new_node():
+            node_min.append(None)
+            node_max.append(None)
+            node_left.append(-1)
+            node_right.append(-1)
+            tri_start.append(0)
+            tri_count.append(0)
+            return len(node_min) - 1
+
+        if num_tris > 0:
+            stack = [(new_node(), 0, num_tris)]
+        else:
+            stack = []
+
+        while stack:
+            node, start, end = stack.pop()
+            idx = self.tri_order[start:end]
+
+            node_min[node] = tri_min[idx].min(axis=0)
+            node_max[node] = tri_max[idx].max(axis=0)
+
+            count = end - start
+            if count <= leaf_size:
+                tri_start[node] = start
+                tri_count[node] = count
+                continue
+
+            # Split on the longest axis of the centroid bounds
+            c = centroids[idx]
+            c_min = c.min(axis=0)
+            c_max = c.max(axis=0)
+            axis = int(np.argmax(c_max - c_min))
+            split = 0.5 * (c_min[axis] + c_max[axis])
+
+            mask = c[:, axis] < split
+            num_left = int(np.count_nonzero(mask))
+            if num_left == 0 or num_left == count:
+                # All centroids on one side - fall back to a median split
+                num_left = count // 2
+                order = np.argpartition(c[:, axis], num_left)
+                self.tri_order[start:end] = idx[order]
+            else:
+                self.tri_order[start:end] = np.concatenate((idx[mask], idx[~mask]))
+
+            left = new_node()
+            right = new_node()
+            node_left[node] = left
+            node_right[node] = right
+            stack.append((left, start, start + num_left))
+            stack.append((right, start + num_left, end))
+
+        self.node_aabb_min = np.array(node_min, dtype=np.float64).reshape(-1, 3)
+        self.node_aabb_max = np.array(node_max, dtype=np.float64).reshape(-1, 3)
+        self.node_left = np.array(node_left, dtype=np.int64)
+        self.node_right = np.array(node_right, dtype=np.int64)
+        self.tri_start = np.array(tri_start, dtype=np.int64)
+        self.tri_count = np.array(tri_count, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Get the number of nodes in the tree."""
+        return len(self.node_left)
+
+    def intersect_ray(self, origin, direction) -> Optional[Tuple[int, float]]:
+        """
+        Find the closest triangle hit by a ray.
+
+        Args:
+            origin: Ray origin (x, y, z)
+            direction: Ray direction (x, y, z), need not be normalized
+
+        Returns:
+            (triangle_index, t) of the nearest hit, or None if nothing is hit.
+            triangle_index refers to the original triangle order.
+        """
+        if len(self) == 0:
+            return None
+
+        origin = np.asarray(origin, dtype=np.float64)
+        direction = np.asarray(direction, dtype=np.float64)
+
+        with np.errstate(divide='ignore'):
+            inv_dir = 1.0 / direction
+
+        best_t = np.inf
+        best_tri = -1
+
+        stack = [0]
+        while stack:
+            node = stack.pop()
+
+            # Slab test against the node bounds
+            with np.errstate(invalid='ignore'):
+                t0 = (self.node_aabb_min[node] - origin) * inv_dir
+                t1 = (self.node_aabb_max[node] - origin) * inv_dir
+            t_near = np.nanmax(np.minimum(t0, t1))
+            t_far = np.nanmin(np.maximum(t0, t1))
+            if t_near > t_far or t_far < 0.0 or t_near > best_t:
+                continue
+
+            count = self.tri_count[node]
+            if count == 0:
+                stack.append(self.node_left[node])
+                stack.append(self.node_right[node])
+                continue
+
+            start = self.tri_start[node]
+            tri_ids = self.tri_order[start:start + count]
+            hit = self._intersect_triangles(origin, direction, tri_ids)
+            if hit is not None and hit[1] < best_t:
+                best_tri, best_t = hit
+
+        if best_tri < 0:
+            return None
+        return best_tri, best_t
+
+    def _intersect_triangles(self, origin, direction, tri_ids):
+        """Vectorized Moller-Trumbore test against a batch of triangles."""
+        v0 = self.v0[tri_ids]
+        edge1 = self.v1[tri_ids] - v0
+        edge2 = self.v2[tri_ids] - v0
+
+        pvec = np.cross(direction, edge2)
+        det = np.einsum('ij,ij->i', edge1, pvec)
+        valid = np.abs(det) > 1e-12
+        inv_det = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+
+        tvec = origin - v0
+        u = np.einsum('ij,ij->i', tvec, pvec) * inv_det
+        qvec = np.cross(tvec, edge1)
+        v = (qvec @ direction) * inv_det
+        t = np.einsum('ij,ij->i', edge2, qvec) * inv_det
+
+        valid &= (u >= 0.0) & (v >= 0.0) & (u + v <= 1.0) & (t >= 0.0)
+        if not np.any(valid):
+            return None
+
+        t = np.where(valid, t, np.inf)
+        best = int(np.argmin(t))
+        return int(tri_ids[best]), float(t[best])
+
+
+def build_bvh(vertices, indices, leaf_size: int = BVH_LEAF_SIZE) -> Optional[TriangleBVH]:
+    """
+    Build a picking BVH for a triangle mesh.
+
+    Args:
+        vertices: Vertex positions
+        indices: Triangle indices (three per triangle)
+        leaf_size: Maximum triangles per leaf
+
+    Returns:
+        TriangleBVH instance, or None if the mesh has no triangles
+    """
+    if vertices is None or indices is None or len(indices) < 3:
+        return None
+    return TriangleBVH(vertices, indices, leaf_size)
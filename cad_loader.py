@@ -17,9 +17,12 @@ from OCP.TColgp import TColgp_Array1OfPnt
 from OCP.gp import gp_Pnt
 from OCP.Bnd import Bnd_Box
 from OCP.BRepBndLib import BRepBndLib
+import logging
 import numpy as np
 from typing import Optional, List, Tuple, Callable
-import traceback
+from bvh import build_bvh
+
+logger = logging.getLogger(__name__)
 
 # Constants for tessellation quality
 LINEAR_DEFLECTION = 0.1  # mm - very fine tessellation
@@ -31,9 +34,10 @@ class CADModel:
     """Represents a loaded CAD model with BREP data for rendering"""
 
     def __init__(self):
-        self.vertices = []  # List of vertex positions [x, y, z]
-        self.normals = []   # List of vertex normals [nx, ny, nz]
-        self.indices = []   # List of triangle indices for faces
+        # Mesh arrays, converted to NumPy by the loader (see as_mesh_arrays)
+        self.vertices = np.empty((0, 3), dtype=np.float32)  # float32 (N, 3) positions
+        self.normals = np.empty((0, 3), dtype=np.float32)   # float32 (N, 3) vertex normals
+        self.indices = np.empty(0, dtype=np.uint32)         # uint32 triangle indices
 
         # Edge data for BREP-style rendering
         self.edge_vertices = []  # List of edge line segments
@@ -41,6 +45,37 @@ class CADModel:
 
         self.bounds = None  # Bounding box (min_x, min_y, min_z, max_x, max_y, max_z)
 
+        self.bvh = None  # TriangleBVH for face picking, built at load time
+
+        # GPU-ready copies of the mesh, filled by pack_buffers()
+        self.interleaved = None  # float32 (N, 6): x, y, z, nx, ny, nz per vertex
+        self.indices_np = None   # uint32 triangle indices
+
+    def as_mesh_arrays(self):
+        """Convert vertices, normals and indices to contiguous NumPy arrays
+
+        Idempotent: arrays already in the right dtype and shape are kept as is,
+        so models built from plain lists can still be converted after the fact.
+        """
+        self.vertices = np.ascontiguousarray(self.vertices, dtype=np.float32).reshape(-1, 3)
+        self.normals = np.ascontiguousarray(self.normals, dtype=np.float32).reshape(-1, 3)
+        self.indices = np.ascontiguousarray(self.indices, dtype=np.uint32).reshape(-1)
+
+    def has_mesh(self):
+        """Whether the model has any triangles to draw"""
+        return len(self.vertices) > 0 and len(self.indices) > 0
+
+    def pack_buffers(self):
+        """Pack vertices and normals into one interleaved float32 array for upload"""
+        if not isinstance(self.vertices, np.ndarray) or not isinstance(self.indices, np.ndarray):
+            self.as_mesh_arrays()
+        num_vertices = len(self.vertices)
+        self.interleaved = np.empty((num_vertices, 6), dtype=np.float32)
+        if num_vertices:
+            self.interleaved[:, :3] = self.vertices
+            self.interleaved[:, 3:] = self.normals
+        self.indices_np = self.indices
+
     def get_center(self):
         """Get the center point of the model"""
         if self.bounds:
@@ -61,6 +96,35 @@ class CADModel:
         return 1.0
 
 
+def compute_vertex_normals(vertices: np.ndarray, indices: np.ndarray) -> np.ndarray:
+    """
+    Compute smooth vertex normals by averaging adjacent unit face normals.
+
+    Args:
+        vertices: float (N, 3) vertex positions
+        indices: Flat triangle indices (three per triangle)
+
+    Returns:
+        float32 (N, 3) array of unit normals (zero for unused vertices)
+    """
+    verts = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    tris = np.asarray(indices, dtype=np.intp).reshape(-1, 3)
+
+    v0, v1, v2 = verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+    face_normals = np.cross(v1 - v0, v2 - v0)
+    lengths = np.linalg.norm(face_normals, axis=1, keepdims=True)
+    np.divide(face_normals, lengths, out=face_normals, where=lengths > 0)
+
+    # Accumulate each face normal onto its three corners
+    vertex_normals = np.zeros_like(verts)
+    for corner in range(3):
+        np.add.at(vertex_normals, tris[:, corner], face_normals)
+
+    lengths = np.linalg.norm(vertex_normals, axis=1, keepdims=True)
+    np.divide(vertex_normals, lengths, out=vertex_normals, where=lengths > 0)
+    return np.ascontiguousarray(vertex_normals, dtype=np.float32)
+
+
 def load_cad_file(file_path: str) -> Optional[CADModel]:
     """
     Load a CAD file (STEP or IGES) and extract BREP data with minimal tessellation.
@@ -158,6 +222,9 @@ def load_cad_file_with_progress(
         report_progress("extracting", "Extracting faces...")
         face_explorer = TopExp_Explorer(shape, TopAbs_FACE)
         vertex_offset = 0
+        # Accumulated as lists while walking the faces, converted once at the end
+        vertices = []
+        indices = []
 
         while face_explorer.More():
             face = TopoDS.Face_s(face_explorer.Current())
@@ -191,15 +258,15 @@ def load_cad_file_with_progress(
                     n1, n2, n3 = tri.Get()
 
                     # Adjust for 1-based indexing and add vertex offset
-                    model.indices.extend([
+                    indices.extend([
                         vertex_offset + n1 - 1,
                         vertex_offset + n2 - 1,
                         vertex_offset + n3 - 1
                     ])
 
                 # Add vertices to model
-                model.vertices.extend(face_vertices)
-                vertex_offset = len(model.vertices)
+                vertices.extend(face_vertices)
+                vertex_offset = len(vertices)
 
             face_explorer.Next()
 
@@ -248,60 +315,33 @@ def load_cad_file_with_progress(
 
             edge_explorer.Next()
 
+        model.vertices = vertices
+        model.indices = indices
+        model.as_mesh_arrays()
+
         # Calculate vertex normals
         report_progress("computing", "Computing normals...")
-        vertex_normals = [[0.0, 0.0, 0.0] for _ in range(len(model.vertices))]
-
-        # Calculate face normals and accumulate to vertices
-        for i in range(0, len(model.indices), 3):
-            i0, i1, i2 = model.indices[i], model.indices[i+1], model.indices[i+2]
-
-            # Get triangle vertices
-            v0 = np.array(model.vertices[i0])
-            v1 = np.array(model.vertices[i1])
-            v2 = np.array(model.vertices[i2])
-
-            # Calculate face normal
-            edge1 = v1 - v0
-            edge2 = v2 - v0
-            normal = np.cross(edge1, edge2)
-
-            # Normalize
-            length = np.linalg.norm(normal)
-            if length > 0:
-                normal = normal / length
-
-            # Accumulate to vertex normals
-            for idx in [i0, i1, i2]:
-                vertex_normals[idx][0] += normal[0]
-                vertex_normals[idx][1] += normal[1]
-                vertex_normals[idx][2] += normal[2]
-
-        # Normalize all vertex normals
-        for i in range(len(vertex_normals)):
-            normal = np.array(vertex_normals[i])
-            length = np.linalg.norm(normal)
-            if length > 0:
-                normal = normal / length
-                vertex_normals[i] = normal.tolist()
-
-        model.normals = vertex_normals
+        model.normals = compute_vertex_normals(model.vertices, model.indices)
+        model.pack_buffers()
+
+        # Build the picking BVH here so it stays off the UI thread
+        report_progress("indexing", "Building picking BVH...")
+        model.bvh = build_bvh(model.vertices, model.indices)
 
         min_x, min_y, min_z, max_x, max_y, max_z = model.bounds
 
         report_progress("complete", "Loading complete!")
-        print(f"Geometry extracted: {len(model.vertices)} vertices, "
-              f"{len(model.indices)//3} triangles, {len(model.edge_indices)//2} edge segments")
-        print(f"Bounds (mm): ({min_x:.2f}, {min_y:.2f}, {min_z:.2f}) to "
-              f"({max_x:.2f}, {max_y:.2f}, {max_z:.2f})")
-        print(f"Model size: {max_x - min_x:.2f} x {max_y - min_y:.2f} x "
-              f"{max_z - min_z:.2f} mm")
+        logger.info("Geometry extracted: %d vertices, %d triangles, %d edge segments",
+                    len(model.vertices), len(model.indices) // 3, len(model.edge_indices) // 2)
+        logger.info("Bounds (mm): (%.2f, %.2f, %.2f) to (%.2f, %.2f, %.2f)",
+                    min_x, min_y, min_z, max_x, max_y, max_z)
+        logger.info("Model size: %.2f x %.2f x %.2f mm",
+                    max_x - min_x, max_y - min_y, max_z - min_z)
 
         return model
 
     except Exception as e:
         error_msg = f"Error loading CAD file: {e}"
-        print(error_msg)
-        traceback.print_exc()
+        logger.exception("Error loading CAD file %s", file_path)
         report_progress("error", error_msg)
         raise
@@ -0,0 +1,182 @@
+"""
+Small 4x4 matrix helpers mirroring the fixed-function OpenGL pipeline.
+
+Matrices are row-major NumPy arrays acting on column vectors (the usual
+math convention). OpenGL stores matrices column-major, so convert them
+with gl_matrix before passing them to glLoadMatrix/glMultMatrix.
+"""
+
+import numpy as np
+
+
+def translation_matrix(x, y, z):
+    """Translation matrix, like glTranslate."""
+    m = np.eye(4)
+    m[:3, 3] = (x, y, z)
+    return m
+
+
+def rotation_matrix(degrees, x, y, z):
+    """Rotation by an angle in degrees about the axis (x, y, z), like glRotate."""
+    axis = np.array((x, y, z), dtype=np.float64)
+    axis /= np.linalg.norm(axis)
+    ax, ay, az = axis
+    c = np.cos(np.radians(degrees))
+    s = np.sin(np.radians(degrees))
+    t = 1.0 - c
+
+    m = np.eye(4)
+    m[:3, :3] = (
+        (ax * ax * t + c, ax * ay * t - az * s, ax * az * t + ay * s),
+        (ay * ax * t + az * s, ay * ay * t + c, ay * az * t - ax * s),
+        (az * ax * t - ay * s, az * ay * t + ax * s, az * az * t + c),
+    )
+    return m
+
+
+def scale_matrix(x, y, z):
+    """Scale matrix, like glScale."""
+    return np.diag((x, y, z, 1.0))
+
+
+def perspective_matrix(fovy, aspect, near, far):
+    """Perspective projection matrix, like gluPerspective."""
+    f = 1.0 / np.tan(np.radians(fovy) / 2.0)
+    m = np.zeros((4, 4))
+    m[0, 0] = f / aspect
+    m[1, 1] = f
+    m[2, 2] = (far + near) / (near - far)
+    m[2, 3] = 2.0 * far * near / (near - far)
+    m[3, 2] = -1.0
+    return m
+
+
+def ortho_matrix(left, right, bottom, top, near, far):
+    """Orthographic projection matrix, like glOrtho."""
+    m = np.eye(4)
+    m[0, 0] = 2.0 / (right - left)
+    m[1, 1] = 2.0 / (top - bottom)
+    m[2, 2] = -2.0 / (far - near)
+    m[:3, 3] = (-(right + left) / (right - left),
+                -(top + bottom) / (top - bottom),
+                -(far + near) / (far - near))
+    return m
+
+
+def pick_matrix(x, y, width, height, viewport):
+    """Pick region matrix, like gluPickMatrix.
+
+    Multiplied onto a projection, it maps the width x height region of
+    viewport centered at window point (x, y) onto the whole of clip space,
+    so the region fills whatever viewport is used to draw it.
+    """
+    m = np.eye(4)
+    m[0, 0] = viewport[2] / width
+    m[1, 1] = viewport[3] / height
+    m[0, 3] = (viewport[2] - 2.0 * (x - viewport[0])) / width
+    m[1, 3] = (viewport[3] - 2.0 * (y - viewport[1])) / height
+    return m
+
+
+def gl_matrix(matrix, dtype=np.float64):
+    """Convert a math-convention matrix to OpenGL's column-major layout."""
+    return np.ascontiguousarray(np.asarray(matrix).T, dtype=dtype)
+
+
+def project_points(points, modelview, projection, viewport):
+    """
+    Project object-space points to window coordinates, like gluProject.
+
+    Args:
+        points: Object-space points, shape (N, 3)
+        modelview: 4x4 modelview matrix
+        projection: 4x4 projection matrix
+        viewport: (x, y, width, height)
+
+    Returns:
+        Window coordinates (x, y, depth), shape (N, 3). Points with w == 0
+        come back as NaN.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    homogeneous = np.hstack((points, np.ones((len(points), 1))))
+
+    clip = homogeneous @ (projection @ modelview).T
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ndc = clip[:, :3] / clip[:, 3:4]
+    ndc[clip[:, 3] == 0.0] = np.nan
+
+    vp_x, vp_y, vp_w, vp_h = viewport
+    window = np.empty_like(ndc)
+    window[:, 0] = vp_x + (ndc[:, 0] + 1.0) * 0.5 * vp_w
+    window[:, 1] = vp_y + (ndc[:, 1] + 1.0) * 0.5 * vp_h
+    window[:, 2] = (ndc[:, 2] + 1.0) * 0.5
+    return window
+
+
+def unproject_points(window, modelview, projection, viewport):
+    """
+    Map window coordinates back to object space, like gluUnProject.
+
+    Args:
+        window: Window coordinates (x, y, depth), shape (N, 3)
+        modelview: 4x4 modelview matrix
+        projection: 4x4 projection matrix
+        viewport: (x, y, width, height)
+
+    Returns:
+        Object-space points, shape (N, 3)
+
+    Raises:
+        numpy.linalg.LinAlgError: If the combined matrix is singular
+    """
+    window = np.asarray(window, dtype=np.float64).reshape(-1, 3)
+    vp_x, vp_y, vp_w, vp_h = viewport
+
+    ndc = np.empty((len(window), 4))
+    ndc[:, 0] = (window[:, 0] - vp_x) / vp_w * 2.0 - 1.0
+    ndc[:, 1] = (window[:, 1] - vp_y) / vp_h * 2.0 - 1.0
+    ndc[:, 2] = window[:, 2] * 2.0 - 1.0
+    ndc[:, 3] = 1.0
+
+    obj = ndc @ np.linalg.inv(projection @ modelview).T
+    return obj[:, :3] / obj[:, 3:4]
+
+
+def ray_segment_distances(origin, direction, starts, ends):
+    """
+    Closest approach between a ray and each of a batch of segments.
+
+    Args:
+        origin: Ray origin, shape (3,)
+        direction: Ray direction, shape (3,), need not be normalized
+        starts: Segment start points, shape (N, 3)
+        ends: Segment end points, shape (N, 3)
+
+    Returns:
+        (distances, ray_params, segment_params): the closest distance per
+        segment, the ray parameter (in units of direction) and the segment
+        parameter (0 at start, 1 at end) of the closest points
+    """
+    origin = np.asarray(origin, dtype=np.float64)
+    direction = np.asarray(direction, dtype=np.float64)
+    starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+    edges = np.asarray(ends, dtype=np.float64).reshape(-1, 3) - starts
+    offsets = origin - starts
+
+    # Minimize |offset + s * direction - t * edge| over s >= 0, 0 <= t <= 1
+    dd = direction @ direction
+    de = edges @ direction
+    ee = np.einsum('ij,ij->i', edges, edges)
+    d_off = offsets @ direction
+    e_off = np.einsum('ij,ij->i', edges, offsets)
+
+    denom = dd * ee - de * de
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Parallel (or degenerate) segments start from their start point
+        t = np.where(denom > 1e-12 * dd * ee, (dd * e_off - de * d_off) / denom, 0.0)
+        t = np.clip(t, 0.0, 1.0)
+        s = np.maximum((t * de - d_off) / dd, 0.0)
+        t = np.clip(np.where(ee > 0.0, (s * de + e_off) / ee, 0.0), 0.0, 1.0)
+
+    gaps = offsets + s[:, None] * direction - t[:, None] * edges
+    return np.linalg.norm(gaps, axis=1), s, t
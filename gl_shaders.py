@@ -0,0 +1,123 @@
+"""
+GLSL programs used by the OpenGL viewport.
+
+Shaders target GLSL 1.20 so they run in the OpenGL 2.1 compatibility
+context requested in main.py. The scene lights are uniforms of the mesh
+program; fixed-function lighting is not used.
+"""
+
+from OpenGL.GL import *
+
+# Generic attribute locations shared by every program
+ATTRIB_POSITION = 0
+ATTRIB_NORMAL = 1
+
+# Blinn-Phong lighting from three directional lights given in eye space
+# (unit vectors pointing towards the light). GLSL 1.20 has no flat
+# interpolation qualifier, so the color is computed per vertex and written
+# to gl_FrontColor, where glShadeModel(GL_FLAT) makes every primitive take
+# the color of its provoking vertex.
+MESH_VERTEX_SHADER = """
+#version 120
+
+attribute vec3 aPos;
+attribute vec3 aNormal;
+
+uniform mat4 uMVP;
+uniform mat3 uNormalMat;
+uniform vec4 uColor;
+uniform vec4 uAmbient;
+uniform vec4 uSpecular;
+uniform float uShininess;
+
+uniform vec3 uLightAmbient;
+uniform vec3 uLightDir[3];
+uniform vec3 uLightColor[3];
+uniform vec3 uLightSpecular[3];
+
+void main()
+{
+    vec3 normal = normalize(uNormalMat * aNormal);
+    vec3 color = uLightAmbient * uAmbient.rgb;
+
+    for (int i = 0; i < 3; i++) {
+        float diffuse = dot(normal, uLightDir[i]);
+        if (diffuse > 0.0) {
+            color += diffuse * uLightColor[i] * uColor.rgb;
+            vec3 half_vector = normalize(uLightDir[i] + vec3(0.0, 0.0, 1.0));
+            float specular = max(dot(normal, half_vector), 0.0);
+            color += pow(specular, uShininess) * uLightSpecular[i] * uSpecular.rgb;
+        }
+    }
+
+    gl_FrontColor = vec4(clamp(color, 0.0, 1.0), uColor.a);
+    gl_BackColor = gl_FrontColor;
+    gl_Position = uMVP * vec4(aPos, 1.0);
+}
+"""
+
+MESH_FRAGMENT_SHADER = """
+#version 120
+
+void main()
+{
+    gl_FragColor = gl_Color;
+}
+"""
+
+
+def compile_program(vertex_source, fragment_source, attributes):
+    """
+    Compile and link a shader program.
+
+    Must be called with the GL context current.
+
+    Args:
+        vertex_source: GLSL vertex shader source
+        fragment_source: GLSL fragment shader source
+        attributes: Dict mapping attribute names to the locations to bind
+
+    Returns:
+        Program object id
+
+    Raises:
+        RuntimeError: If a shader fails to compile or the program fails to link
+    """
+    shaders = []
+    for shader_type, source in ((GL_VERTEX_SHADER, vertex_source),
+                                (GL_FRAGMENT_SHADER, fragment_source)):
+        shader = glCreateShader(shader_type)
+        glShaderSource(shader, source)
+        glCompileShader(shader)
+        if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+            log = glGetShaderInfoLog(shader)
+            glDeleteShader(shader)
+            raise RuntimeError(f"Shader compilation failed: {_decode(log)}")
+        shaders.append(shader)
+
+    program = glCreateProgram()
+    for shader in shaders:
+        glAttachShader(program, shader)
+    for name, location in attributes.items():
+        glBindAttribLocation(program, location, name)
+    glLinkProgram(program)
+
+    # The program keeps the compiled code; the shader objects can go
+    for shader in shaders:
+        glDetachShader(program, shader)
+        glDeleteShader(shader)
+
+    if not glGetProgramiv(program, GL_LINK_STATUS):
+        log = glGetProgramInfoLog(program)
+        glDeleteProgram(program)
+        raise RuntimeError(f"Shader program link failed: {_decode(log)}")
+    return program
+
+
+def uniform_locations(program, names):
+    """Look up the locations of a program's uniforms by name."""
+    return {name: glGetUniformLocation(program, name) for name in names}
+
+
+def _decode(log):
+    return log.decode(errors='replace') if isinstance(log, bytes) else str(log)
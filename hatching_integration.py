@@ -6,7 +6,7 @@ and contour formats, and to integrate hatching generation with the
 OpenGL visualization.
 """
 
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Iterator
 import numpy as np
 
 
@@ -298,8 +298,26 @@ def convert_hatching_to_obp_format(
     Returns:
         List of layer dictionaries in OBP format
     """
-    obp_layers = []
+    return list(iter_obp_layers(hatching_data, layer_thickness))
 
+
+def iter_obp_layers(
+    hatching_data: Dict[int, List['HatchLine']],
+    layer_thickness: float
+) -> Iterator[Dict[str, Any]]:
+    """
+    Convert hatching data to OBP format one layer at a time.
+
+    Lets writers handle each layer before the next one is built, so only
+    one layer's OBP data is held in memory.
+
+    Args:
+        hatching_data: Dictionary mapping layer_index -> HatchLine list
+        layer_thickness: Layer thickness in mm
+
+    Yields:
+        Layer dictionaries in OBP format, in layer order
+    """
     for layer_idx in sorted(hatching_data.keys()):
         hatch_lines = hatching_data[layer_idx]
 
@@ -334,9 +352,38 @@ def convert_hatching_to_obp_format(
                 'power': line.power if line.power else 1.0
             })
 
-        obp_layers.append(layer_data)
+        yield layer_data
 
-    return obp_layers
+
+def hatch_line_arrays(hatch_lines: List['HatchLine']) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gather hatch lines into parallel arrays, one entry per line.
+
+    Args:
+        hatch_lines: List of HatchLines
+
+    Returns:
+        Tuple of (segments, is_contour, speeds): float64 (N, 4) array of
+        (x1, y1, x2, y2), bool (N,) array, and float64 (N,) array of scan
+        speeds with 0 where a line has none
+    """
+    segments = np.array([(*line.start, *line.end) for line in hatch_lines],
+                        dtype=np.float64).reshape(-1, 4)
+    is_contour = np.array([line.is_contour for line in hatch_lines], dtype=bool)
+    speeds = np.array([line.speed or 0.0 for line in hatch_lines], dtype=np.float64)
+    return segments, is_contour, speeds
+
+
+def _line_lengths(segments: np.ndarray) -> np.ndarray:
+    """Length of each (x1, y1, x2, y2) segment."""
+    return np.hypot(segments[:, 2] - segments[:, 0], segments[:, 3] - segments[:, 1])
+
+
+def _build_time(lengths: np.ndarray, speeds: np.ndarray) -> float:
+    """Total scan time in seconds of lines with the given lengths and speeds."""
+    # Lines without a positive speed don't count towards the time
+    scanned = speeds > 0
+    return float(np.sum(lengths[scanned] / speeds[scanned]))
 
 
 def estimate_build_time(hatching_data: Dict[int, List['HatchLine']]) -> float:
@@ -349,16 +396,9 @@ def estimate_build_time(hatching_data: Dict[int, List['HatchLine']]) -> float:
     Returns:
         Estimated build time in seconds
     """
-    total_time = 0.0
-
-    for layer_idx, hatch_lines in hatching_data.items():
-        for line in hatch_lines:
-            if line.speed and line.speed > 0:
-                distance = line.length()
-                time = distance / line.speed  # seconds
-                total_time += time
-
-    return total_time
+    lines = [line for hatch_lines in hatching_data.values() for line in hatch_lines]
+    segments, _, speeds = hatch_line_arrays(lines)
+    return _build_time(_line_lengths(segments), speeds)
 
 
 def get_hatching_statistics(hatching_data: Dict[int, List['HatchLine']]) -> Dict[str, Any]:
@@ -371,35 +411,26 @@ def get_hatching_statistics(hatching_data: Dict[int, List['HatchLine']]) -> Dict
     Returns:
         Dictionary with statistics
     """
-    total_lines = 0
-    total_contour_lines = 0
-    total_infill_lines = 0
-    total_scan_length = 0.0
-    total_contour_length = 0.0
-    total_infill_length = 0.0
-
-    for layer_idx, hatch_lines in hatching_data.items():
-        for line in hatch_lines:
-            length = line.length()
-            total_lines += 1
-            total_scan_length += length
-
-            if line.is_contour:
-                total_contour_lines += 1
-                total_contour_length += length
-            else:
-                total_infill_lines += 1
-                total_infill_length += length
+    # Gather every line once, then total them with array operations
+    lines = [line for hatch_lines in hatching_data.values() for line in hatch_lines]
+    segments, is_contour, speeds = hatch_line_arrays(lines)
+    lengths = _line_lengths(segments)
+
+    total_lines = len(lines)
+    total_contour_lines = int(np.count_nonzero(is_contour))
+    total_infill_lines = total_lines - total_contour_lines
+    total_contour_length = float(np.sum(lengths[is_contour]))
+    total_infill_length = float(np.sum(lengths[~is_contour]))
 
     stats = {
         'total_layers': len(hatching_data),
         'total_lines': total_lines,
         'contour_lines': total_contour_lines,
         'infill_lines': total_infill_lines,
-        'total_scan_length_mm': total_scan_length,
+        'total_scan_length_mm': float(np.sum(lengths)),
         'contour_length_mm': total_contour_length,
         'infill_length_mm': total_infill_length,
-        'estimated_time_seconds': estimate_build_time(hatching_data),
+        'estimated_time_seconds': _build_time(lengths, speeds),
         'avg_lines_per_layer': total_lines / len(hatching_data) if hatching_data else 0
     }
 
@@ -1,15 +1,60 @@
+import collections
+import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from PyQt6 import QtWidgets, uic
-from PyQt6.QtWidgets import QFileDialog, QMessageBox, QProgressDialog
+from PyQt6.QtWidgets import QButtonGroup, QFileDialog, QMessageBox, QProgressDialog, QTreeWidgetItem
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget as QtOpenGLWidget
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
+from PyQt6.QtGui import QAction, QSurfaceFormat
 
-# Import our custom OpenGL widget
-from opengl_widget import OpenGLWidget
-from transform_dialog import TransformDialog
+# OpenGLWidget (OpenGL/OpenCASCADE bindings), TransformDialog and
+# HatchingDialog are imported where they are first needed to keep module
+# import cheap
 from workers import CADLoadWorker, SlicingWorker, HatchingWorker
-from constants import DEFAULT_LAYER_THICKNESS_STR
+from constants import (
+    DEFAULT_LAYER_THICKNESS_STR, SUPPORTED_CAD_FORMATS,
+    TRANSFORM_DIALOG_MARGIN_RIGHT, TRANSFORM_DIALOG_MARGIN_TOP
+)
+from hatching import HatchingParameters, HatchingStrategy
+
+if TYPE_CHECKING:
+    from transform_dialog import TransformDialog
+
+# Transform modes in transform dialog tab order; also the button group ids
+TRANSFORM_MODES = ('move', 'scale', 'rotate')
+
+# Tree item data role holding the stable model id (Qt.UserRole)
+MODEL_ID_ROLE = Qt.ItemDataRole.UserRole
+
+# Slicing results kept for unchanged models, see on_slicing_requested
+SLICE_CACHE_SIZE = 16
+
+logger = logging.getLogger(__name__)
+
+
+def configure_logging(level=logging.INFO) -> logging.handlers.QueueListener:
+    """
+    Route log records through a queue so console IO happens off the GUI thread.
+
+    Returns:
+        The started QueueListener; call stop() on shutdown to flush it
+    """
+    log_queue = queue.SimpleQueue()
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    listener.start()
+    return listener
+
 
 class MainWindow(QtWidgets.QMainWindow):
     def __init__(self):
@@ -21,16 +66,53 @@ class MainWindow(QtWidgets.QMainWindow):
         self.setup_opengl_widget()
 
         # Create transform dialog (hidden by default)
-        self.transform_dialog: Optional[TransformDialog] = None
+        self.transform_dialog: Optional['TransformDialog'] = None
+        # Window frame size around the dialog, measured on first show
+        self._transform_dialog_frame_margin = None
+
+        # Layer thickness the current slices were made with (mm)
+        self._current_layer_thickness: Optional[float] = None
+
+        # Slicing results per model, least recently used first:
+        # _slice_cache_key -> sections
+        self._slice_cache = collections.OrderedDict()
+        # Cache keys of the models the running slicing job was started for
+        self._slicing_keys = []
 
         # Create hatching dialog (hidden by default)
         self.hatching_dialog = None
 
-        # Worker threads for async operations
+        # Statistics for the last hatching result, as (hatching_data, stats).
+        # The data object itself is kept so identity can't be reused after GC.
+        self._stats_cache: Optional[tuple] = None
+
+        # Coalesce bursts of dialog edits into one parameter push
+        self._param_push_timer = QTimer(self)
+        self._param_push_timer.setSingleShot(True)
+        self._param_push_timer.setInterval(150)
+        self._param_push_timer.timeout.connect(self._flush_hatching_params)
+
+        # Background jobs run on the global thread pool, which keeps its
+        # threads warm between operations. The runnables are kept here so
+        # they can be cancelled and their signal objects stay alive.
+        self.thread_pool = QThreadPool.globalInstance()
+        self._cad_loading = False
         self.cad_load_worker: Optional[CADLoadWorker] = None
         self.slicing_worker: Optional[SlicingWorker] = None
         self.hatching_worker: Optional[HatchingWorker] = None
-        self.progress_dialog: Optional[QProgressDialog] = None
+
+        # Single progress dialog reused by every async operation
+        self.progress_dialog = QProgressDialog("", "Cancel", 0, 0, self)
+        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress_dialog.setAutoClose(False)
+        self.progress_dialog.setAutoReset(False)
+        self.progress_dialog.reset()
+        self.progress_dialog.hide()
+        self._progress_cancel_slot = None
+
+        # Stable model id per tree item, keyed by id(item) since QTreeWidgetItem
+        # is unhashable. Mirrors the MODEL_ID_ROLE data without a Qt call.
+        self._item_to_model_id: dict[int, int] = {}
 
         # Add hatching menu
         self.add_hatching_menu()
@@ -43,11 +125,18 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # Maximize the window
         self.showMaximized()
+
+        # Build the transform dialog once the event loop is idle so the
+        # first transform mode toggle doesn't pay for its construction
+        QTimer.singleShot(0, self._prewarm_transform_dialog)
+
+    def _prewarm_transform_dialog(self):
+        """Create the (hidden) transform dialog ahead of first use."""
+        if self.transform_dialog is None:
+            self.create_transform_dialog('move')
     
     def add_hatching_menu(self):
         """Add hatching menu to the menu bar."""
-        from PyQt6.QtGui import QAction
-
         # Create Tools menu if it doesn't exist
         menubar = self.menuBar()
         tools_menu = menubar.addMenu("&Tools")
@@ -71,6 +160,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def setup_opengl_widget(self):
         """Replace the default OpenGL widget with our custom implementation"""
+        from opengl_widget import OpenGLWidget
+
         # Find the existing openGLWidget in the UI
         old_widget = self.findChild(QtOpenGLWidget, 'openGLWidget')
 
@@ -90,10 +181,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 old_widget.deleteLater()
 
                 # Set the new widget as our openGLWidget attribute
+                # (showMaximized() realizes and sizes it along with the window)
                 self.openGLWidget = new_opengl_widget
-
-                # Make sure the new widget is properly initialized
-                new_opengl_widget.show()
     
     def connect_signals(self):
         """Connect UI signals to their respective slots"""
@@ -106,7 +195,11 @@ class MainWindow(QtWidgets.QMainWindow):
         # Connect remove button
         self.pb_removeCADFile.clicked.connect(self.remove_selected_model)
 
-        # Connect view mode buttons
+        # Connect view mode buttons; the exclusive group keeps exactly one checked
+        self._view_group = QButtonGroup(self)
+        self._view_group.setExclusive(True)
+        self._view_group.addButton(self.pb_layoutmode)
+        self._view_group.addButton(self.pb_slicemode)
         self.pb_layoutmode.toggled.connect(self.on_layout_mode_toggled)
         self.pb_slicemode.toggled.connect(self.on_slice_mode_toggled)
 
@@ -114,14 +207,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.le_layerthickness.setText(DEFAULT_LAYER_THICKNESS_STR)
         self.le_layerthickness.editingFinished.connect(self.on_layer_thickness_changed)
 
-        # Connect transformation mode buttons
-        self.pbt_movemode.toggled.connect(self.on_move_mode_toggled)
-        self.pbt_rotatemode.toggled.connect(self.on_rotate_mode_toggled)
-        self.pbt_scalemode.toggled.connect(self.on_scale_mode_toggled)
+        # Connect transformation mode buttons. The group handles mutual
+        # exclusion; idClicked only fires for user clicks, so programmatic
+        # setChecked() calls never re-enter the handler.
+        self._transform_group = QButtonGroup(self)
+        self._transform_group.setExclusive(True)
+        self._transform_group.addButton(self.pbt_movemode, TRANSFORM_MODES.index('move'))
+        self._transform_group.addButton(self.pbt_scalemode, TRANSFORM_MODES.index('scale'))
+        self._transform_group.addButton(self.pbt_rotatemode, TRANSFORM_MODES.index('rotate'))
+        self._transform_group.idClicked.connect(self.on_transform_mode_clicked)
 
         # Connect tree widget selection to OpenGL widget
         self.modelTreeWidget.itemSelectionChanged.connect(self.on_model_selection_changed)
 
+        # Keep model buttons in step with the OpenGL widget's selection
+        self.openGLWidget.selection_changed.connect(self.update_button_states)
+
         # Connect OpenGL widget transformation changed signal
         self.openGLWidget.transformation_changed.connect(self.update_transform_dialog)
 
@@ -131,10 +232,8 @@ class MainWindow(QtWidgets.QMainWindow):
     
     def open_file(self):
         """Open a file dialog to select .step or .iges files and load them asynchronously"""
-        from constants import SUPPORTED_CAD_FORMATS
-
         # Don't allow loading while another file is loading
-        if self.cad_load_worker is not None and self.cad_load_worker.isRunning():
+        if self._cad_loading:
             QMessageBox.warning(self, "Loading in Progress",
                               "Please wait for the current file to finish loading.")
             return
@@ -152,37 +251,65 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def load_cad_file_async(self, file_path: str):
         """Load CAD file asynchronously using worker thread"""
-        # Create progress dialog
-        self.progress_dialog = QProgressDialog("Loading CAD file...", "Cancel", 0, 0, self)
-        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        self.progress_dialog.setAutoClose(True)
-        self.progress_dialog.setAutoReset(True)
-        self.progress_dialog.canceled.connect(self.cancel_loading)
+        logger.info("Loading CAD file: %s", file_path)
+
+        # Show progress dialog
+        self._begin_progress("Loading CAD file...", 0, self.cancel_loading)
 
-        # Create and start worker thread
+        # Create the job and hand it to the thread pool
         self.cad_load_worker = CADLoadWorker(file_path)
-        self.cad_load_worker.progress.connect(self.on_load_progress)
-        self.cad_load_worker.finished.connect(lambda model: self.on_load_finished(model, file_path))
-        self.cad_load_worker.error.connect(self.on_load_error)
-        self.cad_load_worker.start()
+        signals = self.cad_load_worker.signals
+        signals.progress.connect(self.on_load_progress)
+        signals.finished.connect(lambda model: self.on_load_finished(model, file_path))
+        signals.error.connect(self.on_load_error)
+        self._cad_loading = True
+        self.thread_pool.start(self.cad_load_worker)
+
+    def _is_current_job(self, worker) -> bool:
+        """Whether the signal being handled comes from the given job
+
+        Results of a job that was superseded by a newer request may still be
+        queued when it is cancelled; those are dropped.
+        """
+        return worker is not None and self.sender() is worker.signals
+
+    def _begin_progress(self, label: str, maximum: int, cancel_slot):
+        """Re-parameterize and show the shared progress dialog
 
+        Args:
+            label: Initial label text
+            maximum: Progress range maximum (0 for a busy indicator)
+            cancel_slot: Callable invoked when the user presses Cancel
+        """
+        # Only drop our own handler; the dialog wires canceled to its own
+        # cancel() slot internally and that connection must stay
+        if self._progress_cancel_slot is not None:
+            self.progress_dialog.canceled.disconnect(self._progress_cancel_slot)
+
+        self.progress_dialog.reset()
+        self.progress_dialog.setLabelText(label)
+        self.progress_dialog.setRange(0, maximum)
+        self.progress_dialog.setValue(0)
+        self.progress_dialog.canceled.connect(cancel_slot)
+        self._progress_cancel_slot = cancel_slot
         self.progress_dialog.show()
 
     def cancel_loading(self):
         """Cancel the current loading operation"""
-        if self.cad_load_worker and self.cad_load_worker.isRunning():
+        # The parse itself can't be interrupted; a cancelled job finishes in
+        # the background and its result is dropped
+        if self._cad_loading:
             self.cad_load_worker.cancel()
-            self.cad_load_worker.wait()
+            self._cad_loading = False
 
     def on_load_progress(self, stage: str, message: str):
         """Update progress dialog with loading progress"""
-        if self.progress_dialog:
-            self.progress_dialog.setLabelText(message)
+        self.progress_dialog.setLabelText(message)
 
     def on_load_finished(self, cad_model, file_path: str):
         """Handle CAD model loading completion"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
+        self._cad_loading = False
+        self.progress_dialog.hide()
 
         if cad_model is not None:
             # Add model to OpenGL widget
@@ -193,21 +320,19 @@ class MainWindow(QtWidgets.QMainWindow):
                 model_data = self.openGLWidget.models[model_index]
 
                 # Add to tree widget
-                from PyQt6.QtWidgets import QTreeWidgetItem
                 item = QTreeWidgetItem(self.modelTreeWidget)
                 item.setText(0, model_data['name'])
-                item.setData(0, 0x0100, model_index)  # Qt.UserRole = 0x0100
+                item.setData(0, MODEL_ID_ROLE, model_data['id'])
+                self._item_to_model_id[id(item)] = model_data['id']
 
-                # Select the newly added item
+                # Select the newly added item (button states follow the
+                # widget's selection_changed signal)
                 self.modelTreeWidget.setCurrentItem(item)
 
-                # Update button states
-                self.update_button_states()
-
     def on_load_error(self, error_message: str):
         """Handle CAD model loading error"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
+        self._cad_loading = False
+        self.progress_dialog.hide()
 
         QMessageBox.critical(self, "Loading Error",
                            f"Failed to load CAD file:\n{error_message}")
@@ -217,39 +342,73 @@ class MainWindow(QtWidgets.QMainWindow):
         if not models:
             return
 
-        # Create and show progress dialog
-        self.progress_dialog = QProgressDialog("Slicing models...", "Cancel", 0, 100, self)
-        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        self.progress_dialog.setAutoClose(True)
-        self.progress_dialog.setAutoReset(True)
-        self.progress_dialog.canceled.connect(self.cancel_slicing)
+        # A new request (e.g. a thickness change) supersedes a running job
+        self.cancel_slicing()
+
+        # Toggling the view or returning to an earlier thickness often asks
+        # for slices that were already made; reuse them if every model hits
+        keys = [self._slice_cache_key(model_data, layer_thickness) for model_data in models]
+        if all(key in self._slice_cache for key in keys):
+            for key in keys:
+                self._slice_cache.move_to_end(key)
+            # Drop any result the cancelled job has already queued
+            self.slicing_worker = None
+            self.openGLWidget.set_sliced_layers([self._slice_cache[key] for key in keys])
+            return
+        self._slicing_keys = keys
+
+        # Show progress dialog
+        self._begin_progress("Slicing models...", 100, self.cancel_slicing)
 
-        # Create and start worker thread
+        # Create the job and hand it to the thread pool
         self.slicing_worker = SlicingWorker(models, layer_thickness)
-        self.slicing_worker.progress.connect(self.on_slicing_progress)
-        self.slicing_worker.finished.connect(self.on_slicing_finished)
-        self.slicing_worker.error.connect(self.on_slicing_error)
-        self.slicing_worker.start()
+        signals = self.slicing_worker.signals
+        signals.progress.connect(self.on_slicing_progress)
+        signals.finished.connect(self.on_slicing_finished)
+        signals.error.connect(self.on_slicing_error)
+        self.thread_pool.start(self.slicing_worker)
+
+    @staticmethod
+    def _slice_cache_key(model_data, layer_thickness):
+        """Key for slicing results: the model and everything slicing it depends on
+
+        The transform arrays are updated in place, so they are copied by value.
+        """
+        return (model_data['id'], tuple(model_data['position']),
+                tuple(model_data['rotation']), tuple(model_data['scale']),
+                layer_thickness)
 
     def on_slicing_progress(self, current: int, total: int, message: str):
         """Update slicing progress"""
-        if self.progress_dialog:
-            self.progress_dialog.setMaximum(total)
-            self.progress_dialog.setValue(current)
-            self.progress_dialog.setLabelText(message)
+        if not self._is_current_job(self.slicing_worker):
+            return
+
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(current)
+        self.progress_dialog.setLabelText(message)
 
     def on_slicing_finished(self, sliced_layers):
         """Handle slicing completion"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
+        if not self._is_current_job(self.slicing_worker):
+            return
+
+        self.progress_dialog.hide()
+
+        for key, sections in zip(self._slicing_keys, sliced_layers):
+            self._slice_cache[key] = sections
+            self._slice_cache.move_to_end(key)
+        while len(self._slice_cache) > SLICE_CACHE_SIZE:
+            self._slice_cache.popitem(last=False)
 
         # Update OpenGL widget with sliced layers
         self.openGLWidget.set_sliced_layers(sliced_layers)
 
     def on_slicing_error(self, error_message: str):
         """Handle slicing error"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
+        if not self._is_current_job(self.slicing_worker):
+            return
+
+        self.progress_dialog.hide()
 
         QMessageBox.critical(self, "Slicing Error",
                            f"Failed to slice models:\n{error_message}")
@@ -264,47 +423,65 @@ class MainWindow(QtWidgets.QMainWindow):
         if not sliced_layers or not hatching_params:
             return
 
-        # Create and show progress dialog
-        self.progress_dialog = QProgressDialog("Generating hatching...", "Cancel", 0, 100, self)
-        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-        self.progress_dialog.setAutoClose(True)
-        self.progress_dialog.setAutoReset(True)
-        self.progress_dialog.canceled.connect(self.cancel_hatching)
+        # A new request (e.g. a parameter change) supersedes a running job.
+        # Not via cancel_hatching, which would also drop the new request
+        if self.hatching_worker:
+            self.hatching_worker.cancel()
+
+        # Show progress dialog
+        self._begin_progress("Generating hatching...", 100, self.cancel_hatching)
 
-        # Create and start worker thread
+        # Create the job and hand it to the thread pool
         self.hatching_worker = HatchingWorker(sliced_layers, hatching_params, hatching_strategy)
-        self.hatching_worker.progress.connect(self.on_hatching_progress)
-        self.hatching_worker.finished.connect(self.on_hatching_finished)
-        self.hatching_worker.error.connect(self.on_hatching_error)
-        self.hatching_worker.start()
+        signals = self.hatching_worker.signals
+        signals.progress.connect(self.on_hatching_progress)
+        signals.finished.connect(self.on_hatching_finished)
+        signals.error.connect(self.on_hatching_error)
+        self.thread_pool.start(self.hatching_worker)
 
     def on_hatching_progress(self, current: int, total: int, message: str):
         """Update hatching progress"""
-        if self.progress_dialog:
-            self.progress_dialog.setMaximum(total)
-            self.progress_dialog.setValue(current)
-            self.progress_dialog.setLabelText(message)
+        if not self._is_current_job(self.hatching_worker):
+            return
+
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(current)
+        self.progress_dialog.setLabelText(message)
 
     def on_hatching_finished(self, hatching_data):
         """Handle hatching generation completion"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
+        if not self._is_current_job(self.hatching_worker):
+            return
+
+        self.progress_dialog.hide()
 
         # Update OpenGL widget with hatching data
         self.openGLWidget.set_hatching_data(hatching_data)
 
         # Update statistics in dialog if visible
-        stats = self.openGLWidget.get_hatching_statistics()
+        stats = self.get_hatching_statistics(hatching_data)
         if stats and self.hatching_dialog:
             self.hatching_dialog.update_statistics(stats)
             # Show success message when explicitly requested from dialog
             QMessageBox.information(self, "Hatching Generated",
                                   f"Successfully generated hatching for {stats['total_layers']} layers.")
 
+    def get_hatching_statistics(self, hatching_data):
+        """Get statistics for a hatching result, reusing the last computation"""
+        if self._stats_cache is not None and self._stats_cache[0] is hatching_data:
+            return self._stats_cache[1]
+
+        stats = self.openGLWidget.get_hatching_statistics()
+        self._stats_cache = (hatching_data, stats)
+        return stats
+
     def on_hatching_error(self, error_message: str):
         """Handle hatching generation error"""
-        if self.progress_dialog:
-            self.progress_dialog.close()
+        if not self._is_current_job(self.hatching_worker):
+            return
+
+        self.progress_dialog.hide()
+        self.openGLWidget.discard_hatching_request()
 
         QMessageBox.critical(self, "Hatching Error",
                            f"Failed to generate hatching:\n{error_message}")
@@ -313,6 +490,10 @@ class MainWindow(QtWidgets.QMainWindow):
         """Cancel ongoing hatching operation"""
         if self.hatching_worker:
             self.hatching_worker.cancel()
+            # Drop results it may already have queued, and let the same
+            # parameters be requested again
+            self.hatching_worker = None
+            self.openGLWidget.discard_hatching_request()
 
     def remove_selected_model(self):
         """Remove the currently selected model"""
@@ -320,182 +501,154 @@ class MainWindow(QtWidgets.QMainWindow):
 
         if selected_items:
             item = selected_items[0]
-            model_index = item.data(0, 0x0100)  # Qt.UserRole
+            model_id = self._item_to_model_id.pop(id(item))
 
             # Remove from OpenGL widget
-            self.openGLWidget.remove_model(model_index)
+            self.openGLWidget.remove_model_by_id(model_id)
 
             # Remove from tree widget
             index = self.modelTreeWidget.indexOfTopLevelItem(item)
             self.modelTreeWidget.takeTopLevelItem(index)
 
-            # Update all remaining items' indices
-            for i in range(self.modelTreeWidget.topLevelItemCount()):
-                item = self.modelTreeWidget.topLevelItem(i)
-                item.setData(0, 0x0100, i)
-
-            # Update button states
-            self.update_button_states()
-
-    def update_button_states(self):
-        """Update enabled state of buttons based on current state"""
-        has_models = self.openGLWidget.models and len(self.openGLWidget.models) > 0
-        has_selection = self.openGLWidget.selected_model_index is not None
-
-        # Enable/disable buttons
-        self.pb_removeCADFile.setEnabled(has_selection)
-        self.pbt_movemode.setEnabled(has_selection)
-        self.pbt_rotatemode.setEnabled(has_selection)
-        self.pbt_scalemode.setEnabled(has_selection)
-
-    def on_move_mode_toggled(self, checked):
-        """Handle move mode toggle"""
-        self._handle_transform_mode_toggle('move', checked)
+    def update_button_states(self, has_selection: bool):
+        """Enable the model buttons only while a model is selected"""
+        for button in (self.pb_removeCADFile, self.pbt_movemode,
+                       self.pbt_rotatemode, self.pbt_scalemode):
+            button.setEnabled(has_selection)
 
-    def on_rotate_mode_toggled(self, checked):
-        """Handle rotate mode toggle"""
-        self._handle_transform_mode_toggle('rotate', checked)
-
-    def on_scale_mode_toggled(self, checked):
-        """Handle scale mode toggle"""
-        self._handle_transform_mode_toggle('scale', checked)
-
-    def _handle_transform_mode_toggle(self, mode: str, checked: bool):
+    def on_transform_mode_clicked(self, button_id: int):
         """
-        Generic handler for transform mode toggles.
+        Handle a click on one of the transform mode buttons.
 
         Args:
-            mode: Transform mode ('move', 'rotate', or 'scale')
-            checked: Whether the button is checked
+            button_id: Id of the clicked button in the transform group
         """
-        # Map of modes to their buttons
-        mode_buttons = {
-            'move': self.pbt_movemode,
-            'rotate': self.pbt_rotatemode,
-            'scale': self.pbt_scalemode
-        }
+        mode = TRANSFORM_MODES[button_id]
 
-        if checked:
-            # Uncheck other modes
-            for other_mode, button in mode_buttons.items():
-                if other_mode != mode:
-                    button.setChecked(False)
+        if self.openGLWidget.transform_mode == mode:
+            # Clicking the active mode switches it off. An exclusive group
+            # won't uncheck its checked button, so lift exclusivity briefly.
+            self._transform_group.setExclusive(False)
+            self._transform_group.button(button_id).setChecked(False)
+            self._transform_group.setExclusive(True)
 
+            self.openGLWidget.set_transform_mode(None)
+            self.hide_transform_dialog()
+        else:
             # Set OpenGL widget to the selected mode
             self.openGLWidget.set_transform_mode(mode)
 
             # Show transform dialog
             self.show_transform_dialog(mode)
-        else:
-            # Check if any other mode is still checked
-            any_mode_checked = any(
-                button.isChecked()
-                for other_mode, button in mode_buttons.items()
-                if other_mode != mode
-            )
-
-            if not any_mode_checked:
-                self.openGLWidget.set_transform_mode(None)
-                self.hide_transform_dialog()
 
     def on_layout_mode_toggled(self, checked):
         """Handle layout mode toggle"""
         if checked:
-            # Uncheck slice mode
-            self.pb_slicemode.blockSignals(True)
-            self.pb_slicemode.setChecked(False)
-            self.pb_slicemode.blockSignals(False)
-
             # Set OpenGL widget to layout mode
             self.openGLWidget.set_view_mode('layout')
-        else:
-            # Don't allow unchecking if slice mode isn't checked
-            if not self.pb_slicemode.isChecked():
-                self.pb_layoutmode.blockSignals(True)
-                self.pb_layoutmode.setChecked(True)
-                self.pb_layoutmode.blockSignals(False)
 
     def on_slice_mode_toggled(self, checked):
         """Handle slice mode toggle"""
         if checked:
-            # Uncheck layout mode
-            self.pb_layoutmode.blockSignals(True)
-            self.pb_layoutmode.setChecked(False)
-            self.pb_layoutmode.blockSignals(False)
-
-            # Get layer thickness
-            try:
-                layer_thickness = float(self.le_layerthickness.text())
-            except ValueError:
-                layer_thickness = 0.2  # Default
-            # Set OpenGL widget to slice mode
+            layer_thickness = self._read_layer_thickness()
+            if layer_thickness is None:
+                # Don't slice with a guessed thickness; stay in layout mode
+                self.pb_layoutmode.setChecked(True)
+                return
+
+            # Switching to layout drops the slices, so entering slice mode
+            # always slices even if the thickness is unchanged
+            self._current_layer_thickness = layer_thickness
             self.openGLWidget.set_view_mode('slice', layer_thickness)
-        else:
-            # Don't allow unchecking if layout mode isn't checked
-            if not self.pb_layoutmode.isChecked():
-                self.pb_slicemode.blockSignals(True)
-                self.pb_slicemode.setChecked(True)
-                self.pb_slicemode.blockSignals(False)
 
     def on_layer_thickness_changed(self):
         """Handle layer thickness change"""
         # If in slice mode, update the slicing
         if self.pb_slicemode.isChecked():
-            try:
-                layer_thickness = float(self.le_layerthickness.text())
-                self.openGLWidget.update_slice_thickness(layer_thickness)
-            except ValueError:
-                pass  # Invalid input, ignore
+            layer_thickness = self._read_layer_thickness()
+            if layer_thickness is None or layer_thickness == self._current_layer_thickness:
+                # Invalid, or editing finished without a new value
+                return
+
+            self._current_layer_thickness = layer_thickness
+            self.openGLWidget.update_slice_thickness(layer_thickness)
+
+    def _read_layer_thickness(self) -> Optional[float]:
+        """
+        Parse the layer thickness field.
+
+        Returns:
+            Thickness in mm, or None (after warning the user) if the field
+            does not hold a positive number
+        """
+        text = self.le_layerthickness.text()
+        try:
+            layer_thickness = float(text)
+        except ValueError:
+            layer_thickness = None
+
+        if layer_thickness is None or not layer_thickness > 0:
+            QMessageBox.warning(self, "Invalid Layer Thickness",
+                              f"'{text}' is not a valid layer thickness.\n"
+                              "Enter a positive value in mm.")
+            return None
+        return layer_thickness
+
+    def create_transform_dialog(self, mode):
+        """Construct the transform dialog and connect its signals"""
+        from transform_dialog import TransformDialog
+
+        self.transform_dialog = TransformDialog(self, mode)
+        self.transform_dialog.set_opengl_widget(self.openGLWidget)
+
+        # Connect signals
+        self.transform_dialog.position_changed.connect(self.on_dialog_position_changed)
+        self.transform_dialog.scale_changed.connect(self.on_dialog_scale_changed)
+        self.transform_dialog.rotation_changed.connect(self.on_dialog_rotation_changed)
+        self.transform_dialog.align_face_requested.connect(self.on_align_face_requested)
+
+        # Connect tab change signal to update toolbar buttons
+        self.transform_dialog.tab_widget.currentChanged.connect(self.on_transform_tab_changed)
 
     def show_transform_dialog(self, mode):
         """Show the transform dialog for the given mode"""
         if self.transform_dialog is None:
-            self.transform_dialog = TransformDialog(self, mode)
-            self.transform_dialog.set_opengl_widget(self.openGLWidget)
-
-            # Connect signals
-            self.transform_dialog.position_changed.connect(self.on_dialog_position_changed)
-            self.transform_dialog.scale_changed.connect(self.on_dialog_scale_changed)
-            self.transform_dialog.rotation_changed.connect(self.on_dialog_rotation_changed)
-            self.transform_dialog.align_face_requested.connect(self.on_align_face_requested)
-
-            # Connect tab change signal to update toolbar buttons
-            self.transform_dialog.tab_widget.currentChanged.connect(self.on_transform_tab_changed)
+            self.create_transform_dialog(mode)
 
         # Update dialog with current model values
-        if self.openGLWidget.selected_model_index is not None:
-            model_data = self.openGLWidget.models[self.openGLWidget.selected_model_index]
+        model_data = self.openGLWidget.get_selected_model()
+        if model_data is not None:
             self.transform_dialog.update_from_model(model_data)
 
         # Set the correct tab
         self.transform_dialog.set_tab(mode)
 
+        # Place the dialog before showing it so it appears in its final spot
+        self.position_transform_dialog()
+
         # Show the dialog
         self.transform_dialog.show()
         self.transform_dialog.raise_()
 
-        # Position dialog after it's fully shown using QTimer
-        # This ensures the window manager has finished positioning it
-        from PyQt6.QtCore import QTimer
-        QTimer.singleShot(0, self.position_transform_dialog)
+        if self._transform_dialog_frame_margin is None:
+            # The window frame is only known once the dialog has been shown;
+            # cache it and correct the first placement
+            self._transform_dialog_frame_margin = (
+                self.transform_dialog.frameGeometry().size() - self.transform_dialog.geometry().size())
+            self.position_transform_dialog()
 
     def position_transform_dialog(self):
-        """Position the transform dialog to the right side of the screen"""
-        if self.transform_dialog is None or not self.transform_dialog.isVisible():
-            return
-
-        # Get the screen geometry
-        screen = self.screen()
-        screen_geo = screen.availableGeometry()
+        """Position the transform dialog at the right side of the screen"""
+        screen_geo = self.screen().availableGeometry()
 
-        # Get dialog size (should be calculated by now)
-        dialog_width = self.transform_dialog.frameGeometry().width()
-        dialog_height = self.transform_dialog.frameGeometry().height()
+        # Outer width = content size hint plus the (cached) window frame
+        dialog_width = self.transform_dialog.sizeHint().width()
+        if self._transform_dialog_frame_margin is not None:
+            dialog_width += self._transform_dialog_frame_margin.width()
 
         # Snap to right edge of screen with small margin
-        margin = 10
-        x_pos = screen_geo.right() - dialog_width - margin
-        y_pos = screen_geo.top() + 100  # 100 pixels from top
+        x_pos = screen_geo.right() - dialog_width - TRANSFORM_DIALOG_MARGIN_RIGHT
+        y_pos = screen_geo.top() + TRANSFORM_DIALOG_MARGIN_TOP
 
         self.transform_dialog.move(x_pos, y_pos)
 
@@ -506,23 +659,26 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def on_dialog_position_changed(self, x, y, z):
         """Handle position change from dialog"""
-        if self.openGLWidget.selected_model_index is not None:
-            model_data = self.openGLWidget.models[self.openGLWidget.selected_model_index]
-            model_data['position'] = [x, y, z]
+        model_data = self.openGLWidget.get_selected_model()
+        if model_data is not None:
+            model_data['position'][:] = (x, y, z)
+            self.openGLWidget.mark_transform_dirty(model_data)
             self.openGLWidget.update()
 
     def on_dialog_scale_changed(self, x, y, z):
         """Handle scale change from dialog"""
-        if self.openGLWidget.selected_model_index is not None:
-            model_data = self.openGLWidget.models[self.openGLWidget.selected_model_index]
-            model_data['scale'] = [x, y, z]
+        model_data = self.openGLWidget.get_selected_model()
+        if model_data is not None:
+            model_data['scale'][:] = (x, y, z)
+            self.openGLWidget.mark_transform_dirty(model_data)
             self.openGLWidget.update()
 
     def on_dialog_rotation_changed(self, x, y, z):
         """Handle rotation change from dialog"""
-        if self.openGLWidget.selected_model_index is not None:
-            model_data = self.openGLWidget.models[self.openGLWidget.selected_model_index]
-            model_data['rotation'] = [x, y, z]
+        model_data = self.openGLWidget.get_selected_model()
+        if model_data is not None:
+            model_data['rotation'][:] = (x, y, z)
+            self.openGLWidget.mark_transform_dirty(model_data)
             self.openGLWidget.update()
 
     def on_align_face_requested(self):
@@ -541,57 +697,38 @@ class MainWindow(QtWidgets.QMainWindow):
     def update_transform_dialog(self):
         """Update transform dialog with current model values"""
         if self.transform_dialog is not None and self.transform_dialog.isVisible():
-            if self.openGLWidget.selected_model_index is not None:
-                model_data = self.openGLWidget.models[self.openGLWidget.selected_model_index]
+            model_data = self.openGLWidget.get_selected_model()
+            if model_data is not None:
                 self.transform_dialog.update_from_model(model_data)
 
     def on_transform_tab_changed(self, index):
         """Handle transform dialog tab changes to update toolbar button states"""
-        # Map tab index to mode
-        modes = ['move', 'scale', 'rotate']
-        if 0 <= index < len(modes):
-            mode = modes[index]
-
-            # Block signals to prevent recursive toggling
-            self.pbt_movemode.blockSignals(True)
-            self.pbt_scalemode.blockSignals(True)
-            self.pbt_rotatemode.blockSignals(True)
-
-            # Update toolbar button states
-            self.pbt_movemode.setChecked(mode == 'move')
-            self.pbt_scalemode.setChecked(mode == 'scale')
-            self.pbt_rotatemode.setChecked(mode == 'rotate')
-
-            # Unblock signals
-            self.pbt_movemode.blockSignals(False)
-            self.pbt_scalemode.blockSignals(False)
-            self.pbt_rotatemode.blockSignals(False)
+        # Tab order matches the transform group ids
+        if 0 <= index < len(TRANSFORM_MODES):
+            # Programmatic check; the group unchecks the others and idClicked
+            # isn't emitted, so nothing re-enters
+            self._transform_group.button(index).setChecked(True)
 
             # Update OpenGL widget transform mode
-            self.openGLWidget.set_transform_mode(mode)
+            self.openGLWidget.set_transform_mode(TRANSFORM_MODES[index])
 
     def on_model_selection_changed(self):
         """Handle model selection changes in the tree widget"""
         selected_items = self.modelTreeWidget.selectedItems()
 
         if selected_items:
-            # Get the model index from the selected item
+            # Get the model id from the selected item
             item = selected_items[0]
-            model_index = item.data(0, 0x0100)  # Qt.UserRole
+            model_id = self._item_to_model_id.get(id(item))
 
             # Update the OpenGL widget selection
-            self.openGLWidget.set_selected_model(model_index)
+            self.openGLWidget.set_selected_model_by_id(model_id)
         else:
             # No selection
             self.openGLWidget.set_selected_model(None)
 
-        # Update button states
-        self.update_button_states()
-
     def initialize_hatching(self):
         """Initialize hatching with default parameters."""
-        from hatching import HatchingParameters, HatchingStrategy
-
         # Set default parameters
         default_params = HatchingParameters()
         self.openGLWidget.set_hatching_parameters(default_params, HatchingStrategy.LINES)
@@ -599,6 +736,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def show_hatching_dialog(self):
         """Show the hatching parameters dialog."""
         if self.hatching_dialog is None:
+            # Only paid the first time the dialog is opened
             from hatching_dialog import HatchingDialog
 
             self.hatching_dialog = HatchingDialog(self)
@@ -620,10 +758,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.hatching_dialog.activateWindow()
 
     def on_hatching_parameters_changed(self):
-        """Handle hatching parameter changes."""
+        """Handle hatching parameter changes (debounced until editing pauses)."""
+        self._param_push_timer.start()
+
+    def _flush_hatching_params(self, force=False):
+        """Push the dialog's current hatching parameters to the OpenGL widget.
+
+        Args:
+            force: Regenerate hatching even if the parameters are unchanged
+        """
+        self._param_push_timer.stop()
         if self.hatching_dialog:
             params, strategy = self.hatching_dialog.get_parameters()
-            self.openGLWidget.set_hatching_parameters(params, strategy)
+            self.openGLWidget.set_hatching_parameters(params, strategy, force=force)
 
     def on_generate_hatching(self):
         """Generate hatching for current model."""
@@ -636,14 +783,13 @@ class MainWindow(QtWidgets.QMainWindow):
                               "Please switch to slice mode before generating hatching.")
             return
 
-        # Update parameters from dialog
-        if self.hatching_dialog:
-            params, strategy = self.hatching_dialog.get_parameters()
-            self.openGLWidget.set_hatching_parameters(params, strategy)
-
-        # Enable hatching and request async generation
+        # Enable hatching first, so pushing the dialog's parameters (including
+        # any still-pending edit) requests the async generation
         self.openGLWidget.enable_hatching(True)
-        self.openGLWidget.request_hatching_generation()
+        if self.hatching_dialog:
+            self._flush_hatching_params(force=True)
+        else:
+            self.openGLWidget.request_hatching_generation()
 
         # Note: Success message and statistics update will happen in on_hatching_finished
 
@@ -676,7 +822,22 @@ class MainWindow(QtWidgets.QMainWindow):
                                "Failed to export hatching data.")
 
 if __name__ == '__main__':
+    # Request the GL surface explicitly before QApplication exists so every
+    # context is created with it. The renderer uses the fixed-function
+    # pipeline, so this must be a compatibility profile (2.1 is also the
+    # newest legacy context macOS provides).
+    surface_format = QSurfaceFormat()
+    surface_format.setVersion(2, 1)
+    surface_format.setProfile(QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile)
+    surface_format.setDepthBufferSize(24)
+    surface_format.setSwapInterval(1)
+    QSurfaceFormat.setDefaultFormat(surface_format)
+
+    log_listener = configure_logging()
+
     app = QtWidgets.QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    exit_code = app.exec()
+    log_listener.stop()
+    sys.exit(exit_code)
\ No newline at end of file
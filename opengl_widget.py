@@ -1,19 +1,116 @@
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
-from PyQt6.QtGui import QOpenGLContext, QSurfaceFormat, QPainter, QFont, QColor, QFontMetrics
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QOpenGLContext, QSurfaceFormat, QPainter, QFont, QColor, QFontMetrics, QImage, QPixmap
+from PyQt6.QtCore import Qt, QRectF, QTimer, pyqtSignal
 from OpenGL.GL import *
 from OpenGL.GLU import *
+import ctypes
+import dataclasses
+import functools
+import itertools
+import logging
+import math
 import sys
 import numpy as np
-from cad_loader import load_cad_file, CADModel
+from gl_math import (
+    gl_matrix,
+    ortho_matrix,
+    perspective_matrix,
+    pick_matrix,
+    project_points,
+    ray_segment_distances,
+    rotation_matrix,
+    scale_matrix,
+    translation_matrix,
+    unproject_points,
+)
+from gl_shaders import (
+    ATTRIB_NORMAL,
+    ATTRIB_POSITION,
+    MESH_FRAGMENT_SHADER,
+    MESH_VERTEX_SHADER,
+    compile_program,
+    uniform_locations,
+)
+
+logger = logging.getLogger(__name__)
+
+# (origin, unit tip) of each world axis, for projecting axis directions
+AXIS_UNIT_SEGMENTS = {axis: np.array(((0.0, 0.0, 0.0), tip)) for axis, tip in zip('xyz', np.eye(3))}
+
+
+@functools.lru_cache(maxsize=None)
+def unit_circle(segments):
+    """
+    cos/sin table of a circle split into segments, computed once per count.
+
+    Returns:
+        Read-only array (segments + 1, 2) of (cos, sin); the last row
+        repeats the first to close the circle
+    """
+    angles = np.arange(segments + 1) / segments * 2.0 * np.pi
+    table = np.column_stack((np.cos(angles), np.sin(angles)))
+    table[-1] = table[0]
+    table.flags.writeable = False
+    return table
+
 
 class OpenGLWidget(QOpenGLWidget):
     # Build plate constants
     BUILD_PLATE_THICKNESS = 10.0  # mm
+    BUILD_PLATE_RADIUS = 50.0  # mm (100mm diameter)
+    BUILD_PLATE_SEGMENTS = 64  # Number of segments for smooth cylinder
     BUILD_PLATE_TOP_Y = BUILD_PLATE_THICKNESS / 2  # Top surface at Y = 5mm
 
+    # Half extent of the slice mode orthographic view (120mm x 120mm area;
+    # the build plate is 100mm diameter)
+    SLICE_VIEW_SIZE = 60.0  # mm
+
+    # Length of each orientation triad axis (normalized triad coordinates)
+    TRIAD_AXIS_LENGTH = 0.6
+
+    # Line segments per rotate gizmo ring
+    GIZMO_RING_SEGMENTS = 64
+    # Vertices per move/scale gizmo arrow: shaft line + 4 head triangles
+    GIZMO_ARROW_VERTICES = 2 + 4 * 3
+
+    # Gizmo drag per transform mode: (model_data key, change per pixel of
+    # mouse movement along the axis, minimum value or None)
+    GIZMO_DRAG = {
+        'move': ('position', 0.5, None),  # mm per pixel
+        'rotate': ('rotation', 1.0, None),  # degrees per pixel
+        'scale': ('scale', 0.01, 0.1),  # scale factor per pixel
+    }
+    AXIS_INDEX = {'x': 0, 'y': 1, 'z': 2}
+
+    # Minimum gizmo picking radius around the cursor, in framebuffer pixels
+    GIZMO_PICK_TOLERANCE = 4
+    # Mouse travel (pixels) below which the last gizmo hover pick is reused
+    HOVER_PICK_SLOP = 2
+    # Minimum time between repaints requested by mouse moves (~60 Hz)
+    REPAINT_INTERVAL_MS = 16
+
+    # Model materials as (ambient, diffuse, specular, shininess)
+    # Default gray for unselected models (darker for visibility)
+    MODEL_MATERIAL = ((0.2, 0.2, 0.2, 1.0), (0.45, 0.45, 0.48, 1.0), (0.25, 0.25, 0.25, 1.0), 20.0)
+    # Blue for the selected model (darker for better contrast)
+    SELECTED_MODEL_MATERIAL = ((0.15, 0.2, 0.35, 1.0), (0.2, 0.4, 0.8, 1.0), (0.3, 0.4, 0.6, 1.0), 30.0)
+    # Stainless steel for the build plate
+    BUILD_PLATE_MATERIAL = ((0.25, 0.25, 0.25, 1.0), (0.4, 0.4, 0.4, 1.0), (0.774597, 0.774597, 0.774597, 1.0), 76.8)
+
+    # Scene lighting for the mesh program: ambient color and three
+    # directional lights as (eye space direction towards the light,
+    # diffuse color, specular color) for even illumination
+    AMBIENT_LIGHT = (0.4, 0.4, 0.4)
+    LIGHTS = (
+        ((1.0, 1.0, 1.0), (0.6, 0.6, 0.6), (0.3, 0.3, 0.3)),  # Key light (top-front-right)
+        ((-1.0, 1.0, 1.0), (0.4, 0.4, 0.4), (0.1, 0.1, 0.1)),  # Fill light (top-front-left)
+        ((0.0, -0.5, -1.0), (0.3, 0.3, 0.3), (0.0, 0.0, 0.0)),  # Back light (below-back)
+    )
+
     # Signal emitted when model transformation changes via gizmo
     transformation_changed = pyqtSignal()
+    # Signal emitted with whether a model is selected after the selection changes
+    selection_changed = pyqtSignal(bool)
     # Signals for async operations
     slicing_requested = pyqtSignal(list, float)  # models, layer_thickness
     hatching_requested = pyqtSignal(list, object, object)  # sliced_layers, params, strategy
@@ -27,6 +124,8 @@ class OpenGLWidget(QOpenGLWidget):
         # Model management - support multiple models
         self.models = []  # List of loaded models (each with CADModel data, name, bounds, etc.)
         self.selected_model_index = None  # Index of currently selected model
+        self.models_by_id = {}  # Stable model id -> model data, survives removals
+        self._model_ids = itertools.count()
 
         # Transformation mode ('move', 'rotate', 'scale', or None)
         self.transform_mode = None
@@ -35,6 +134,8 @@ class OpenGLWidget(QOpenGLWidget):
         self.is_dragging_gizmo = False  # True when actively dragging a gizmo
         self.transform_start_mouse = None  # Mouse position when drag started
         self.transform_start_value = None  # Initial transformation value
+        # Screen direction of the dragged axis, fixed for the whole drag
+        self.drag_axis_direction = None
 
         # Camera controls
         self.camera_distance = 200.0  # Distance from origin (increased to see build plate)
@@ -47,10 +148,14 @@ class OpenGLWidget(QOpenGLWidget):
         self.is_panning = False
         self.is_zooming = False
 
-        # Timer for updating the display
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update)
-        self.timer.start(33)  # ~30 FPS (enough for smooth display)
+        # There is no redraw timer: anything that changes what is on screen
+        # calls self.update() to schedule a repaint. High-rate mouse input
+        # calls schedule_update instead, which coalesces repaints to at
+        # most one per REPAINT_INTERVAL_MS.
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(self.REPAINT_INTERVAL_MS)
+        self._repaint_timer.timeout.connect(self.update)
 
         # Enable mouse tracking
         self.setMouseTracking(True)
@@ -59,33 +164,127 @@ class OpenGLWidget(QOpenGLWidget):
         self.face_picking_mode = False
         self.face_aligned_callback = None  # Callback when face is aligned
 
+        # GPU mesh buffers per CAD model: id(cad_model) -> (interleaved
+        # vertex/normal VBO, index buffer, index count, vertex array object
+        # or None). Uploaded on first draw.
+        self._gl_buffers = {}
+        # BREP edge buffers per CAD model: id(cad_model) -> (vertex VBO,
+        # index buffer, index count). Uploaded on first draw.
+        self._gl_edge_buffers = {}
+        # Face picking buffers per CAD model: id(cad_model) -> (VBO with
+        # unshared triangle positions then their ID colors, vertex count).
+        # Uploaded on first color-coded pick.
+        self._gl_pick_buffers = {}
+        # Static VBO with the hatching of every layer, uploaded on first
+        # draw after the hatching or slicing result changes. Each model's
+        # layer holds its contour lines, then its infill lines; the ranges
+        # are gathered per layer for glMultiDrawArrays, see
+        # update_hatching_buffer.
+        self._hatching_vbo = None
+        self._hatching_vao = None  # Records the hatching vertex pointer, None without VAOs
+        self._hatching_ranges = {}
+        self._hatching_vbo_source = (None, None)  # (hatching_data, sliced_layers)
+        self._use_vertex_arrays = False  # Whether the context has VAOs (GL 3.0+ or ARB_vertex_array_object)
+        self._build_plate_list = None  # Display list with the build plate grid and outlines
+        self._build_plate_vbo = None  # Lit build plate surfaces (position/normal)
+        self._build_plate_ranges = ()  # (primitive, first_vertex, vertex_count)
+        self._triad_vbo = None  # Orientation triad lines and arrow heads (position/color)
+        self._arrow_vbo = None  # Unit-size move/scale gizmo arrows, X/Y/Z in order
+        # Unit-size rotate gizmo rings as line strips, X/Y/Z in order, with
+        # interleaved position/color. The CPU copy's colors are rewritten
+        # and re-uploaded only when the hovered ring changes.
+        self._ring_vbo = None
+        self._ring_vertices = None
+        self._ring_highlight = None  # Axis currently colored white in the buffer
+        # glMultiDrawArrays ranges of the three ring strips
+        self._ring_counts = np.full(3, self.GIZMO_RING_SEGMENTS + 1, dtype=np.int32)
+        self._ring_firsts = np.arange(3, dtype=np.int32) * (self.GIZMO_RING_SEGMENTS + 1)
+        # One-pixel offscreen framebuffer that color-coded face picks draw
+        # into, so picking never draws over the visible frame
+        self._pick_fbo = None
+        # Last gizmo hover pick: (x, y, view matrix) it was made with
+        self._hover_pick_key = None
+        # (view matrix, screen bbox) of the gizmo in the last frame it was
+        # drawn, see gizmo_screen_bbox
+        self._gizmo_screen_bbox = (None, None)
+        self._mesh_program = None  # Shader program used to draw model meshes
+        # Static VBO with the outlines of every section in slice mode, each
+        # section recording its (first_vertex, vertex_count) as 'vbo_range'.
+        # Uploaded once per slicing result, see update_slice_buffer.
+        self._slice_vbo = None
+        self._slice_vbo_layers = None  # sliced_layers currently in the buffer
+        self._mesh_uniforms = {}
+
+        # CPU-side copies of the matrices used for the last frame, so
+        # projection and picking never have to read them back from GL
+        self._projection = np.eye(4)
+        self._modelview = np.eye(4)
+        self._view_projection = np.eye(4)  # _projection @ _modelview
+        self._view_normal = np.eye(3)  # Normal matrix of _modelview
+        self._viewport = (0, 0, 1, 1)
+
+        # Projections per view mode: the perspective one is rebuilt on
+        # resize, the slice mode one (and its view) never changes
+        self._proj_persp = np.eye(4)
+        size = self.SLICE_VIEW_SIZE
+        self._proj_ortho = ortho_matrix(-size, size, -size, size, -100, 100)
+        # View from the build direction (as if we're the electron gun), looking
+        # at the XZ plane: rotate 90 degrees around X to look from below upward
+        self._slice_view = rotation_matrix(-90, 1.0, 0.0, 0.0)
+
         # Grid label positions for rendering (updated during draw_build_plate)
         self.grid_labels = []  # List of (screen_x, screen_y, text) tuples
-        self.triad_labels = []  # List of (screen_x, screen_y, text, color) tuples
+        self.triad_labels = []  # List of (screen_x, screen_y, text, rgba) tuples
+
+        # Overlay fonts and colors are built once. Each distinct label is
+        # rasterized once into _label_pixmaps, keyed by (text, style, color,
+        # pixel ratio) where style names one of _label_fonts.
+        grid_label_font = QFont("Arial", 9)
+        grid_label_font.setStyleHint(QFont.StyleHint.SansSerif)
+        triad_label_font = QFont("Arial", 10, QFont.Weight.Bold)
+        triad_label_font.setStyleHint(QFont.StyleHint.SansSerif)
+        self._label_fonts = {'grid': grid_label_font, 'triad': triad_label_font}
+        self._label_pixmaps = {}
+        # Slice info text: larger, bold, solid white for good contrast
+        self._info_font = QFont("Arial", 12, QFont.Weight.Bold)
+        self._info_font.setStyleHint(QFont.StyleHint.SansSerif)
+        self._info_color = QColor(255, 255, 255, 255)
 
         # Slice mode state
         self.view_mode = 'layout'  # 'layout' or 'slice'
         self.layer_thickness = 0.2  # mm
         self.current_layer_index = 0  # Current layer being viewed
         self.sliced_layers = []  # List of sliced layer outlines for each model
+        # (sliced_layers, tables) for get_layer_sections
+        self._layer_sections = (None, [])
 
         # Slice mode scrollbar gizmo state
         self.scrollbar_dragging = False
         self.scrollbar_hover = False
         self.scrollbar_width = 20  # pixels
         self.scrollbar_margin = 10  # pixels from right edge
+        # Scrollbar colors: track, thumb, and thumb when hovered/dragging
+        self._scrollbar_track_color = QColor.fromRgbF(0.3, 0.3, 0.3, 0.5)
+        self._scrollbar_thumb_color = QColor.fromRgbF(0.4, 0.4, 0.6, 0.8)
+        self._scrollbar_thumb_active_color = QColor.fromRgbF(0.6, 0.6, 0.8, 0.9)
 
         # Hatching state
         self.hatching_enabled = False  # Whether to show hatching in slice mode
         self.hatching_data = {}  # Dict mapping (model_idx, layer_idx) -> List[HatchLine]
         self.hatching_params = None  # HatchingParameters instance
         self.hatching_strategy = None  # HatchingStrategy enum value
+        # What hatching_data was generated from, and what the request in
+        # flight will generate, see hatching_signature
+        self._hatching_signature = None
+        self._pending_hatching_signature = None
+        # (hatching_data, merged) for the last get_merged_hatching call
+        self._merged_hatching = (None, None)
 
     def initializeGL(self):
         """Initialize OpenGL context and settings"""
-        # Set up OpenGL context
-        self.makeCurrent()
-        
+        # Qt makes the context current before calling initializeGL, resizeGL
+        # and paintGL, so none of them call makeCurrent themselves
+
         # Enable depth testing
         glEnable(GL_DEPTH_TEST)
 
@@ -95,61 +294,56 @@ class OpenGLWidget(QOpenGLWidget):
         # Set clear color to light gray background (70% gray)
         glClearColor(0.7, 0.7, 0.7, 1.0)
 
-        # Set up lighting with multiple lights for even illumination
-        glEnable(GL_LIGHTING)
-
-        # Enable ambient light for base illumination
-        glLightModelfv(GL_LIGHT_MODEL_AMBIENT, [0.4, 0.4, 0.4, 1.0])
-
-        # Main key light (top-front-right)
-        glEnable(GL_LIGHT0)
-        glLightfv(GL_LIGHT0, GL_POSITION, [1.0, 1.0, 1.0, 0.0])
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, [0.6, 0.6, 0.6, 1.0])
-        glLightfv(GL_LIGHT0, GL_SPECULAR, [0.3, 0.3, 0.3, 1.0])
-
-        # Fill light (top-front-left) for better illumination
-        glEnable(GL_LIGHT1)
-        glLightfv(GL_LIGHT1, GL_POSITION, [-1.0, 1.0, 1.0, 0.0])
-        glLightfv(GL_LIGHT1, GL_DIFFUSE, [0.4, 0.4, 0.4, 1.0])
-        glLightfv(GL_LIGHT1, GL_SPECULAR, [0.1, 0.1, 0.1, 1.0])
-
-        # Back light (from below-back) to prevent dark silhouettes
-        glEnable(GL_LIGHT2)
-        glLightfv(GL_LIGHT2, GL_POSITION, [0.0, -0.5, -1.0, 0.0])
-        glLightfv(GL_LIGHT2, GL_DIFFUSE, [0.3, 0.3, 0.3, 1.0])
-        glLightfv(GL_LIGHT2, GL_SPECULAR, [0.0, 0.0, 0.0, 1.0])
-
-        # Set material properties
-        glMaterialfv(GL_FRONT, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
-        glMaterialfv(GL_FRONT, GL_SPECULAR, [1.0, 1.0, 1.0, 1.0])
-        glMaterialf(GL_FRONT, GL_SHININESS, 50.0)
-
-        # Enable flat shading (slicer-style)
+        # Lighting is done by the mesh program; fixed-function lighting
+        # stays off. Flat shading (slicer-style) gives each triangle the
+        # color the shader computed for its provoking vertex.
         glShadeModel(GL_FLAT)
+
+        # GL objects belong to the context; (re)build them for this one
+        self._gl_buffers = {}
+        self._gl_edge_buffers = {}
+        self._gl_pick_buffers = {}
+        # PyOpenGL resolves glGenVertexArrays whenever the driver exports it,
+        # even for a legacy 2.1 context that can't use it, so ask the context
+        context = self.context()
+        self._use_vertex_arrays = (
+            context.format().version() >= (3, 0)
+            or context.hasExtension(b'GL_ARB_vertex_array_object'))
+        self._hatching_vbo = glGenBuffers(1)
+        self._hatching_vao = self.create_position_vertex_array(self._hatching_vbo)
+        self._hatching_ranges = {}
+        self._hatching_vbo_source = (None, None)
+        self._slice_vbo = glGenBuffers(1)
+        self._slice_vbo_layers = None
+        self._build_plate_list = self.compile_build_plate()
+        self._build_plate_vbo, self._build_plate_ranges = self.upload_build_plate_surfaces()
+        self._triad_vbo = self.upload_orientation_triad()
+        self._arrow_vbo = self.upload_gizmo_arrows()
+        self._ring_vbo, self._ring_vertices = self.upload_gizmo_rings()
+        self._ring_highlight = None
+        self._pick_fbo = self.create_pick_framebuffer()
+        self._mesh_program = compile_program(
+            MESH_VERTEX_SHADER, MESH_FRAGMENT_SHADER,
+            {'aPos': ATTRIB_POSITION, 'aNormal': ATTRIB_NORMAL})
+        self._mesh_uniforms = uniform_locations(
+            self._mesh_program,
+            ('uMVP', 'uNormalMat', 'uColor', 'uAmbient', 'uSpecular', 'uShininess'))
+        self.set_mesh_lights()
         
     def resizeGL(self, width, height):
         """Handle window resize"""
-        # Make sure we have a valid context
-        if not self.context():
-            return
-
         # Protect against division by zero
         if height == 0:
             height = 1
 
-        self.makeCurrent()
+        # The layout mode projection only depends on the aspect ratio
+        self._proj_persp = perspective_matrix(45.0, width / height, 0.1, 1000.0)
 
-        # Set viewport to match new window size
-        glViewport(0, 0, width, height)
-
-        # Set up projection matrix
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45.0, width / height, 0.1, 1000.0)
+        # Viewport matching the new window size (in framebuffer pixels)
+        pixel_ratio = self.devicePixelRatio()
+        self._viewport = (0, 0, int(width * pixel_ratio), int(height * pixel_ratio))
+        glViewport(*self._viewport)
 
-        # Switch back to modelview matrix
-        glMatrixMode(GL_MODELVIEW)
-        
     def paintGL(self):
         """Main rendering function"""
         # Make sure we have a valid context
@@ -157,8 +351,6 @@ class OpenGLWidget(QOpenGLWidget):
         if not context or not context.isValid():
             return
 
-        self.makeCurrent()
-
         # On macOS with Metal-backed Qt6, QPainter must be created BEFORE OpenGL rendering
         # and OpenGL must be wrapped in beginNativePainting/endNativePainting.
         # Without this, Metal render passes can clear previously rendered OpenGL content.
@@ -171,63 +363,26 @@ class OpenGLWidget(QOpenGLWidget):
         # Clear buffers with proper color and depth clearing
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-        # Set up projection matrix (ensure it's correct after any context changes)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        width = self.width()
-        height = self.height()
-        if height == 0:
-            height = 1
-        gluPerspective(45.0, width / height, 0.1, 1000.0)
-
-        # Switch to modelview matrix
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-
         # Draw based on view mode
         if self.view_mode == 'slice':
             # Slice mode: 2D orthographic view from the build direction (looking at XZ plane)
-            # Set up orthographic projection for 2D view
-            glMatrixMode(GL_PROJECTION)
-            glLoadIdentity()
+            self.set_view(self._proj_ortho, self._slice_view)
 
-            # Calculate the view bounds (show build plate area)
-            view_size = 60.0  # Show 120mm x 120mm area (build plate is 100mm diameter)
-            glOrtho(-view_size, view_size, -view_size, view_size, -100, 100)
-
-            glMatrixMode(GL_MODELVIEW)
-            glLoadIdentity()
-
-            # View from the build direction (as if we're the electron gun)
-            # We want to look at the XZ plane (horizontal plane)
-            # Rotate 90 degrees around X axis to look from below upward
-            glRotatef(-90, 1.0, 0.0, 0.0)
+            # The slice view is flat lines drawn in order (hatching over
+            # outlines), so depth testing stays off until the next frame
+            glDisable(GL_DEPTH_TEST)
 
             # Draw sliced layer outlines
             self.draw_sliced_layers()
-
-            # Draw scrollbar gizmo
-            self.draw_scrollbar_gizmo()
         else:
             # Layout mode: 3D perspective view
-            # Move camera back based on zoom level
-            glTranslatef(0.0, 0.0, -self.camera_distance)
-
-            # Apply pan (in camera space, before rotation)
-            glTranslatef(self.pan_x, self.pan_y, 0.0)
-
-            # Apply rotations around the build plate center
-            glRotatef(self.rotation_x, 1.0, 0.0, 0.0)
-            glRotatef(self.rotation_y, 0.0, 1.0, 0.0)
-            glRotatef(self.rotation_z, 0.0, 0.0, 1.0)
+            self.set_view(self._proj_persp, self.camera_matrix())
 
             # Draw the build plate
             self.draw_build_plate()
 
             # Draw all loaded CAD models
-            for i, model_data in enumerate(self.models):
-                is_selected = (i == self.selected_model_index)
-                self.draw_cad_model(model_data, is_selected)
+            self.draw_cad_models()
 
             # Draw transformation gizmo for selected model
             if self.selected_model_index is not None and self.transform_mode:
@@ -242,15 +397,47 @@ class OpenGLWidget(QOpenGLWidget):
         # Draw 2D text overlays using the shared QPainter (after endNativePainting)
         if self.view_mode != 'slice':
             self.draw_grid_labels(painter)
+        else:
+            self.draw_scrollbar_gizmo(painter)
         self.draw_slice_info_overlay(painter)
 
         painter.end()
         
+    def camera_rotation_matrix(self):
+        """Get the view rotation around the build plate center (X, then Y, then Z)"""
+        return (rotation_matrix(self.rotation_x, 1.0, 0.0, 0.0)
+                @ rotation_matrix(self.rotation_y, 0.0, 1.0, 0.0)
+                @ rotation_matrix(self.rotation_z, 0.0, 0.0, 1.0))
+
+    def camera_matrix(self):
+        """Get the layout mode view matrix for the current zoom, pan and rotation"""
+        # Move camera back based on zoom level, then pan in camera space
+        # before rotating around the build plate center
+        return (translation_matrix(0.0, 0.0, -self.camera_distance)
+                @ translation_matrix(self.pan_x, self.pan_y, 0.0)
+                @ self.camera_rotation_matrix())
+
+    def set_view(self, projection, modelview):
+        """Make projection/modelview the frame's camera and load them into GL
+
+        Also caches the camera parts of every model's shader matrices, so
+        per-model work in set_mesh_transform is one product each.
+        """
+        self._projection = projection
+        self._modelview = modelview
+        self._view_projection = projection @ modelview
+        self._view_normal = np.linalg.inv(modelview[:3, :3]).T
+        self.load_matrices()
+
+    def load_matrices(self):
+        """Load the CPU-side projection and modelview matrices into GL"""
+        glMatrixMode(GL_PROJECTION)
+        glLoadMatrixd(gl_matrix(self._projection))
+        glMatrixMode(GL_MODELVIEW)
+        glLoadMatrixd(gl_matrix(self._modelview))
+
     def draw_cube(self):
         """Draw a simple colored cube"""
-        # Temporarily disable lighting to use vertex colors
-        glDisable(GL_LIGHTING)
-
         # Define vertices of a cube
         vertices = [
             [-1, -1, -1], [1, -1, -1], [1, 1, -1], [-1, 1, -1],
@@ -277,91 +464,133 @@ class OpenGLWidget(QOpenGLWidget):
                 glVertex3fv(vertices[vertex_index])
             glEnd()
 
-        # Re-enable lighting for other objects
-        glEnable(GL_LIGHTING)
-
     def draw_build_plate(self):
         """Draw cylindrical build plate (100mm diameter, 10mm thick, stainless steel) with grid"""
-        # Build plate dimensions (in same units as CAD model)
-        radius = 50.0  # 100mm diameter
         thickness = self.BUILD_PLATE_THICKNESS
-        segments = 64  # Number of segments for smooth cylinder
-
-        glPushMatrix()
 
         # Position the build plate at the bottom
         # Top surface will be at Y = BUILD_PLATE_TOP_Y (5mm)
-        glTranslatef(0.0, -thickness/2, 0.0)
-
-        # Set stainless steel material properties
-        glEnable(GL_LIGHTING)
-        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.25, 0.25, 0.25, 1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.4, 0.4, 0.4, 1.0])
-        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.774597, 0.774597, 0.774597, 1.0])
-        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 76.8)
-
-        # Draw cylinder sides
-        glBegin(GL_QUAD_STRIP)
-        for i in range(segments + 1):
-            angle = (i / segments) * 2.0 * np.pi
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-
-            # Normal points outward
-            glNormal3f(np.cos(angle), 0.0, np.sin(angle))
-            glVertex3f(x, 0.0, z)
-            glVertex3f(x, thickness, z)
-        glEnd()
+        plate_matrix = translation_matrix(0.0, -thickness/2, 0.0)
+
+        # Lit cylinder surfaces with the mesh program
+        glUseProgram(self._mesh_program)
+        self.set_mesh_material(self.BUILD_PLATE_MATERIAL)
+        self.set_mesh_transform(plate_matrix)
+        self.bind_mesh_attributes(self._build_plate_vbo, 0)
+        for primitive, first, count in self._build_plate_ranges:
+            glDrawArrays(primitive, first, count)
+        self.unbind_mesh_attributes()
+        glUseProgram(0)
+
+        # Grid and outlines never change, so they are replayed from a display list
+        glPushMatrix()
+        glMultMatrixd(gl_matrix(plate_matrix))
+        glCallList(self._build_plate_list)
+        glPopMatrix()
 
-        # Draw top disk
-        glBegin(GL_TRIANGLE_FAN)
-        glNormal3f(0.0, 1.0, 0.0)
-        glVertex3f(0.0, thickness, 0.0)  # Center point
-        for i in range(segments + 1):
-            angle = (i / segments) * 2.0 * np.pi
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            glVertex3f(x, thickness, z)
-        glEnd()
+        # Only the grid label screen positions depend on the camera
+        self.update_grid_labels(self.BUILD_PLATE_RADIUS, self.BUILD_PLATE_TOP_Y + 0.1)
 
-        # Draw bottom disk
-        glBegin(GL_TRIANGLE_FAN)
-        glNormal3f(0.0, -1.0, 0.0)
-        glVertex3f(0.0, 0.0, 0.0)  # Center point
-        for i in range(segments + 1):
-            angle = (segments - i) / segments * 2.0 * np.pi  # Reverse winding
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            glVertex3f(x, 0.0, z)
-        glEnd()
+    def build_plate_rings(self):
+        """
+        Sample the build plate's bottom and top edge circles.
+
+        Returns:
+            (ring, bottom_ring, top_ring): the unit circle as outward normals
+            and the two edge circles, each with segments + 1 points (the
+            last point closes the ring)
+        """
+        radius = self.BUILD_PLATE_RADIUS
+        segments = self.BUILD_PLATE_SEGMENTS
+
+        circle = unit_circle(segments)
+        ring = np.column_stack((circle[:, 0], np.zeros(segments + 1), circle[:, 1]))
+        bottom_ring = (ring * radius).astype(np.float32)
+        top_ring = bottom_ring.copy()
+        top_ring[:, 1] = self.BUILD_PLATE_THICKNESS
+        return ring.astype(np.float32), bottom_ring, top_ring
+
+    def upload_build_plate_surfaces(self):
+        """
+        Upload the build plate's cylinder surfaces for the mesh program.
+
+        Must be called with the GL context current.
+
+        Returns:
+            (vbo, ranges): interleaved position/normal buffer and the
+            (primitive, first_vertex, vertex_count) draws that make up the
+            sides, top and bottom
+        """
+        thickness = self.BUILD_PLATE_THICKNESS
+        ring, bottom_ring, top_ring = self.build_plate_rings()
+
+        # Cylinder sides, alternating bottom and top vertices with the
+        # normal pointing outward
+        sides = np.empty((2 * len(ring), 6), dtype=np.float32)
+        sides[0::2, :3] = bottom_ring
+        sides[1::2, :3] = top_ring
+        sides[:, 3:] = np.repeat(ring, 2, axis=0)
+
+        # Top disk around its center point
+        top_fan = np.zeros((len(ring) + 1, 6), dtype=np.float32)
+        top_fan[0, 1] = thickness
+        top_fan[1:, :3] = top_ring
+        top_fan[:, 4] = 1.0
+
+        # Bottom disk (reverse winding)
+        bottom_fan = np.zeros((len(ring) + 1, 6), dtype=np.float32)
+        bottom_fan[1:, :3] = bottom_ring[::-1]
+        bottom_fan[:, 4] = -1.0
+
+        ranges = []
+        first = 0
+        for primitive, part in ((GL_QUAD_STRIP, sides),
+                                (GL_TRIANGLE_FAN, top_fan),
+                                (GL_TRIANGLE_FAN, bottom_fan)):
+            ranges.append((primitive, first, len(part)))
+            first += len(part)
+        vertices = np.vstack((sides, top_fan, bottom_fan))
+
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vbo, tuple(ranges)
+
+    def compile_build_plate(self):
+        """
+        Record the build plate grid and outlines into a display list.
+
+        Must be called with the GL context current.
+
+        Returns:
+            Display list id
+        """
+        # Build plate dimensions (in same units as CAD model)
+        radius = self.BUILD_PLATE_RADIUS
+        thickness = self.BUILD_PLATE_THICKNESS
+        segments = self.BUILD_PLATE_SEGMENTS
+        _, bottom_ring, top_ring = self.build_plate_rings()
+
+        display_list = glGenLists(1)
+        glNewList(display_list, GL_COMPILE)
 
         # Draw grid on top of build plate
         self.draw_build_plate_grid(radius, thickness)
 
         # Draw outlines/edges for slicer-style appearance
-        glDisable(GL_LIGHTING)
         glColor3f(0.1, 0.1, 0.1)  # Dark outline color
         glLineWidth(1.5)
 
-        # Top edge outline
-        glBegin(GL_LINE_LOOP)
-        for i in range(segments):
-            angle = (i / segments) * 2.0 * np.pi
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            glVertex3f(x, thickness, z)
-        glEnd()
-
-        # Bottom edge outline
-        glBegin(GL_LINE_LOOP)
-        for i in range(segments):
-            angle = (i / segments) * 2.0 * np.pi
-            x = radius * np.cos(angle)
-            z = radius * np.sin(angle)
-            glVertex3f(x, 0.0, z)
-        glEnd()
+        # Top and bottom edge outlines (the closing ring point is implied)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        for outline in (top_ring, bottom_ring):
+            glVertexPointer(3, GL_FLOAT, 0, np.ascontiguousarray(outline[:segments]))
+            glDrawArrays(GL_LINE_LOOP, 0, segments)
+        glDisableClientState(GL_VERTEX_ARRAY)
 
-        glPopMatrix()
+        glEndList()
+        return display_list
 
     def draw_build_plate_grid(self, radius, thickness):
         """Draw ghosted grid on build plate with major (20mm) and minor (5mm) lines"""
@@ -375,85 +604,38 @@ class OpenGLWidget(QOpenGLWidget):
         minor_color = (0.5, 0.5, 0.5, 0.15)  # Very faint minor lines
         major_color = (0.6, 0.6, 0.6, 0.3)   # Slightly more visible major lines
 
-        glDisable(GL_LIGHTING)
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         glEnable(GL_LINE_SMOOTH)
         glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)
 
-        # Clear grid labels
-        self.grid_labels = []
+        # Line offsets from the center in minor steps; every 4th minor line
+        # is a major line, so the low two bits of the step split them
+        # (two's complement keeps this right for negative steps)
+        steps_per_major = int(major_spacing / minor_spacing)  # 4, a power of two
+        major_bits = steps_per_major - 1
+        steps = np.arange(-int(radius / minor_spacing), int(radius / minor_spacing) + 1)
+        is_major = (steps & major_bits) == 0
+        minor_offsets = steps[~is_major] * minor_spacing
+        major_offsets = steps[is_major] * minor_spacing
 
-        # Function to clip line to circle
-        def clip_line_to_circle(x1, z1, x2, z2, r):
-            """Clip a line segment to a circle, return clipped endpoints or None"""
-            # For horizontal lines (z1 == z2)
-            if abs(z1 - z2) < 0.001:
-                z = z1
-                if abs(z) > r:
-                    return None
-                x_extent = np.sqrt(r * r - z * z)
-                return (max(x1, -x_extent), z, min(x2, x_extent), z)
-            # For vertical lines (x1 == x2)
-            elif abs(x1 - x2) < 0.001:
-                x = x1
-                if abs(x) > r:
-                    return None
-                z_extent = np.sqrt(r * r - x * x)
-                return (x, max(z1, -z_extent), x, min(z2, z_extent))
-            return None
+        glEnableClientState(GL_VERTEX_ARRAY)
 
         # Draw minor grid lines (every 5mm, excluding major lines)
+        minor_vertices = self.grid_line_vertices(minor_offsets, radius, grid_y)
         glLineWidth(1.0)
         glColor4f(*minor_color)
-        glBegin(GL_LINES)
-
-        # Vertical lines (along Z axis)
-        for i in range(-int(radius / minor_spacing), int(radius / minor_spacing) + 1):
-            x = i * minor_spacing
-            # Skip major lines (every 4th minor line = 20mm)
-            if i % 4 == 0:
-                continue
-            if abs(x) < radius:
-                z_extent = np.sqrt(radius * radius - x * x)
-                glVertex3f(x, grid_y, -z_extent)
-                glVertex3f(x, grid_y, z_extent)
-
-        # Horizontal lines (along X axis)
-        for i in range(-int(radius / minor_spacing), int(radius / minor_spacing) + 1):
-            z = i * minor_spacing
-            # Skip major lines
-            if i % 4 == 0:
-                continue
-            if abs(z) < radius:
-                x_extent = np.sqrt(radius * radius - z * z)
-                glVertex3f(-x_extent, grid_y, z)
-                glVertex3f(x_extent, grid_y, z)
-
-        glEnd()
+        glVertexPointer(3, GL_FLOAT, 0, minor_vertices)
+        glDrawArrays(GL_LINES, 0, len(minor_vertices))
 
         # Draw major grid lines (every 20mm)
+        major_vertices = self.grid_line_vertices(major_offsets, radius, grid_y)
         glLineWidth(1.5)
         glColor4f(*major_color)
-        glBegin(GL_LINES)
+        glVertexPointer(3, GL_FLOAT, 0, major_vertices)
+        glDrawArrays(GL_LINES, 0, len(major_vertices))
 
-        # Vertical major lines (along Z axis)
-        for i in range(-int(radius / major_spacing), int(radius / major_spacing) + 1):
-            x = i * major_spacing
-            if abs(x) < radius:
-                z_extent = np.sqrt(radius * radius - x * x)
-                glVertex3f(x, grid_y, -z_extent)
-                glVertex3f(x, grid_y, z_extent)
-
-        # Horizontal major lines (along X axis)
-        for i in range(-int(radius / major_spacing), int(radius / major_spacing) + 1):
-            z = i * major_spacing
-            if abs(z) < radius:
-                x_extent = np.sqrt(radius * radius - z * z)
-                glVertex3f(-x_extent, grid_y, z)
-                glVertex3f(x_extent, grid_y, z)
-
-        glEnd()
+        glDisableClientState(GL_VERTEX_ARRAY)
 
         # Draw center crosshair (0,0) slightly more visible
         glLineWidth(2.0)
@@ -467,144 +649,128 @@ class OpenGLWidget(QOpenGLWidget):
         glVertex3f(0, grid_y, radius)
         glEnd()
 
+        glDisable(GL_BLEND)
+        glDisable(GL_LINE_SMOOTH)
+
+    @staticmethod
+    def grid_line_vertices(offsets, radius, grid_y):
+        """
+        Build endpoints of grid lines clipped to the circular plate.
+
+        Args:
+            offsets: Line offsets from the plate center (mm)
+            radius: Plate radius
+            grid_y: Height of the grid
+
+        Returns:
+            float32 array (4 * n, 3): lines along Z at each offset, then
+            lines along X at each offset, two endpoints per line
+        """
+        offsets = offsets[np.abs(offsets) < radius]
+        extents = np.sqrt(radius * radius - offsets * offsets)
+        count = len(offsets)
+
+        vertices = np.empty((4 * count, 3), dtype=np.float32)
+        vertices[:, 1] = grid_y
+
+        # Vertical lines (along Z axis)
+        vertices[0:2 * count:2, 0] = offsets
+        vertices[0:2 * count:2, 2] = -extents
+        vertices[1:2 * count:2, 0] = offsets
+        vertices[1:2 * count:2, 2] = extents
+
+        # Horizontal lines (along X axis)
+        vertices[2 * count::2, 0] = -extents
+        vertices[2 * count::2, 2] = offsets
+        vertices[2 * count + 1::2, 0] = extents
+        vertices[2 * count + 1::2, 2] = offsets
+        return vertices
+
+    def update_grid_labels(self, radius, grid_y):
+        """Project the major grid line labels (at world height grid_y) to screen coordinates"""
+        major_spacing = 20.0  # 20mm major grid
+
+        # Clear grid labels
+        self.grid_labels = []
+
         # Collect label positions for major grid lines
         # We'll project 3D points to 2D screen coordinates
-        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-        projection = glGetDoublev(GL_PROJECTION_MATRIX)
-        viewport = glGetIntegerv(GL_VIEWPORT)
-
-        # Add labels along X axis (at Z = -radius - offset for visibility)
         label_offset = 3.0  # Offset from grid edge
-        x = -40  # Start from -40 to 40 in steps of 20
-        while x <= 40:
-            if abs(x) <= radius:
-                # Project point to screen coordinates
-                try:
-                    # Label at the edge of the circle along Z axis
-                    z_pos = -radius - label_offset
-                    screen = gluProject(x, grid_y, z_pos, modelview, projection, viewport)
-                    if screen:
-                        # Store label info (screen coords and text)
-                        self.grid_labels.append((screen[0], screen[1], str(int(x))))
-                except:
-                    pass
-            x += major_spacing
-
-        # Add labels along Z axis (at X = -radius - offset)
-        z = -40
-        while z <= 40:
-            if abs(z) <= radius and z != 0:  # Skip 0 since we labeled it on X axis
-                try:
-                    x_pos = -radius - label_offset
-                    screen = gluProject(x_pos, grid_y, z, modelview, projection, viewport)
-                    if screen:
-                        self.grid_labels.append((screen[0], screen[1], str(int(z))))
-                except:
-                    pass
-            z += major_spacing
-
-        glDisable(GL_BLEND)
-        glDisable(GL_LINE_SMOOTH)
+        edge = -radius - label_offset
+
+        # Labels along X axis (at Z = edge), then along Z axis (at X = edge);
+        # 0 is skipped on Z since it is labeled on X
+        steps = np.arange(-40, 41, major_spacing)
+        steps = steps[np.abs(steps) <= radius]
+        z_steps = steps[steps != 0]
+        points = np.concatenate((
+            np.column_stack((steps, np.full(len(steps), grid_y), np.full(len(steps), edge))),
+            np.column_stack((np.full(len(z_steps), edge), np.full(len(z_steps), grid_y), z_steps)),
+        ))
+        values = np.concatenate((steps, z_steps))
+
+        # Project all label anchors in one batch
+        screen = project_points(points, self._modelview, self._projection, self._viewport)
+        for (screen_x, screen_y, _), value in zip(screen, values):
+            if np.isfinite(screen_x) and np.isfinite(screen_y):
+                # Store label info (screen coords and text)
+                self.grid_labels.append((screen_x, screen_y, str(int(value))))
 
     def draw_orientation_triad(self):
         """Draw orientation triad gizmo in bottom-left corner"""
-        # Save current state
-        glPushAttrib(GL_ALL_ATTRIB_BITS)
-
         # Triad viewport settings
         triad_size = 80  # Size of the triad viewport in pixels
         margin = 10  # Margin from corner
-        axis_length = 0.6  # Length of each axis (normalized)
+        axis_length = self.TRIAD_AXIS_LENGTH
 
         # Set up a small viewport in the bottom-left corner
         glViewport(margin, margin, triad_size, triad_size)
 
         # Set up orthographic projection for the triad
+        projection = ortho_matrix(-1, 1, -1, 1, -2, 2)
         glMatrixMode(GL_PROJECTION)
         glPushMatrix()
-        glLoadIdentity()
-        glOrtho(-1, 1, -1, 1, -2, 2)
+        glLoadMatrixd(gl_matrix(projection))
 
-        # Set up modelview with only rotation (no translation/zoom)
+        # Set up modelview with only the main view's rotation (no translation/zoom)
+        modelview = self.camera_rotation_matrix()
         glMatrixMode(GL_MODELVIEW)
         glPushMatrix()
-        glLoadIdentity()
-
-        # Apply the same rotation as the main view
-        glRotatef(self.rotation_x, 1.0, 0.0, 0.0)
-        glRotatef(self.rotation_y, 0.0, 1.0, 0.0)
-        glRotatef(self.rotation_z, 0.0, 0.0, 1.0)
+        glLoadMatrixd(gl_matrix(modelview))
 
-        # Disable lighting and depth test for clean rendering
-        glDisable(GL_LIGHTING)
+        # Disable depth test for clean rendering
         glDisable(GL_DEPTH_TEST)
         glEnable(GL_LINE_SMOOTH)
         glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)
         glLineWidth(2.0)
 
-        # Draw X axis (Red) - plate plane
-        glColor3f(0.9, 0.2, 0.2)
-        glBegin(GL_LINES)
-        glVertex3f(0, 0, 0)
-        glVertex3f(axis_length, 0, 0)
-        glEnd()
-        # Arrow head
-        glBegin(GL_TRIANGLES)
-        glVertex3f(axis_length, 0, 0)
-        glVertex3f(axis_length - 0.15, 0.05, 0)
-        glVertex3f(axis_length - 0.15, -0.05, 0)
-        glEnd()
-
-        # Draw Z axis (Green) - plate plane (note: in our coord system Z is horizontal)
-        glColor3f(0.2, 0.9, 0.2)
-        glBegin(GL_LINES)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, 0, axis_length)
-        glEnd()
-        # Arrow head
-        glBegin(GL_TRIANGLES)
-        glVertex3f(0, 0, axis_length)
-        glVertex3f(0.05, 0, axis_length - 0.15)
-        glVertex3f(-0.05, 0, axis_length - 0.15)
-        glEnd()
-
-        # Draw Y axis (Blue) - build direction (vertical)
-        glColor3f(0.2, 0.4, 0.9)
-        glBegin(GL_LINES)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, axis_length, 0)
-        glEnd()
-        # Arrow head
-        glBegin(GL_TRIANGLES)
-        glVertex3f(0, axis_length, 0)
-        glVertex3f(0.05, axis_length - 0.15, 0)
-        glVertex3f(-0.05, axis_length - 0.15, 0)
-        glEnd()
+        # Axis lines and arrow heads from the static triad buffer
+        glBindBuffer(GL_ARRAY_BUFFER, self._triad_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 24, ctypes.c_void_p(0))
+        glColorPointer(3, GL_FLOAT, 24, ctypes.c_void_p(12))
+        glDrawArrays(GL_LINES, 0, 6)
+        glDrawArrays(GL_TRIANGLES, 6, 9)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         # Store axis endpoint screen positions for labels
         # We need to project the axis endpoints to get label positions
         self.triad_labels = []
 
-        # Get the current matrices for projection
-        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-        projection = glGetDoublev(GL_PROJECTION_MATRIX)
         viewport = (margin, margin, triad_size, triad_size)
 
-        try:
-            # Project axis endpoints
-            label_offset = 0.15
-            x_end = gluProject(axis_length + label_offset, 0, 0, modelview, projection, viewport)
-            y_end = gluProject(0, axis_length + label_offset, 0, modelview, projection, viewport)
-            z_end = gluProject(0, 0, axis_length + label_offset, modelview, projection, viewport)
-
-            if x_end:
-                self.triad_labels.append((x_end[0], x_end[1], 'X', (0.9, 0.2, 0.2)))
-            if y_end:
-                self.triad_labels.append((y_end[0], y_end[1], 'Z', (0.2, 0.4, 0.9)))  # Y axis = Z (build)
-            if z_end:
-                self.triad_labels.append((z_end[0], z_end[1], 'Y', (0.2, 0.9, 0.2)))  # Z axis = Y (plate)
-        except:
-            pass
+        # Project the three axis endpoints in one batch
+        label_offset = 0.15
+        endpoints = np.eye(3) * (axis_length + label_offset)
+        x_end, y_end, z_end = project_points(endpoints, modelview, projection, viewport)
+
+        # Label colors match the axis colors in upload_orientation_triad
+        self.triad_labels.append((x_end[0], x_end[1], 'X', (229, 51, 51, 255)))
+        self.triad_labels.append((y_end[0], y_end[1], 'Z', (51, 102, 229, 255)))  # Y axis = Z (build)
+        self.triad_labels.append((z_end[0], z_end[1], 'Y', (51, 229, 51, 255)))  # Z axis = Y (plate)
 
         # Restore matrices
         glMatrixMode(GL_PROJECTION)
@@ -612,11 +778,44 @@ class OpenGLWidget(QOpenGLWidget):
         glMatrixMode(GL_MODELVIEW)
         glPopMatrix()
 
-        # Restore viewport to full window
-        glViewport(0, 0, self.width(), self.height())
+        # Restore viewport to full window and the state changed above
+        glViewport(*self._viewport)
+        glLineWidth(1.0)
+        glDisable(GL_LINE_SMOOTH)
+        glEnable(GL_DEPTH_TEST)
+
+    def upload_orientation_triad(self):
+        """
+        Upload the orientation triad's axis lines and arrow heads.
+
+        Must be called with the GL context current.
 
-        # Restore attributes
-        glPopAttrib()
+        Returns:
+            VBO with interleaved position/color vertices: the three axis
+            lines (6 vertices), then the three arrow heads (9 vertices)
+        """
+        length = self.TRIAD_AXIS_LENGTH
+        head = length - 0.15
+
+        # X axis (red) and Z axis (green) lie in the plate plane, the Y axis
+        # (blue) is the build direction
+        axes = (
+            ((length, 0, 0), ((head, 0.05, 0), (head, -0.05, 0)), (0.9, 0.2, 0.2)),
+            ((0, 0, length), ((0.05, 0, head), (-0.05, 0, head)), (0.2, 0.9, 0.2)),
+            ((0, length, 0), ((0.05, head, 0), (-0.05, head, 0)), (0.2, 0.4, 0.9)),
+        )
+        lines = []
+        heads = []
+        for tip, (left, right), color in axes:
+            lines += [(0, 0, 0, *color), (*tip, *color)]
+            heads += [(*tip, *color), (*left, *color), (*right, *color)]
+        vertices = np.array(lines + heads, dtype=np.float32)
+
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vbo
 
     def draw_grid_labels(self, painter=None):
         """Draw grid labels using QPainter overlay"""
@@ -629,60 +828,67 @@ class OpenGLWidget(QOpenGLWidget):
         if own_painter:
             painter = QPainter(self)
 
-        # Draw grid labels if any
-        if self.grid_labels:
-            # Set up font - nice sans-serif
-            font = QFont("Arial", 9)
-            font.setStyleHint(QFont.StyleHint.SansSerif)
-            painter.setFont(font)
-
-            # Set ghosted text color (semi-transparent)
-            text_color = QColor(180, 180, 180, 100)  # Light gray, semi-transparent
-            painter.setPen(text_color)
+        # Draw grid labels in ghosted text color (light gray, semi-transparent)
+        for screen_x, screen_y, text in self.grid_labels:
+            label = self.get_label_pixmap(text, 'grid', (180, 180, 180, 100))
+            self.draw_label_pixmap(painter, label, screen_x, screen_y, widget_height, pixel_ratio)
 
-            # Get font metrics for centering
-            fm = QFontMetrics(font)
-
-            # Draw each label
-            for screen_x, screen_y, text in self.grid_labels:
-                # Convert OpenGL screen coords to Qt coords (flip Y)
-                qt_x = int(screen_x / pixel_ratio)
-                qt_y = int((widget_height * pixel_ratio - screen_y) / pixel_ratio)
-
-                # Center text on the point
-                text_width = fm.horizontalAdvance(text)
-                text_height = fm.height()
-
-                painter.drawText(
-                    qt_x - text_width // 2,
-                    qt_y + text_height // 4,
-                    text
-                )
-
-        # Draw triad axis labels
-        if hasattr(self, 'triad_labels') and self.triad_labels:
-            font = QFont("Arial", 10, QFont.Weight.Bold)
-            font.setStyleHint(QFont.StyleHint.SansSerif)
-            painter.setFont(font)
-            fm = QFontMetrics(font)
+        # Draw triad axis labels in their axis colors
+        for screen_x, screen_y, text, rgba in self.triad_labels:
+            label = self.get_label_pixmap(text, 'triad', rgba)
+            self.draw_label_pixmap(painter, label, screen_x, screen_y, widget_height, pixel_ratio)
 
-            for screen_x, screen_y, text, color in self.triad_labels:
-                # Convert coords
-                qt_x = int(screen_x / pixel_ratio)
-                qt_y = int((widget_height * pixel_ratio - screen_y) / pixel_ratio)
+        if own_painter:
+            painter.end()
 
-                # Set color for this axis label
-                painter.setPen(QColor(int(color[0]*255), int(color[1]*255), int(color[2]*255)))
+    def get_label_pixmap(self, text, style, rgba):
+        """Get a label rendered into a transparent pixmap, rasterizing it on first use
 
-                text_width = fm.horizontalAdvance(text)
-                painter.drawText(
-                    qt_x - text_width // 2,
-                    qt_y + fm.height() // 4,
-                    text
-                )
+        Args:
+            text: Label text
+            style: Key of the QFont in _label_fonts to render with
+            rgba: Text color as an (r, g, b, a) tuple of 0-255 ints
 
-        if own_painter:
-            painter.end()
+        Returns:
+            (pixmap, offset_x, offset_y) where the offset places the pixmap's
+            top-left corner relative to the point the label is centered on
+        """
+        pixel_ratio = self.devicePixelRatio()
+        key = (text, style, rgba, pixel_ratio)
+        cached = self._label_pixmaps.get(key)
+        if cached is None:
+            font = self._label_fonts[style]
+            fm = QFontMetrics(font)
+            bounds = fm.boundingRect(text)
+            image = QImage(max(1, int(np.ceil(bounds.width() * pixel_ratio))),
+                           max(1, int(np.ceil(bounds.height() * pixel_ratio))),
+                           QImage.Format.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(pixel_ratio)
+            image.fill(Qt.GlobalColor.transparent)
+
+            label_painter = QPainter(image)
+            label_painter.setFont(font)
+            label_painter.setPen(QColor(*rgba))
+            label_painter.drawText(-bounds.x(), -bounds.y(), text)
+            label_painter.end()
+
+            # Center the text horizontally, with the baseline a quarter line
+            # below the point
+            offset_x = bounds.x() - fm.horizontalAdvance(text) // 2
+            offset_y = bounds.y() + fm.height() // 4
+            cached = (QPixmap.fromImage(image), offset_x, offset_y)
+            self._label_pixmaps[key] = cached
+        return cached
+
+    def draw_label_pixmap(self, painter, label, screen_x, screen_y, widget_height, pixel_ratio):
+        """Blit a pre-rendered label centered on a projected (GL window) point"""
+        pixmap, offset_x, offset_y = label
+
+        # Convert OpenGL screen coords to Qt coords (flip Y)
+        qt_x = int(screen_x / pixel_ratio)
+        qt_y = int((widget_height * pixel_ratio - screen_y) / pixel_ratio)
+
+        painter.drawPixmap(qt_x + offset_x, qt_y + offset_y, pixmap)
 
     def draw_slice_info_overlay(self, painter=None):
         """Draw slice information text overlay in slice mode"""
@@ -694,14 +900,8 @@ class OpenGLWidget(QOpenGLWidget):
         if own_painter:
             painter = QPainter(self)
 
-        # Set up font - larger, bold for visibility
-        font = QFont("Arial", 12, QFont.Weight.Bold)
-        font.setStyleHint(QFont.StyleHint.SansSerif)
-        painter.setFont(font)
-
-        # Set text color - solid white for good contrast
-        text_color = QColor(255, 255, 255, 255)
-        painter.setPen(text_color)
+        painter.setFont(self._info_font)
+        painter.setPen(self._info_color)
 
         # Draw text at the stored position
         x, y = self.slice_info_position
@@ -710,146 +910,367 @@ class OpenGLWidget(QOpenGLWidget):
         if own_painter:
             painter.end()
 
-    def draw_cad_model(self, model_data, is_selected=False):
-        """Draw the actual CAD model using mesh data"""
+    def draw_cad_models(self):
+        """Draw all loaded CAD models, grouped by material"""
+        if not self.models:
+            return
+
+        selected = self.selected_model_index
+
+        glUseProgram(self._mesh_program)
+
+        # Unselected models share one material, so it is set once for all of
+        # them; the selected model follows with its own
+        self.set_mesh_material(self.MODEL_MATERIAL)
+        for i, model_data in enumerate(self.models):
+            if i != selected:
+                self.draw_model_mesh(model_data)
+        if selected is not None:
+            self.set_mesh_material(self.SELECTED_MODEL_MATERIAL)
+            self.draw_model_mesh(self.models[selected])
+
+        glUseProgram(0)
+
+        # BREP edges are drawn by the fixed-function pipeline, with the
+        # line state set once for all models
+        glColor3f(0.0, 0.0, 0.0)  # Black edge color
+        glLineWidth(1.5)
+
+        # Enable line smoothing for better appearance
+        glEnable(GL_LINE_SMOOTH)
+        glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)
+
+        # Enable polygon offset to draw edges on top of faces
+        glEnable(GL_POLYGON_OFFSET_LINE)
+        glPolygonOffset(-1.0, -1.0)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        for model_data in self.models:
+            self.draw_model_edges(model_data)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glDisable(GL_POLYGON_OFFSET_LINE)
+        glDisable(GL_LINE_SMOOTH)
+
+    def set_mesh_material(self, material):
+        """Set the material uniforms of the mesh program (must be in use)"""
+        ambient, diffuse, specular, shininess = material
+        uniforms = self._mesh_uniforms
+        glUniform4f(uniforms['uAmbient'], *ambient)
+        glUniform4f(uniforms['uColor'], *diffuse)
+        glUniform4f(uniforms['uSpecular'], *specular)
+        glUniform1f(uniforms['uShininess'], shininess)
+
+    def set_mesh_lights(self):
+        """Set the scene light uniforms of the mesh program (once per program)"""
+        directions = np.array([light[0] for light in self.LIGHTS], dtype=np.float32)
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        diffuse = np.array([light[1] for light in self.LIGHTS], dtype=np.float32)
+        specular = np.array([light[2] for light in self.LIGHTS], dtype=np.float32)
+
+        program = self._mesh_program
+        glUseProgram(program)
+        glUniform3f(glGetUniformLocation(program, 'uLightAmbient'), *self.AMBIENT_LIGHT)
+        glUniform3fv(glGetUniformLocation(program, 'uLightDir'), len(self.LIGHTS), directions)
+        glUniform3fv(glGetUniformLocation(program, 'uLightColor'), len(self.LIGHTS), diffuse)
+        glUniform3fv(glGetUniformLocation(program, 'uLightSpecular'), len(self.LIGHTS), specular)
+        glUseProgram(0)
+
+    def set_mesh_transform(self, model_matrix, model_normal=None):
+        """Set the matrix uniforms of the mesh program (must be in use)
+
+        Args:
+            model_matrix: 4x4 row-major model to world matrix
+            model_normal: Inverse transpose of its 3x3 part, or None when it
+                has no rotation or scale
+        """
+        mvp = self._view_projection @ model_matrix
+        normal_matrix = self._view_normal
+        if model_normal is not None:
+            normal_matrix = normal_matrix @ model_normal
+
+        uniforms = self._mesh_uniforms
+        glUniformMatrix4fv(uniforms['uMVP'], 1, GL_FALSE, gl_matrix(mvp, np.float32))
+        glUniformMatrix3fv(uniforms['uNormalMat'], 1, GL_FALSE, gl_matrix(normal_matrix, np.float32))
+
+    def draw_model_mesh(self, model_data):
+        """Draw a model's triangles with the mesh program (must be in use)"""
         cad_model = model_data.get('model')
-        model_bounds = model_data.get('bounds')
-        model_center = model_data.get('center')
-        position = model_data.get('position', [0, 0, 0])
-        rotation = model_data.get('rotation', [0, 0, 0])
-        scale = model_data.get('scale', [1, 1, 1])
 
-        if not cad_model or not cad_model.vertices:
+        if not cad_model or not cad_model.has_mesh():
             return
 
-        glPushMatrix()
+        # Matrices for the shader: the camera matrices of this frame combined
+        # with the model placement (cached until the transform changes)
+        self.set_mesh_transform(*self.get_model_transform(model_data))
 
-        # First, apply user transformations (position, rotation, scale)
-        glTranslatef(position[0], position[1], position[2])
+        # Draw from buffers held on the GPU (uploaded once per model)
+        vbo, ibo, index_count, vao = self.get_mesh_buffers(cad_model)
 
-        # Apply model rotation (around its geometric center - same as gizmo position)
-        if model_bounds:
-            min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-            center_x = model_center[0]
-            center_z = model_center[2]
-            # Use geometric center Y (matches gizmo position)
-            center_y = (max_y - min_y) / 2  # Height above build plate
-
-            # Translate to model geometric center for rotation
-            glTranslatef(center_x, center_y, center_z)
-            glRotatef(rotation[2], 0, 0, 1)  # Z rotation
-            glRotatef(rotation[1], 0, 1, 0)  # Y rotation
-            glRotatef(rotation[0], 1, 0, 0)  # X rotation
-            glTranslatef(-center_x, -center_y, -center_z)
-
-        # Apply scale (around model geometric center)
-        if scale != [1, 1, 1]:
-            if model_bounds:
-                center_y = (max_y - min_y) / 2
-                glTranslatef(center_x, center_y, center_z)
-                glScalef(scale[0], scale[1], scale[2])
-                glTranslatef(-center_x, -center_y, -center_z)
-
-        # Then translate so the model sits on top of the build plate
-        # Center it in X and Z, but place bottom at Y=BUILD_PLATE_TOP_Y (top of build plate)
-        if model_bounds:
-            min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-            # Center in X and Z, but align bottom (min_y) to the top of build plate
-            glTranslatef(-model_center[0], self.BUILD_PLATE_TOP_Y - min_y, -model_center[2])
-        else:
-            # Fallback if no bounds
-            glTranslatef(-model_center[0], self.BUILD_PLATE_TOP_Y - model_center[1], -model_center[2])
-
-        # Enable lighting for proper shading
-        glEnable(GL_LIGHTING)
-
-        # Set material properties based on selection state
-        if is_selected:
-            # Blue color for selected model (darker for better contrast)
-            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.15, 0.2, 0.35, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.2, 0.4, 0.8, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.3, 0.4, 0.6, 1.0])
-            glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 30.0)
+        # Draw the triangles with lighting
+        if vao is not None:
+            glBindVertexArray(vao)
+            glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT, None)
+            glBindVertexArray(0)
         else:
-            # Default gray color for unselected models (darker for visibility)
-            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.2, 0.2, 0.2, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.45, 0.45, 0.48, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.25, 0.25, 0.25, 1.0])
-            glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 20.0)
-
-        # Draw using vertex arrays for better performance
-        vertices = cad_model.vertices
-        normals = cad_model.normals
-        indices = cad_model.indices
-
-        # Enable vertex and normal arrays
-        glEnableClientState(GL_VERTEX_ARRAY)
-        glEnableClientState(GL_NORMAL_ARRAY)
+            self.bind_mesh_attributes(vbo, ibo)
+            glDrawElements(GL_TRIANGLES, index_count, GL_UNSIGNED_INT, None)
+            self.unbind_mesh_attributes()
 
-        # Convert to numpy arrays for OpenGL
-        vertex_array = np.array(vertices, dtype=np.float32)
-        normal_array = np.array(normals, dtype=np.float32)
-        index_array = np.array(indices, dtype=np.uint32)
+    def draw_model_edges(self, model_data):
+        """Draw a model's BREP edges for clean outline appearance
 
-        # Set the pointers
-        glVertexPointer(3, GL_FLOAT, 0, vertex_array)
-        glNormalPointer(GL_FLOAT, 0, normal_array)
+        The line state and the vertex array are set up by draw_cad_models.
+        """
+        cad_model = model_data.get('model')
 
-        # Draw the triangles with lighting
-        glDrawElements(GL_TRIANGLES, len(indices), GL_UNSIGNED_INT, index_array)
+        if not cad_model or not len(cad_model.edge_vertices) or not len(cad_model.edge_indices):
+            return
 
-        # Disable face arrays
-        glDisableClientState(GL_VERTEX_ARRAY)
-        glDisableClientState(GL_NORMAL_ARRAY)
+        glPushMatrix()
+        self.apply_model_transform(model_data)
 
-        # Draw BREP edges for clean outline appearance
-        if cad_model.edge_vertices and cad_model.edge_indices:
-            glDisable(GL_LIGHTING)
-            glColor3f(0.0, 0.0, 0.0)  # Black edge color
-            glLineWidth(1.5)
+        # Draw from buffers held on the GPU (uploaded once per model)
+        vbo, ibo, index_count = self.get_edge_buffers(cad_model)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+        glVertexPointer(3, GL_FLOAT, 0, None)
 
-            # Enable line smoothing for better appearance
-            glEnable(GL_LINE_SMOOTH)
-            glHint(GL_LINE_SMOOTH_HINT, GL_NICEST)
+        # Draw edges as lines
+        glDrawElements(GL_LINES, index_count, GL_UNSIGNED_INT, None)
 
-            # Enable polygon offset to draw edges on top of faces
-            glEnable(GL_POLYGON_OFFSET_LINE)
-            glPolygonOffset(-1.0, -1.0)
+        glPopMatrix()
 
-            # Convert edge data to numpy arrays
-            edge_vertex_array = np.array(cad_model.edge_vertices, dtype=np.float32)
-            edge_index_array = np.array(cad_model.edge_indices, dtype=np.uint32)
+    def get_mesh_buffers(self, cad_model):
+        """
+        Get the GPU buffers for a model's mesh, uploading them on first use.
 
-            # Set up vertex array for edges
-            glEnableClientState(GL_VERTEX_ARRAY)
-            glVertexPointer(3, GL_FLOAT, 0, edge_vertex_array)
+        Must be called with the GL context current.
 
-            # Draw edges as lines
-            glDrawElements(GL_LINES, len(cad_model.edge_indices), GL_UNSIGNED_INT, edge_index_array)
+        Returns:
+            (interleaved_vbo, index_buffer, index_count, vao). vao records the
+            attribute layout and is None when the context has no VAO support.
+        """
+        buffers = self._gl_buffers.get(id(cad_model))
+        if buffers is None:
+            if cad_model.interleaved is None:
+                cad_model.pack_buffers()
+
+            vbo, ibo = glGenBuffers(2)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, cad_model.interleaved.nbytes, cad_model.interleaved, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, cad_model.indices_np.nbytes, cad_model.indices_np, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+            # Record the attribute layout once so drawing is a single bind
+            vao = None
+            if self._use_vertex_arrays:
+                vao = glGenVertexArrays(1)
+                glBindVertexArray(vao)
+                self.bind_mesh_attributes(vbo, ibo)
+                glBindVertexArray(0)
+                glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+            buffers = (vbo, ibo, cad_model.indices_np.size, vao)
+            self._gl_buffers[id(cad_model)] = buffers
+        return buffers
+
+    def get_edge_buffers(self, cad_model):
+        """
+        Get the GPU buffers for a model's BREP edges, uploading them on first use.
 
-            glDisableClientState(GL_VERTEX_ARRAY)
-            glDisable(GL_POLYGON_OFFSET_LINE)
-            glDisable(GL_LINE_SMOOTH)
+        Must be called with the GL context current.
 
-        glPopMatrix()
-        
-    def load_cad_model(self, file_path):
-        """Load and prepare CAD model for rendering (synchronous)"""
-        print(f"Loading CAD model from: {file_path}")
+        Returns:
+            (vertex_vbo, index_buffer, index_count)
+        """
+        buffers = self._gl_edge_buffers.get(id(cad_model))
+        if buffers is None:
+            vertices = np.ascontiguousarray(cad_model.edge_vertices, dtype=np.float32)
+            indices = np.ascontiguousarray(cad_model.edge_indices, dtype=np.uint32)
+
+            vbo, ibo = glGenBuffers(2)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+            buffers = (vbo, ibo, indices.size)
+            self._gl_edge_buffers[id(cad_model)] = buffers
+        return buffers
+
+    def get_pick_buffers(self, cad_model):
+        """
+        Get the face picking buffer for a model's mesh, uploading it on first use.
+
+        Each triangle gets its own three vertices so its ID color doesn't
+        leak into neighbours sharing a vertex.
+        Must be called with the GL context current.
+
+        Returns:
+            (vbo, vertex_count): the VBO holds vertex_count float32
+            positions, followed by as many RGBA uint8 colors
+        """
+        buffers = self._gl_pick_buffers.get(id(cad_model))
+        if buffers is None:
+            positions = np.ascontiguousarray(cad_model.vertices[cad_model.indices])
+            num_triangles = len(positions) // 3
+
+            # Encode triangle index as RGB color (starting at 1 to distinguish
+            # from black background), with opaque alpha so each color is a
+            # 4-byte aligned attribute: the little-endian bytes of the ID
+            color_ids = np.arange(1, num_triangles + 1, dtype='<u4') | 0xFF000000
+            colors = np.repeat(color_ids.view(np.uint8).reshape(-1, 4), 3, axis=0)
+
+            vbo = glGenBuffers(1)
+            glBindBuffer(GL_ARRAY_BUFFER, vbo)
+            glBufferData(GL_ARRAY_BUFFER, positions.nbytes + colors.nbytes, None, GL_STATIC_DRAW)
+            glBufferSubData(GL_ARRAY_BUFFER, 0, positions.nbytes, positions)
+            glBufferSubData(GL_ARRAY_BUFFER, positions.nbytes, colors.nbytes, colors)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+            buffers = (vbo, len(positions))
+            self._gl_pick_buffers[id(cad_model)] = buffers
+        return buffers
+
+    def bind_mesh_attributes(self, vbo, ibo):
+        """Bind a mesh's buffers and point the shader attributes at them"""
+        # Positions and normals interleaved, 24-byte stride
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glEnableVertexAttribArray(ATTRIB_POSITION)
+        glEnableVertexAttribArray(ATTRIB_NORMAL)
+        glVertexAttribPointer(ATTRIB_POSITION, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(0))
+        glVertexAttribPointer(ATTRIB_NORMAL, 3, GL_FLOAT, GL_FALSE, 24, ctypes.c_void_p(12))
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+
+    def unbind_mesh_attributes(self):
+        """Undo bind_mesh_attributes so fixed-function draws read from CPU memory again"""
+        glDisableVertexAttribArray(ATTRIB_POSITION)
+        glDisableVertexAttribArray(ATTRIB_NORMAL)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def release_mesh_buffers(self, cad_model):
+        """Free the GPU buffers of a model's mesh, edges and picking, if any were uploaded"""
+        buffers = self._gl_buffers.pop(id(cad_model), None)
+        edge_buffers = self._gl_edge_buffers.pop(id(cad_model), None)
+        pick_buffers = self._gl_pick_buffers.pop(id(cad_model), None)
+        if (buffers is not None or edge_buffers is not None
+                or pick_buffers is not None) and self.context():
+            self.makeCurrent()
+            if buffers is not None:
+                glDeleteBuffers(2, buffers[:2])
+                if buffers[3] is not None:
+                    glDeleteVertexArrays(1, [buffers[3]])
+            if edge_buffers is not None:
+                glDeleteBuffers(2, edge_buffers[:2])
+            if pick_buffers is not None:
+                glDeleteBuffers(1, [pick_buffers[0]])
+            self.doneCurrent()
+
+    def apply_model_transform(self, model_data):
+        """Multiply the current matrix by the model's placement transform
+
+        Places the model on the build plate and applies the user position,
+        rotation and scale. Shared by rendering and picking so both agree.
+        """
+        glMultMatrixf(self.get_model_matrix(model_data))
+
+    def get_model_matrix(self, model_data):
+        """Get the model's placement matrix, rebuilding it only when marked dirty
+
+        Returns:
+            4x4 float32 array in OpenGL (column-major) order
+        """
+        self.refresh_model_matrix(model_data)
+        return model_data['_xform_matrix']
+
+    def get_model_transform(self, model_data):
+        """Get the model's placement for the shader, rebuilding it only when marked dirty
+
+        Returns:
+            (world, normal): 4x4 row-major model to world matrix and the
+            inverse transpose of its 3x3 part
+        """
+        self.refresh_model_matrix(model_data)
+        return model_data['_xform_world'], model_data['_xform_normal']
+
+    def refresh_model_matrix(self, model_data):
+        """Rebuild the model's cached placement matrices if its transform changed"""
+        if model_data.get('_xform_dirty', True) or model_data.get('_xform_matrix') is None:
+            world = self.compute_model_matrix(model_data)
+            model_data['_xform_world'] = world
+            model_data['_xform_normal'] = np.linalg.inv(world[:3, :3]).T
+            # OpenGL expects column-major storage
+            model_data['_xform_matrix'] = gl_matrix(world, np.float32)
+            model_data['_xform_dirty'] = False
+
+    def mark_transform_dirty(self, model_data):
+        """Flag a model's cached matrix for rebuild after position/rotation/scale changes"""
+        model_data['_xform_dirty'] = True
+
+    def compute_model_matrix(self, model_data):
+        """Compose the model placement transform
+
+        Equivalent to the fixed-function sequence: translate by position,
+        rotate Z/Y/X and scale about the geometric center, then drop the
+        model onto the build plate centered in X and Z.
+
+        Returns:
+            4x4 row-major float64 array
+        """
+        model_bounds = model_data.get('bounds')
+        model_center = model_data.get('center')
+        position = model_data.get('position', [0, 0, 0])
+        rotation = model_data.get('rotation', [0, 0, 0])
+        scale = model_data.get('scale', [1, 1, 1])
 
-        # Load the CAD file and extract mesh data
-        model = load_cad_file(file_path)
+        # First, apply user transformations (position, rotation, scale)
+        matrix = translation_matrix(position[0], position[1], position[2])
 
-        if model:
-            return self.add_loaded_model(model, file_path)
+        if model_bounds:
+            min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
+            center_x = model_center[0]
+            center_z = model_center[2]
+            # Use geometric center Y (matches gizmo position)
+            center_y = model_data['half_y']  # Height above build plate
+            to_center = translation_matrix(center_x, center_y, center_z)
+            from_center = translation_matrix(-center_x, -center_y, -center_z)
+
+            # Model rotation around its geometric center (Z, then Y, then X)
+            matrix = (matrix @ to_center @ rotation_matrix(rotation[2], 0.0, 0.0, 1.0)
+                      @ rotation_matrix(rotation[1], 0.0, 1.0, 0.0)
+                      @ rotation_matrix(rotation[0], 1.0, 0.0, 0.0)
+                      @ from_center)
+
+            # Scale around the geometric center
+            if list(scale) != [1, 1, 1]:
+                matrix = matrix @ to_center @ scale_matrix(scale[0], scale[1], scale[2]) @ from_center
+
+            # Center in X and Z, and align bottom (min_y) to the top of build plate
+            matrix = matrix @ translation_matrix(-model_center[0], self.BUILD_PLATE_TOP_Y - min_y,
+                                                 -model_center[2])
         else:
-            print("Failed to load CAD model")
-            return None
+            # Fallback if no bounds
+            matrix = matrix @ translation_matrix(-model_center[0], self.BUILD_PLATE_TOP_Y - model_center[1],
+                                                 -model_center[2])
+
+        return matrix
 
     def add_loaded_model(self, model, file_path):
         """
         Add an already-loaded CAD model to the scene.
 
+        Files are parsed off the GUI thread by workers.CADLoadWorker; only
+        this cheap registration step runs on it.
+
         Args:
             model: CADModel instance
             file_path: Path to the original CAD file
@@ -864,42 +1285,93 @@ class OpenGLWidget(QOpenGLWidget):
         import os
         filename = os.path.basename(file_path)
 
+        # Bounds never change after loading, so derive the gizmo placement
+        # from them once here
+        if model.bounds:
+            min_x, min_y, min_z, max_x, max_y, max_z = model.bounds
+            dims = (max_x - min_x, max_y - min_y, max_z - min_z)
+            gizmo_scale = max(max(dims) * 0.5, 20.0)
+        else:
+            dims = gizmo_scale = None
+
         # Create model data dictionary
         model_data = {
+            'id': next(self._model_ids),  # Stable identity, unlike the list index
             'model': model,
             'name': filename,
             'path': file_path,
             'center': model.get_center(),
             'bounds': model.bounds,
-            # Transformation properties
-            'position': [0.0, 0.0, 0.0],  # Translation offset from auto-centered position
-            'rotation': [0.0, 0.0, 0.0],  # Rotation in degrees around X, Y, Z
-            'scale': [1.0, 1.0, 1.0]  # Scale factors for X, Y, Z
+            'bvh': model.bvh,  # Picking acceleration structure (may be None)
+            'dims': dims,  # (X, Y, Z) extent of the bounds, or None
+            'half_y': dims[1] / 2 if dims else 0.0,  # Geometric center height above the plate
+            'gizmo_scale': gizmo_scale,  # Gizmo size, or None without bounds
+            # Transformation properties, float64 arrays of 3 that are
+            # updated in place
+            'position': np.zeros(3),  # Translation offset from auto-centered position
+            'rotation': np.zeros(3),  # Rotation in degrees around X, Y, Z
+            'scale': np.ones(3),  # Scale factors for X, Y, Z
+            # Cached placement matrices, rebuilt when the transform is marked dirty
+            '_xform_dirty': True,
+            '_xform_matrix': None,  # GL (column-major) order, for glMultMatrixf
+            '_xform_world': None,  # Row-major, for the mesh shader and picking
+            '_xform_normal': None,  # Inverse transpose of the world 3x3
+            # (transform, vertices) kept by SlicingWorker._world_vertices
+            '_world_verts_cache': None
         }
 
         # Add to models list
         self.models.append(model_data)
+        self.models_by_id[model_data['id']] = model_data
 
-        print(f"Model added successfully: {filename}")
-        print(f"Model bounds: {model.bounds}")
+        logger.info("Model added successfully: %s", filename)
+        logger.debug("Model bounds: %s", model.bounds)
 
         self.update()  # Trigger repaint
 
         # Return the index of the newly added model
         return len(self.models) - 1
 
+    def get_model_by_id(self, model_id):
+        """Get model data by stable id, or None if it no longer exists"""
+        if model_id is None:
+            return None
+        return self.models_by_id.get(model_id)
+
+    def model_index(self, model_data):
+        """Get the list index of a model, found by identity
+
+        list.index would compare model dicts with ==, which is ambiguous
+        once it reaches their numpy arrays.
+        """
+        return next(i for i, other in enumerate(self.models) if other is model_data)
+
+    def get_selected_model(self):
+        """Get the currently selected model data, or None"""
+        if self.selected_model_index is None:
+            return None
+        return self.models[self.selected_model_index]
+
+    def set_selected_model_by_id(self, model_id):
+        """Set the selected model by stable id (None clears the selection)"""
+        model_data = self.get_model_by_id(model_id)
+        index = self.model_index(model_data) if model_data is not None else None
+        self.set_selected_model(index)
+
     def set_selected_model(self, index):
         """Set the selected model by index"""
         if index is not None and 0 <= index < len(self.models):
             self.selected_model_index = index
         else:
             self.selected_model_index = None
+        self.selection_changed.emit(self.selected_model_index is not None)
         self.update()  # Trigger repaint
 
     def set_transform_mode(self, mode):
         """Set the transformation mode ('move', 'rotate', 'scale', or None)"""
         self.transform_mode = mode
         self.selected_gizmo_axis = None
+        self.drag_axis_direction = None
         self.update()  # Trigger repaint
 
     def draw_gizmo(self, model_data):
@@ -907,27 +1379,14 @@ class OpenGLWidget(QOpenGLWidget):
         if not model_data:
             return
 
-        # Get model center position
-        model_bounds = model_data.get('bounds')
-        model_center = model_data.get('center')
-        position = model_data.get('position', [0, 0, 0])
-
-        if not model_bounds:
+        # Gizmo at the geometric center of the model, sized to the model
+        placement = self.gizmo_placement(model_data)
+        if placement is None:
             return
+        (gizmo_x, gizmo_y, gizmo_z), gizmo_scale = placement
 
-        min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-
-        # Calculate gizmo position at the geometric center of the model
-        # Model center is in model's local coordinates, we need world coordinates
-        # The model is centered at (0, 0, 0) in X and Z, and sits on Y=0
-        # So the actual center in world space is:
-        gizmo_x = position[0]  # X offset
-        gizmo_y = position[1] + (max_y - min_y) / 2  # Y position at geometric center
-        gizmo_z = position[2]  # Z offset
-
-        # Calculate appropriate gizmo size based on model dimensions
-        model_size = max(max_x - min_x, max_y - min_y, max_z - min_z)
-        gizmo_scale = max(model_size * 0.5, 20.0)  # At least 20mm, or 50% of model size
+        # Screen area for the hover early-out, from this frame's matrices
+        self._gizmo_screen_bbox = (self._modelview, self.gizmo_screen_bbox(*placement))
 
         # Draw appropriate gizmo based on mode
         if self.transform_mode == 'move' or self.transform_mode == 'scale':
@@ -935,146 +1394,191 @@ class OpenGLWidget(QOpenGLWidget):
         elif self.transform_mode == 'rotate':
             self.draw_rotation_rings(gizmo_x, gizmo_y, gizmo_z, gizmo_scale)
 
+    @staticmethod
+    def gizmo_matrix(x, y, z, scale):
+        """Get the GL-order placement of a unit gizmo centered at (x, y, z)"""
+        return gl_matrix(translation_matrix(x, y, z) @ scale_matrix(scale, scale, scale))
+
     def draw_arrow_triad(self, x, y, z, scale=30.0):
         """Draw 3-axis arrow triad for move/scale gizmos"""
         glPushMatrix()
-        glTranslatef(x, y, z)
+        glMultMatrixd(self.gizmo_matrix(x, y, z, scale))  # Scale the unit arrows to model size
 
-        # Disable lighting for gizmo (flat shading)
-        glDisable(GL_LIGHTING)
         glLineWidth(3.0)
 
-        arrow_length = scale  # Scale arrow to model size
-        arrow_head_length = scale * 0.15
-        arrow_head_radius = scale * 0.06
-
-        # X axis - Light gray or white if hovered
-        if self.hovered_gizmo_axis == 'x':
-            glColor3f(1.0, 1.0, 1.0)  # White when hovered
-        else:
-            glColor3f(0.7, 0.7, 0.7)  # Gray normally
-        self.draw_arrow([0, 0, 0], [arrow_length, 0, 0], arrow_head_length, arrow_head_radius)
+        glBindBuffer(GL_ARRAY_BUFFER, self._arrow_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
 
-        # Y axis - Light gray or white if hovered
-        if self.hovered_gizmo_axis == 'y':
-            glColor3f(1.0, 1.0, 1.0)
-        else:
-            glColor3f(0.7, 0.7, 0.7)
-        self.draw_arrow([0, 0, 0], [0, arrow_length, 0], arrow_head_length, arrow_head_radius)
+        # Light gray, or white if hovered. Each arrow is its shaft line
+        # followed by its head triangles.
+        for i, axis in enumerate(('x', 'y', 'z')):
+            if self.hovered_gizmo_axis == axis:
+                glColor3f(1.0, 1.0, 1.0)  # White when hovered
+            else:
+                glColor3f(0.7, 0.7, 0.7)  # Gray normally
+            first = i * self.GIZMO_ARROW_VERTICES
+            glDrawArrays(GL_LINES, first, 2)
+            glDrawArrays(GL_TRIANGLES, first + 2, self.GIZMO_ARROW_VERTICES - 2)
 
-        # Z axis - Light gray or white if hovered
-        if self.hovered_gizmo_axis == 'z':
-            glColor3f(1.0, 1.0, 1.0)
-        else:
-            glColor3f(0.7, 0.7, 0.7)
-        self.draw_arrow([0, 0, 0], [0, 0, arrow_length], arrow_head_length, arrow_head_radius)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
-        glEnable(GL_LIGHTING)
         glPopMatrix()
 
-    def draw_arrow(self, start, end, head_length, head_radius):
-        """Draw a single arrow from start to end"""
-        # Draw line
-        glBegin(GL_LINES)
-        glVertex3f(start[0], start[1], start[2])
-        glVertex3f(end[0], end[1], end[2])
-        glEnd()
+    @staticmethod
+    def arrow_vertices(start, end, head_length, head_radius):
+        """
+        Build a single arrow from start to end.
 
-        # Draw arrowhead (simplified cone)
-        direction = np.array(end) - np.array(start)
-        length = np.linalg.norm(direction)
-        if length == 0:
-            return
+        Returns:
+            List of GIZMO_ARROW_VERTICES points: the shaft as a line
+            (start, end), then the arrowhead as 4 triangles
+        """
+        # Arrowhead (simplified cone), in scalar math since these are
+        # single 3-vectors
+        sx, sy, sz = start
+        ex, ey, ez = end
+        length = math.sqrt((ex - sx) ** 2 + (ey - sy) ** 2 + (ez - sz) ** 2)
 
-        direction = direction / length
+        dx, dy, dz = (ex - sx) / length, (ey - sy) / length, (ez - sz) / length
 
         # Position arrowhead
-        head_base = np.array(end) - direction * head_length
-
-        # Draw simple pyramid for arrowhead
-        perpendicular = np.cross(direction, [0, 1, 0] if abs(direction[1]) < 0.9 else [1, 0, 0])
-        perpendicular = perpendicular / np.linalg.norm(perpendicular) * head_radius
+        hx, hy, hz = ex - dx * head_length, ey - dy * head_length, ez - dz * head_length
 
-        glBegin(GL_TRIANGLES)
-        # Draw 4 triangular faces
+        # Draw simple pyramid for arrowhead: perpendicular = direction x up,
+        # with up = Y unless the arrow is nearly vertical (then X)
+        if abs(dy) < 0.9:
+            px, py, pz = -dz, 0.0, dx
+        else:
+            px, py, pz = 0.0, dz, -dy
+        scale = head_radius / math.sqrt(px * px + py * py + pz * pz)
+        px, py, pz = px * scale, py * scale, pz * scale
+        bx, by, bz = dy * pz - dz * py, dz * px - dx * pz, dx * py - dy * px
+
+        # Base corners at 0, 90, 180 and 270 degrees; the last one repeats
+        # the first to close the pyramid
+        corners = [(hx + px * c + bx * s, hy + py * c + by * s, hz + pz * c + bz * s)
+                   for c, s in ((1, 0), (0, 1), (-1, 0), (0, -1), (1, 0))]
+
+        vertices = [tuple(start), tuple(end)]
+        # 4 triangular faces
         for i in range(4):
-            angle1 = (i / 4.0) * 2 * np.pi
-            angle2 = ((i + 1) / 4.0) * 2 * np.pi
-
-            p1 = head_base + perpendicular * np.cos(angle1) + np.cross(direction, perpendicular) * np.sin(angle1)
-            p2 = head_base + perpendicular * np.cos(angle2) + np.cross(direction, perpendicular) * np.sin(angle2)
-
-            glVertex3fv(end)
-            glVertex3fv(p1)
-            glVertex3fv(p2)
-        glEnd()
+            vertices += [tuple(end), corners[i], corners[i + 1]]
+        return vertices
 
     def draw_rotation_rings(self, x, y, z, scale=35.0):
         """Draw 3-axis rotation rings for rotate gizmo"""
         glPushMatrix()
-        glTranslatef(x, y, z)
-
-        # Disable lighting for gizmo
-        glDisable(GL_LIGHTING)
-
-        ring_radius = scale  # Scale ring to model size
-        segments = 64
+        glMultMatrixd(self.gizmo_matrix(x, y, z, scale))  # Scale the unit rings to model size
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._ring_vbo)
+
+        # Each ring rotates around its axis - light gray, or white if
+        # hovered. Recolor the buffer only when the hovered ring changes.
+        ring_vertices = self.GIZMO_RING_SEGMENTS + 1
+        axes = ('x', 'y', 'z')
+        hovered = self.hovered_gizmo_axis if self.hovered_gizmo_axis in axes else None
+        if hovered != self._ring_highlight:
+            self._ring_vertices[:, 3:6] = 0.7
+            if hovered is not None:
+                first = axes.index(hovered) * ring_vertices
+                self._ring_vertices[first:first + ring_vertices, 3:6] = 1.0
+            glBufferSubData(GL_ARRAY_BUFFER, 0, self._ring_vertices.nbytes, self._ring_vertices)
+            self._ring_highlight = hovered
 
-        # X axis ring (rotates around X) - Light gray or white if hovered
-        if self.hovered_gizmo_axis == 'x':
-            glLineWidth(4.0)
-            glColor3f(1.0, 1.0, 1.0)
-        else:
-            glLineWidth(2.0)
-            glColor3f(0.7, 0.7, 0.7)
-        glBegin(GL_LINE_LOOP)
-        for i in range(segments):
-            angle = (i / segments) * 2.0 * np.pi
-            y_pos = ring_radius * np.cos(angle)
-            z_pos = ring_radius * np.sin(angle)
-            glVertex3f(0, y_pos, z_pos)
-        glEnd()
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 24, ctypes.c_void_p(0))
+        glColorPointer(3, GL_FLOAT, 24, ctypes.c_void_p(12))
 
-        # Y axis ring (rotates around Y) - Light gray or white if hovered
-        if self.hovered_gizmo_axis == 'y':
+        # All rings in one draw, then the hovered one again thicker
+        glLineWidth(2.0)
+        glMultiDrawArrays(GL_LINE_STRIP, self._ring_firsts, self._ring_counts, len(axes))
+        if hovered is not None:
             glLineWidth(4.0)
-            glColor3f(1.0, 1.0, 1.0)
-        else:
-            glLineWidth(2.0)
-            glColor3f(0.7, 0.7, 0.7)
-        glBegin(GL_LINE_LOOP)
-        for i in range(segments):
-            angle = (i / segments) * 2.0 * np.pi
-            x_pos = ring_radius * np.cos(angle)
-            z_pos = ring_radius * np.sin(angle)
-            glVertex3f(x_pos, 0, z_pos)
-        glEnd()
+            glDrawArrays(GL_LINE_STRIP, axes.index(hovered) * ring_vertices, ring_vertices)
 
-        # Z axis ring (rotates around Z) - Light gray or white if hovered
-        if self.hovered_gizmo_axis == 'z':
-            glLineWidth(4.0)
-            glColor3f(1.0, 1.0, 1.0)
-        else:
-            glLineWidth(2.0)
-            glColor3f(0.7, 0.7, 0.7)
-        glBegin(GL_LINE_LOOP)
-        for i in range(segments):
-            angle = (i / segments) * 2.0 * np.pi
-            x_pos = ring_radius * np.cos(angle)
-            y_pos = ring_radius * np.sin(angle)
-            glVertex3f(x_pos, y_pos, 0)
-        glEnd()
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
-        glEnable(GL_LIGHTING)
         glPopMatrix()
 
+    @staticmethod
+    def ring_strip_vertices(segments):
+        """
+        Build the unit rotation rings as line strips.
+
+        Returns:
+            float32 array (3, segments + 1, 3): the rings around X (YZ
+            plane), Y (XZ plane) and Z (XY plane), each closing back on
+            its first point
+        """
+        circle = unit_circle(segments)
+        vertices = np.zeros((3, segments + 1, 3), dtype=np.float32)
+        vertices[0][:, [1, 2]] = circle  # Around X
+        vertices[1][:, [0, 2]] = circle  # Around Y
+        vertices[2][:, [0, 1]] = circle  # Around Z
+        return vertices
+
+    def upload_gizmo_rings(self):
+        """
+        Upload the unit-size rotate gizmo rings, all three in one buffer.
+
+        Must be called with the GL context current.
+
+        Returns:
+            (vbo, vertices): the buffer and its float32 (N, 6) contents,
+            a line strip of GIZMO_RING_SEGMENTS + 1 interleaved
+            position/color vertices per axis (X, Y, Z), all light gray
+        """
+        positions = self.ring_strip_vertices(self.GIZMO_RING_SEGMENTS).reshape(-1, 3)
+        vertices = np.empty((len(positions), 6), dtype=np.float32)
+        vertices[:, :3] = positions
+        vertices[:, 3:] = 0.7
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vbo, vertices
+
+    def upload_gizmo_arrows(self):
+        """
+        Upload the unit-size move/scale gizmo arrows, all three in one buffer.
+
+        draw_arrow_triad scales them to the model with gizmo_matrix, so the
+        geometry is built once instead of every frame.
+        Must be called with the GL context current.
+
+        Returns:
+            VBO with GIZMO_ARROW_VERTICES vertices per axis (X, Y, Z)
+        """
+        vertices = np.array(
+            [self.arrow_vertices((0, 0, 0), tip, 0.15, 0.06) for tip in np.eye(3)],
+            dtype=np.float32)
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vbo
+
+    def remove_model_by_id(self, model_id):
+        """Remove a model from the scene by stable id"""
+        model_data = self.get_model_by_id(model_id)
+        if model_data is not None:
+            self.remove_model(self.model_index(model_data))
+
     def remove_model(self, index):
         """Remove a model from the scene"""
         if 0 <= index < len(self.models):
-            self.models.pop(index)
+            model_data = self.models.pop(index)
+            self.models_by_id.pop(model_data['id'], None)
+            self.release_mesh_buffers(model_data['model'])
             # Adjust selected index if needed
             if self.selected_model_index == index:
                 self.selected_model_index = None
+                self.selection_changed.emit(False)
             elif self.selected_model_index is not None and self.selected_model_index > index:
                 self.selected_model_index -= 1
             self.update()  # Trigger repaint
@@ -1084,7 +1588,7 @@ class OpenGLWidget(QOpenGLWidget):
         if self.context():
             self.makeCurrent()
             glClearColor(r, g, b, 1.0)
-            self.update()  # Trigger repaint with new background color
+            self.schedule_update()  # Trigger repaint with new background color
 
     def reset_view(self):
         """Reset camera view to defaults"""
@@ -1145,6 +1649,10 @@ class OpenGLWidget(QOpenGLWidget):
                         self.transform_start_value = model_data['rotation'].copy()
                     elif self.transform_mode == 'scale':
                         self.transform_start_value = model_data['scale'].copy()
+
+                    # The camera can't move during the drag, so the axis
+                    # keeps its screen direction
+                    self.drag_axis_direction = self.get_axis_screen_direction(self.selected_gizmo_axis)
             else:
                 # Normal camera controls (only in layout mode)
                 if self.view_mode == 'layout':
@@ -1160,6 +1668,11 @@ class OpenGLWidget(QOpenGLWidget):
 
             self.last_mouse_pos = event.pos()
 
+    def schedule_update(self):
+        """Request a repaint, coalescing bursts of requests into one per REPAINT_INTERVAL_MS"""
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
     def mouseMoveEvent(self, event):
         """Handle mouse move events for rotation, panning, zooming, and gizmo interaction"""
         from PyQt6.QtCore import Qt
@@ -1170,7 +1683,7 @@ class OpenGLWidget(QOpenGLWidget):
             was_hover = self.scrollbar_hover
             self.scrollbar_hover = self.is_point_in_scrollbar(event.pos().x(), event.pos().y())
             if was_hover != self.scrollbar_hover:
-                self.update()
+                self.schedule_update()
 
             # Handle scrollbar dragging
             if self.scrollbar_dragging:
@@ -1190,7 +1703,7 @@ class OpenGLWidget(QOpenGLWidget):
                 self.apply_transformation(dx, dy)
 
             self.last_mouse_pos = event.pos()
-            self.update()
+            self.schedule_update()
             return  # Don't process camera controls when dragging gizmo
 
         # Normal camera controls (only if we have a valid interaction mode)
@@ -1223,7 +1736,7 @@ class OpenGLWidget(QOpenGLWidget):
             self.last_mouse_pos = event.pos()
 
             # Trigger repaint
-            self.update()
+            self.schedule_update()
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events"""
@@ -1237,6 +1750,7 @@ class OpenGLWidget(QOpenGLWidget):
             self.is_zooming = False
             self.is_dragging_gizmo = False
             self.selected_gizmo_axis = None
+            self.drag_axis_direction = None
             self.scrollbar_dragging = False
             self.last_mouse_pos = None
 
@@ -1244,7 +1758,7 @@ class OpenGLWidget(QOpenGLWidget):
                 self.transformation_changed.emit()
 
     def update_gizmo_hover(self, mouse_pos):
-        """Update which gizmo axis is hovered using color-coded picking (pixel-perfect)"""
+        """Update which gizmo axis is hovered by ray casting against the gizmo"""
         if not self.transform_mode or self.selected_model_index is None:
             self.hovered_gizmo_axis = None
             return
@@ -1258,323 +1772,161 @@ class OpenGLWidget(QOpenGLWidget):
 
         old_hover = self.hovered_gizmo_axis
 
-        # Perform color-coded picking
-        picked_axis = self.pick_gizmo_axis(mouse_pos.x(), mouse_pos.y())
+        # Most moves are nowhere near the gizmo: skip picking while the
+        # cursor is outside the gizmo's screen area in the frame on screen
+        mouse_x, mouse_y = mouse_pos.x(), mouse_pos.y()
+        frame_view, bbox = self._gizmo_screen_bbox
+        if frame_view is self._modelview and bbox is not None:
+            pixel_ratio = self.devicePixelRatio()
+            pixel_x = mouse_x * pixel_ratio
+            pixel_y = self._viewport[3] - mouse_y * pixel_ratio - 1
+            x0, y0, x1, y1 = bbox
+            if not (x0 <= pixel_x <= x1 and y0 <= pixel_y <= y1):
+                self.hovered_gizmo_axis = None
+                self._hover_pick_key = None
+                if old_hover is not None:
+                    self.schedule_update()
+                return
+
+        # Reuse the last pick while the cursor stays within a couple of
+        # pixels of it and nothing was redrawn since (a new frame has a new
+        # view matrix object)
+        last = self._hover_pick_key
+        if (last is not None and last[2] is self._modelview
+                and abs(mouse_x - last[0]) <= self.HOVER_PICK_SLOP
+                and abs(mouse_y - last[1]) <= self.HOVER_PICK_SLOP):
+            return
+        self._hover_pick_key = (mouse_x, mouse_y, self._modelview)
+
+        # Perform picking
+        picked_axis = self.pick_gizmo_axis(mouse_x, mouse_y)
         self.hovered_gizmo_axis = picked_axis
 
         # Trigger update if hover changed
         if old_hover != self.hovered_gizmo_axis:
-            self.update()
+            self.schedule_update()
 
     def pick_gizmo_axis(self, mouse_x, mouse_y):
-        """Pick gizmo axis using color-coded rendering"""
+        """Pick gizmo axis by intersecting the mouse ray with the gizmo shapes
+
+        Pure CPU geometry against the last frame's matrices: the arrows are
+        tested as segments, the rings as the line segments they are drawn
+        with. Each shape is hit within its picking radius, widened to at
+        least GIZMO_PICK_TOLERANCE pixels, and the hit nearest the camera wins.
+        """
         if self.selected_model_index is None:
             return None
 
-        self.makeCurrent()
+        placement = self.gizmo_placement(self.models[self.selected_model_index])
+        if placement is None:
+            return None
+        center, scale = placement
 
-        # Get device pixel ratio for HiDPI displays
+        # Mouse ray in world space (flip Y for OpenGL coordinate system)
         pixel_ratio = self.devicePixelRatio()
-        actual_x = int(mouse_x * pixel_ratio)
-        actual_y = int(mouse_y * pixel_ratio)
-
-        # Save current state
-        glPushAttrib(GL_ALL_ATTRIB_BITS)
-
-        # Clear with black (no axis)
-        glClearColor(0.0, 0.0, 0.0, 1.0)
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-
-        # Set up projection and modelview matrices (same as paintGL)
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        width = self.width()
-        height = self.height()
-        if height == 0:
-            height = 1
-        gluPerspective(45.0, width / height, 0.1, 1000.0)
-
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        glTranslatef(0.0, 0.0, -self.camera_distance)
-        glTranslatef(self.pan_x, self.pan_y, 0.0)
-        glRotatef(self.rotation_x, 1.0, 0.0, 0.0)
-        glRotatef(self.rotation_y, 0.0, 1.0, 0.0)
-        glRotatef(self.rotation_z, 0.0, 0.0, 1.0)
-
-        # Disable everything that could affect colors
-        glDisable(GL_LIGHTING)
-        glDisable(GL_TEXTURE_2D)
-        glDisable(GL_BLEND)
-        glDisable(GL_DITHER)
-        glDisable(GL_FOG)
-        glDisable(GL_LINE_SMOOTH)
-        glDisable(GL_POLYGON_SMOOTH)
-        glShadeModel(GL_FLAT)
-
-        # Draw gizmo with picking colors
-        model_data = self.models[self.selected_model_index]
-        self.draw_gizmo_for_picking(model_data)
-
-        glFlush()
-        glFinish()
-
-        # Read pixel at mouse position (flip Y for OpenGL coordinate system)
-        fb_height = int(height * pixel_ratio)
-        pixel_y = fb_height - actual_y - 1
-
-        # Read pixel - glReadPixels returns a numpy array or bytes
-        pixel_data = glReadPixels(actual_x, pixel_y, 1, 1, GL_RGB, GL_UNSIGNED_BYTE)
-
-        # Restore state
-        glPopAttrib()
-
-        # Restore background color
-        glClearColor(0.7, 0.7, 0.7, 1.0)
-
-        # Parse pixel data - handle both numpy array and bytes formats
-        r, g, b = 0, 0, 0
-        if pixel_data is not None:
-            # Convert to flat array/bytes
-            if hasattr(pixel_data, 'flatten'):
-                flat = pixel_data.flatten()
-                if len(flat) >= 3:
-                    r, g, b = int(flat[0]), int(flat[1]), int(flat[2])
-            elif len(pixel_data) >= 3:
-                r, g, b = int(pixel_data[0]), int(pixel_data[1]), int(pixel_data[2])
-
-        # Determine which axis was picked based on color
-        # Color thresholds (allow some tolerance)
-        threshold = 50
-
-        if r > threshold and g < threshold and b < threshold:
-            return 'x'  # Red = X axis
-        elif g > threshold and r < threshold and b < threshold:
-            return 'y'  # Green = Y axis
-        elif b > threshold and r < threshold and g < threshold:
-            return 'z'  # Blue = Z axis
-
-        return None
-
-    def draw_gizmo_for_picking(self, model_data):
-        """Draw gizmo with color-coded axes for picking"""
-        if not model_data:
-            return
-
-        model_bounds = model_data.get('bounds')
-        position = model_data.get('position', [0, 0, 0])
-
-        if not model_bounds:
-            return
-
-        min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-
-        # Calculate gizmo position (same as draw_gizmo)
-        gizmo_x = position[0]
-        gizmo_y = position[1] + (max_y - min_y) / 2
-        gizmo_z = position[2]
-
-        # Calculate gizmo size
-        model_size = max(max_x - min_x, max_y - min_y, max_z - min_z)
-        gizmo_scale = max(model_size * 0.5, 20.0)
-
-        # Draw appropriate gizmo based on mode
-        if self.transform_mode == 'move' or self.transform_mode == 'scale':
-            self.draw_arrow_triad_for_picking(gizmo_x, gizmo_y, gizmo_z, gizmo_scale)
+        pixel_x = int(mouse_x * pixel_ratio)
+        win_y = self._viewport[3] - int(mouse_y * pixel_ratio) - 1
+        try:
+            near, far = unproject_points([(pixel_x, win_y, 0.0), (pixel_x, win_y, 1.0)],
+                                         self._modelview, self._projection, self._viewport)
+            # World size of one pixel at the gizmo's depth
+            center_window = project_points([center], self._modelview, self._projection, self._viewport)[0]
+            if not np.all(np.isfinite(center_window)):
+                return None
+            a, b = unproject_points([center_window, center_window + (1.0, 0.0, 0.0)],
+                                    self._modelview, self._projection, self._viewport)
+        except np.linalg.LinAlgError:
+            return None
+        min_radius = self.GIZMO_PICK_TOLERANCE * np.linalg.norm(b - a)
+
+        # Gizmo shapes as world-space segments, with one picking radius each
+        axes = ('x', 'y', 'z')
+        if self.transform_mode in ('move', 'scale'):
+            # Shaft and head of each arrow (the head is the last 20%)
+            unit = np.eye(3)
+            starts = np.concatenate((np.zeros((3, 3)), unit * 0.8)) * scale + center
+            ends = np.concatenate((unit * 0.8, unit)) * scale + center
+            radii = np.repeat((0.04 * scale, 0.1 * scale), 3)
+            segment_axes = np.tile(np.arange(3), 2)
         elif self.transform_mode == 'rotate':
-            self.draw_rotation_rings_for_picking(gizmo_x, gizmo_y, gizmo_z, gizmo_scale)
-
-    def draw_arrow_triad_for_picking(self, x, y, z, scale=30.0):
-        """Draw 3-axis arrow triad with picking colors (RGB = XYZ)"""
-        glPushMatrix()
-        glTranslatef(x, y, z)
-
-        # Use thicker lines for better picking
-        glLineWidth(8.0)
-
-        arrow_length = scale
-        arrow_head_length = scale * 0.2  # Larger head for picking
-        arrow_head_radius = scale * 0.1
-
-        # X axis - RED
-        glColor3f(1.0, 0.0, 0.0)
-        self.draw_arrow_for_picking([0, 0, 0], [arrow_length, 0, 0], arrow_head_length, arrow_head_radius)
-
-        # Y axis - GREEN
-        glColor3f(0.0, 1.0, 0.0)
-        self.draw_arrow_for_picking([0, 0, 0], [0, arrow_length, 0], arrow_head_length, arrow_head_radius)
-
-        # Z axis - BLUE
-        glColor3f(0.0, 0.0, 1.0)
-        self.draw_arrow_for_picking([0, 0, 0], [0, 0, arrow_length], arrow_head_length, arrow_head_radius)
-
-        glPopMatrix()
-
-    def draw_arrow_for_picking(self, start, end, head_length, head_radius):
-        """Draw a single arrow for picking (thicker geometry)"""
-        direction = np.array(end) - np.array(start)
-        length = np.linalg.norm(direction)
-        if length == 0:
-            return
-
-        direction = direction / length
-
-        # Create perpendicular vectors for cylinder
-        up = np.array([0, 1, 0]) if abs(direction[1]) < 0.9 else np.array([1, 0, 0])
-        perp1 = np.cross(direction, up)
-        perp1 = perp1 / np.linalg.norm(perp1)
-        perp2 = np.cross(direction, perp1)
-
-        # Draw cylinder (shaft) as a quad strip for better picking
-        shaft_radius = head_radius * 0.4
-        shaft_end = np.array(end) - direction * head_length
-        segments = 8
-
-        glBegin(GL_QUAD_STRIP)
-        for i in range(segments + 1):
-            angle = (i / segments) * 2 * np.pi
-            offset = (perp1 * np.cos(angle) + perp2 * np.sin(angle)) * shaft_radius
-            glVertex3fv(np.array(start) + offset)
-            glVertex3fv(shaft_end + offset)
-        glEnd()
-
-        # Draw arrowhead as cone
-        head_base = np.array(end) - direction * head_length
-
-        # Draw cone with triangles
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3fv(end)  # Tip
-        for i in range(segments + 1):
-            angle = (i / segments) * 2 * np.pi
-            offset = (perp1 * np.cos(angle) + perp2 * np.sin(angle)) * head_radius
-            glVertex3fv(head_base + offset)
-        glEnd()
-
-        # Draw base of cone
-        glBegin(GL_TRIANGLE_FAN)
-        glVertex3fv(head_base)  # Center
-        for i in range(segments + 1):
-            angle = ((segments - i) / segments) * 2 * np.pi  # Reverse winding
-            offset = (perp1 * np.cos(angle) + perp2 * np.sin(angle)) * head_radius
-            glVertex3fv(head_base + offset)
-        glEnd()
+            rings = self.ring_strip_vertices(self.GIZMO_RING_SEGMENTS) * scale + center
+            starts, ends = rings[:, :-1].reshape(-1, 3), rings[:, 1:].reshape(-1, 3)
+            radii = np.full(len(starts), 0.06 * scale)
+            segment_axes = np.repeat(np.arange(3), self.GIZMO_RING_SEGMENTS)
+        else:
+            return None
 
-    def draw_rotation_rings_for_picking(self, x, y, z, scale=35.0):
-        """Draw 3-axis rotation rings with picking colors"""
-        glPushMatrix()
-        glTranslatef(x, y, z)
+        distances, ray_params, _ = ray_segment_distances(near, far - near, starts, ends)
+        hits = distances <= np.maximum(radii, min_radius)
+        if not np.any(hits):
+            return None
+        nearest = np.flatnonzero(hits)[np.argmin(ray_params[hits])]
+        return axes[segment_axes[nearest]]
 
-        ring_radius = scale
-        tube_radius = scale * 0.06  # Thickness of the ring tube
-        ring_segments = 48
-        tube_segments = 8
+    def gizmo_screen_bbox(self, center, scale):
+        """Get the window-space box around the gizmo, widened by the pick tolerance
 
-        # X axis ring - RED (YZ plane)
-        glColor3f(1.0, 0.0, 0.0)
-        self.draw_torus_for_picking(ring_radius, tube_radius, ring_segments, tube_segments, 'x')
+        Projects the corners of a cube around the gizmo that also holds the
+        ring tubes and arrow heads.
 
-        # Y axis ring - GREEN (XZ plane)
-        glColor3f(0.0, 1.0, 0.0)
-        self.draw_torus_for_picking(ring_radius, tube_radius, ring_segments, tube_segments, 'y')
+        Returns:
+            (x0, y0, x1, y1) in GL window pixels, or None if part of the
+            gizmo is behind the camera
+        """
+        extent = 1.1 * scale
+        corners = center + extent * np.array(list(itertools.product((-1.0, 1.0), repeat=3)))
+        window = project_points(corners, self._modelview, self._projection, self._viewport)
+        # Behind the camera the projection flips, so the box would be wrong
+        if not np.all(np.isfinite(window)) or np.any(window[:, 2] < 0.0) or np.any(window[:, 2] > 1.0):
+            return None
+        pad = self.GIZMO_PICK_TOLERANCE
+        (x0, y0), (x1, y1) = window[:, :2].min(axis=0) - pad, window[:, :2].max(axis=0) + pad
+        return x0, y0, x1, y1
 
-        # Z axis ring - BLUE (XY plane)
-        glColor3f(0.0, 0.0, 1.0)
-        self.draw_torus_for_picking(ring_radius, tube_radius, ring_segments, tube_segments, 'z')
+    def gizmo_placement(self, model_data):
+        """Get the gizmo's world center and size for a model
 
-        glPopMatrix()
+        Returns:
+            (center, scale) or None if the model has no bounds. The gizmo
+            sits at the model's geometric center and is at least 20mm, or
+            50% of the model size.
+        """
+        gizmo_scale = model_data.get('gizmo_scale')
+        if gizmo_scale is None:
+            return None
+        position = model_data.get('position', [0, 0, 0])
 
-    def draw_torus_for_picking(self, ring_radius, tube_radius, ring_segments, tube_segments, axis):
-        """Draw a torus (donut shape) for picking"""
-        for i in range(ring_segments):
-            glBegin(GL_QUAD_STRIP)
-            for j in range(tube_segments + 1):
-                for k in range(2):
-                    ring_angle = ((i + k) / ring_segments) * 2 * np.pi
-                    tube_angle = (j / tube_segments) * 2 * np.pi
-
-                    # Calculate point on torus
-                    # Standard torus: (R + r*cos(v)) * cos(u), (R + r*cos(v)) * sin(u), r*sin(v)
-                    cos_tube = np.cos(tube_angle)
-                    sin_tube = np.sin(tube_angle)
-                    cos_ring = np.cos(ring_angle)
-                    sin_ring = np.sin(ring_angle)
-
-                    r = ring_radius + tube_radius * cos_tube
-
-                    if axis == 'x':
-                        # Ring around X axis (in YZ plane)
-                        px = tube_radius * sin_tube
-                        py = r * cos_ring
-                        pz = r * sin_ring
-                    elif axis == 'y':
-                        # Ring around Y axis (in XZ plane)
-                        px = r * cos_ring
-                        py = tube_radius * sin_tube
-                        pz = r * sin_ring
-                    else:  # z
-                        # Ring around Z axis (in XY plane)
-                        px = r * cos_ring
-                        py = r * sin_ring
-                        pz = tube_radius * sin_tube
-
-                    glVertex3f(px, py, pz)
-            glEnd()
+        # The model is centered at (0, 0, 0) in X and Z and sits on the
+        # plate, so its center is offset by half its height
+        center = np.array((position[0], position[1] + model_data['half_y'], position[2]))
+        return center, gizmo_scale
 
     def get_axis_screen_direction(self, axis):
         """Get the screen-space direction of a world axis for the current view"""
-        # Get current matrices
-        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-        projection = glGetDoublev(GL_PROJECTION_MATRIX)
-        viewport = glGetIntegerv(GL_VIEWPORT)
-
         # Get gizmo center in world space
         model_data = self.models[self.selected_model_index]
         position = model_data.get('position', [0, 0, 0])
-        model_bounds = model_data.get('bounds')
+        gizmo_center = (position[0], position[1] + model_data.get('half_y', 0.0), position[2])
 
-        if model_bounds:
-            min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-            gizmo_center = [position[0], position[1] + (max_y - min_y) / 2, position[2]]
-        else:
-            gizmo_center = position
+        # Project the gizmo center and a point one unit along the axis to screen
+        center_screen, end_screen = project_points(
+            AXIS_UNIT_SEGMENTS[axis] + gizmo_center, self._modelview, self._projection, self._viewport)
 
-        # Define axis direction in world space
-        if axis == 'x':
-            axis_dir = [1, 0, 0]
-        elif axis == 'y':
-            axis_dir = [0, 1, 0]
-        else:  # z
-            axis_dir = [0, 0, 1]
+        if np.all(np.isfinite(center_screen)) and np.all(np.isfinite(end_screen)):
+            # Calculate screen-space direction
+            screen_dx = end_screen[0] - center_screen[0]
+            screen_dy = end_screen[1] - center_screen[1]
 
-        try:
-            # Project gizmo center to screen
-            center_screen = gluProject(gizmo_center[0], gizmo_center[1], gizmo_center[2],
-                                       modelview, projection, viewport)
-
-            # Project a point along the axis
-            end_point = [gizmo_center[0] + axis_dir[0],
-                        gizmo_center[1] + axis_dir[1],
-                        gizmo_center[2] + axis_dir[2]]
-            end_screen = gluProject(end_point[0], end_point[1], end_point[2],
-                                   modelview, projection, viewport)
-
-            if center_screen and end_screen:
-                # Calculate screen-space direction
-                screen_dx = end_screen[0] - center_screen[0]
-                screen_dy = end_screen[1] - center_screen[1]
-
-                # Negate only Z axis to fix inverted movement
-                # X axis should not be negated for correct mouse movement
-                if axis == 'z':
-                    screen_dx = -screen_dx
-                    screen_dy = -screen_dy
-
-                # Normalize
-                length = np.sqrt(screen_dx * screen_dx + screen_dy * screen_dy)
-                if length > 0.001:
-                    return (screen_dx / length, screen_dy / length)
-        except:
-            pass
+            # Negate only Z axis to fix inverted movement
+            # X axis should not be negated for correct mouse movement
+            if axis == 'z':
+                screen_dx = -screen_dx
+                screen_dy = -screen_dy
+
+            # Normalize
+            length = math.hypot(screen_dx, screen_dy)
+            if length > 0.001:
+                return (screen_dx / length, screen_dy / length)
 
         # Fallback to default directions
         if axis == 'x':
@@ -1591,47 +1943,31 @@ class OpenGLWidget(QOpenGLWidget):
 
         model_data = self.models[self.selected_model_index]
 
-        # Get the screen-space direction of the selected axis
-        axis_dir = self.get_axis_screen_direction(self.selected_gizmo_axis)
+        # Get the screen-space direction of the selected axis, as latched
+        # when the drag started
+        axis_dir = self.drag_axis_direction
+        if axis_dir is None:
+            axis_dir = self.get_axis_screen_direction(self.selected_gizmo_axis)
 
         # Project mouse movement onto the axis direction
         # Note: dy is negated because screen Y is flipped vs OpenGL Y
         projected = dx * axis_dir[0] + (-dy) * axis_dir[1]
 
-        # Movement sensitivity
-        move_speed = 0.5  # mm per pixel
-        rotate_speed = 1.0  # degrees per pixel
-        scale_speed = 0.01  # scale factor per pixel
-
-        if self.transform_mode == 'move':
-            # Move along selected axis using projected mouse movement
-            # Coordinate system note: OpenGL Y=user's Z (vertical), OpenGL Z=user's Y (horizontal)
-            if self.selected_gizmo_axis == 'x':
-                model_data['position'][0] += projected * move_speed
-            elif self.selected_gizmo_axis == 'y':
-                model_data['position'][1] += projected * move_speed
-            elif self.selected_gizmo_axis == 'z':
-                model_data['position'][2] += projected * move_speed
+        drag = self.GIZMO_DRAG.get(self.transform_mode)
+        axis_index = self.AXIS_INDEX.get(self.selected_gizmo_axis)
+        if drag is None or axis_index is None:
+            return
+        key, speed, minimum = drag
 
-        elif self.transform_mode == 'rotate':
-            # Rotate around selected axis using projected movement
-            if self.selected_gizmo_axis == 'x':
-                model_data['rotation'][0] += projected * rotate_speed
-            elif self.selected_gizmo_axis == 'y':
-                model_data['rotation'][1] += projected * rotate_speed
-            elif self.selected_gizmo_axis == 'z':
-                model_data['rotation'][2] += projected * rotate_speed
-
-        elif self.transform_mode == 'scale':
-            # Scale along selected axis
-            # Use projected movement (positive = bigger)
-            scale_delta = projected * scale_speed
-            if self.selected_gizmo_axis == 'x':
-                model_data['scale'][0] = max(0.1, model_data['scale'][0] + scale_delta)
-            elif self.selected_gizmo_axis == 'y':
-                model_data['scale'][1] = max(0.1, model_data['scale'][1] + scale_delta)
-            elif self.selected_gizmo_axis == 'z':
-                model_data['scale'][2] = max(0.1, model_data['scale'][2] + scale_delta)
+        # Move, rotate or scale along/around the selected axis by the
+        # projected movement (for scale, positive = bigger)
+        # Coordinate system note: OpenGL Y=user's Z (vertical), OpenGL Z=user's Y (horizontal)
+        values = model_data[key]
+        values[axis_index] += projected * speed
+        if minimum is not None:
+            values[axis_index] = max(minimum, values[axis_index])
+
+        self.mark_transform_dirty(model_data)
 
     def set_face_picking_mode(self, enabled, callback=None):
         """Enable or disable face picking mode for aligning faces to build plate"""
@@ -1650,64 +1986,129 @@ class OpenGLWidget(QOpenGLWidget):
         model_data = self.models[self.selected_model_index]
         cad_model = model_data.get('model')
 
-        if not cad_model or not cad_model.vertices or not cad_model.indices:
+        if not cad_model or not cad_model.has_mesh():
             return None
 
-        self.makeCurrent()
-
         # Get device pixel ratio for HiDPI displays
         pixel_ratio = self.devicePixelRatio()
         actual_x = int(mouse_x * pixel_ratio)
         actual_y = int(mouse_y * pixel_ratio)
 
-        # Save current state
-        glPushAttrib(GL_ALL_ATTRIB_BITS)
+        # Prefer the CPU ray cast through the BVH, which needs no GL; fall
+        # back to color-coded rendering for models that have no BVH
+        bvh = model_data.get('bvh')
+        if bvh is not None:
+            triangle_index = self.pick_triangle_bvh(model_data, bvh, actual_x, actual_y)
+        else:
+            self.makeCurrent()
+            triangle_index = self.pick_triangle_color_coded(model_data, actual_x, actual_y)
+
+        if triangle_index is None or triangle_index < 0:
+            return None
+
+        # Get triangle vertices (one gather from the packed mesh arrays)
+        # and compute normal
+        corners = cad_model.indices[triangle_index * 3:triangle_index * 3 + 3]
+        if len(corners) < 3:
+            return None
+        v0, v1, v2 = cad_model.vertices[corners].astype(np.float64)
+
+        # Compute face normal
+        edge1 = v1 - v0
+        edge2 = v2 - v0
+        normal = np.cross(edge1, edge2)
+        length = np.linalg.norm(normal)
+        if length > 0:
+            normal = normal / length
+        else:
+            return None
+
+        return normal
+
+    def pick_triangle_bvh(self, model_data, bvh, pixel_x, pixel_y):
+        """Pick a triangle by casting a ray from the camera through the model's BVH
+
+        Args:
+            model_data: Model being picked
+            bvh: TriangleBVH built for the model's mesh
+            pixel_x, pixel_y: Mouse position in framebuffer pixels (Qt convention)
+
+        Returns:
+            Index of the closest triangle under the cursor, or None
+        """
+        # Use the last frame's matrices plus the model transform, so the
+        # un-projected ray lands directly in model space
+        model_matrix, _ = self.get_model_transform(model_data)
+        modelview = self._modelview @ model_matrix
+        win_y = self._viewport[3] - pixel_y - 1
+
+        try:
+            near, far = unproject_points([(pixel_x, win_y, 0.0), (pixel_x, win_y, 1.0)],
+                                         modelview, self._projection, self._viewport)
+        except np.linalg.LinAlgError:
+            return None
+
+        origin = near
+        direction = far - origin
+
+        hit = bvh.intersect_ray(origin, direction)
+        if hit is None:
+            return None
+        return hit[0]
+
+    def pick_triangle_color_coded(self, model_data, pixel_x, pixel_y):
+        """Pick a triangle by rendering each triangle in a unique color
+
+        Args:
+            model_data: Model being picked
+            pixel_x, pixel_y: Mouse position in framebuffer pixels (Qt convention)
+
+        Returns:
+            Index of the triangle under the cursor (-1 for background)
+        """
+        fb_height = self._viewport[3]
+        gl_y = fb_height - pixel_y - 1
+
+        # Only the pixel under the cursor is needed: render just that one,
+        # into the offscreen pick framebuffer, by narrowing the last
+        # frame's projection (what the user sees) to it
+        glBindFramebuffer(GL_FRAMEBUFFER, self._pick_fbo)
+        glViewport(0, 0, 1, 1)
 
         # Clear with black
         glClearColor(0.0, 0.0, 0.0, 1.0)
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
 
-        # Set up matrices (same as paintGL)
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        width = self.width()
-        height = self.height()
-        if height == 0:
-            height = 1
-        gluPerspective(45.0, width / height, 0.1, 1000.0)
-
+        glLoadMatrixd(gl_matrix(
+            pick_matrix(pixel_x + 0.5, gl_y + 0.5, 1, 1, self._viewport) @ self._projection))
         glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        glTranslatef(0.0, 0.0, -self.camera_distance)
-        glTranslatef(self.pan_x, self.pan_y, 0.0)
-        glRotatef(self.rotation_x, 1.0, 0.0, 0.0)
-        glRotatef(self.rotation_y, 0.0, 1.0, 0.0)
-        glRotatef(self.rotation_z, 0.0, 0.0, 1.0)
-
-        # Disable lighting and effects
-        glDisable(GL_LIGHTING)
-        glDisable(GL_TEXTURE_2D)
-        glDisable(GL_BLEND)
+        glLoadMatrixd(gl_matrix(self._modelview))
+
+        # Only dithering could alter the ID colors: fixed-function lighting
+        # and texturing are never enabled, blending is only on while the
+        # grid is recorded, and flat shading is set once in initializeGL
         glDisable(GL_DITHER)
-        glShadeModel(GL_FLAT)
+        # The nearest triangle must win; the last frame may have been a
+        # slice view, which draws without depth testing
+        glEnable(GL_DEPTH_TEST)
 
         # Draw model with color-coded triangles
         self.draw_model_for_face_picking(model_data)
 
-        glFlush()
-        glFinish()
-
-        # Read pixel
-        fb_height = int(height * pixel_ratio)
-        pixel_y = fb_height - actual_y - 1
-
-        pixel_data = glReadPixels(actual_x, pixel_y, 1, 1, GL_RGB, GL_UNSIGNED_BYTE)
+        # Read pixel. glReadPixels into client memory already waits for the
+        # pick pass to finish, so no glFlush/glFinish beforehand. RGBA
+        # matches the RGBA8 color buffer, so the driver copies it as is.
+        pixel_data = glReadPixels(0, 0, 1, 1, GL_RGBA, GL_UNSIGNED_BYTE)
 
-        # Restore state
-        glPopAttrib()
+        # Restore the state changed above (paintGL reloads the matrices).
+        # The visible frame was never touched, so no repaint is needed.
+        glBindFramebuffer(GL_FRAMEBUFFER, self.defaultFramebufferObject())
+        glViewport(*self._viewport)
+        glEnable(GL_DITHER)
         glClearColor(0.7, 0.7, 0.7, 1.0)
 
-        # Decode triangle index from color
+        # Decode triangle index from color (alpha is ignored)
         r, g, b = 0, 0, 0
         if pixel_data is not None:
             if hasattr(pixel_data, 'flatten'):
@@ -1718,101 +2119,55 @@ class OpenGLWidget(QOpenGLWidget):
                 r, g, b = int(pixel_data[0]), int(pixel_data[1]), int(pixel_data[2])
 
         # Decode triangle index (RGB encodes triangle index)
-        triangle_index = r + g * 256 + b * 65536 - 1  # -1 because we start at 1
+        return r + g * 256 + b * 65536 - 1  # -1 because we start at 1
 
-        if triangle_index < 0:
-            return None
-
-        # Get triangle vertices and compute normal
-        indices = cad_model.indices
-        vertices = cad_model.vertices
-
-        if triangle_index * 3 + 2 >= len(indices):
-            return None
-
-        i0 = indices[triangle_index * 3]
-        i1 = indices[triangle_index * 3 + 1]
-        i2 = indices[triangle_index * 3 + 2]
+    def create_pick_framebuffer(self):
+        """
+        Create the offscreen framebuffer that color-coded face picks draw into.
 
-        v0 = np.array(vertices[i0])
-        v1 = np.array(vertices[i1])
-        v2 = np.array(vertices[i2])
+        Must be called with the GL context current.
 
-        # Compute face normal
-        edge1 = v1 - v0
-        edge2 = v2 - v0
-        normal = np.cross(edge1, edge2)
-        length = np.linalg.norm(normal)
-        if length > 0:
-            normal = normal / length
-        else:
-            return None
-
-        return normal
+        Returns:
+            Framebuffer id with one-pixel color and depth attachments
+        """
+        color_buffer, depth_buffer = glGenRenderbuffers(2)
+        glBindRenderbuffer(GL_RENDERBUFFER, color_buffer)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, 1, 1)
+        glBindRenderbuffer(GL_RENDERBUFFER, depth_buffer)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, 1, 1)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+        fbo = glGenFramebuffers(1)
+        glBindFramebuffer(GL_FRAMEBUFFER, fbo)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, color_buffer)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, depth_buffer)
+        # QOpenGLWidget renders into its own framebuffer object, not 0
+        glBindFramebuffer(GL_FRAMEBUFFER, self.defaultFramebufferObject())
+        return fbo
 
     def draw_model_for_face_picking(self, model_data):
         """Draw model with each triangle having a unique color for picking"""
         cad_model = model_data.get('model')
-        model_bounds = model_data.get('bounds')
-        model_center = model_data.get('center')
-        position = model_data.get('position', [0, 0, 0])
-        rotation = model_data.get('rotation', [0, 0, 0])
-        scale = model_data.get('scale', [1, 1, 1])
 
-        if not cad_model or not cad_model.vertices:
+        if not cad_model or not cad_model.has_mesh():
             return
 
         glPushMatrix()
 
-        # Apply same transformations as draw_cad_model
-        glTranslatef(position[0], position[1], position[2])
-
-        if model_bounds:
-            min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-            center_x = model_center[0]
-            center_z = model_center[2]
-            center_y = (max_y - min_y) / 2
-
-            glTranslatef(center_x, center_y, center_z)
-            glRotatef(rotation[2], 0, 0, 1)
-            glRotatef(rotation[1], 0, 1, 0)
-            glRotatef(rotation[0], 1, 0, 0)
-            glTranslatef(-center_x, -center_y, -center_z)
-
-        if scale != [1, 1, 1]:
-            if model_bounds:
-                center_y = (max_y - min_y) / 2
-                glTranslatef(center_x, center_y, center_z)
-                glScalef(scale[0], scale[1], scale[2])
-                glTranslatef(-center_x, -center_y, -center_z)
+        # Apply same transformations as draw_model_mesh
+        self.apply_model_transform(model_data)
 
-        if model_bounds:
-            min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-            # Place model on top of build plate (same as draw_cad_model)
-            glTranslatef(-model_center[0], self.BUILD_PLATE_TOP_Y - min_y, -model_center[2])
-
-        # Draw triangles with unique colors
-        vertices = cad_model.vertices
-        indices = cad_model.indices
-        num_triangles = len(indices) // 3
-
-        glBegin(GL_TRIANGLES)
-        for tri in range(num_triangles):
-            # Encode triangle index as RGB color (starting at 1 to distinguish from black background)
-            color_id = tri + 1
-            r = (color_id % 256) / 255.0
-            g = ((color_id // 256) % 256) / 255.0
-            b = ((color_id // 65536) % 256) / 255.0
-            glColor3f(r, g, b)
-
-            i0 = indices[tri * 3]
-            i1 = indices[tri * 3 + 1]
-            i2 = indices[tri * 3 + 2]
-
-            glVertex3fv(vertices[i0])
-            glVertex3fv(vertices[i1])
-            glVertex3fv(vertices[i2])
-        glEnd()
+        # Draw triangles with unique colors from the cached pick buffer
+        vbo, vertex_count = self.get_pick_buffers(cad_model)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glColorPointer(4, GL_UNSIGNED_BYTE, 0, ctypes.c_void_p(vertex_count * 12))
+        glDrawArrays(GL_TRIANGLES, 0, vertex_count)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         glPopMatrix()
 
@@ -1825,45 +2180,39 @@ class OpenGLWidget(QOpenGLWidget):
 
         # We want the face normal to point down (-Y direction)
         # So we need to rotate the model so that face_normal aligns with (0, -1, 0)
-        target = np.array([0, -1, 0])
-        normal = np.array(face_normal)
+        nx, ny, nz = (float(c) for c in face_normal)
 
-        # Handle case where normal is already aligned
-        dot = np.dot(normal, target)
+        # Handle case where normal is already aligned (dot with the target
+        # is -ny)
+        dot = -ny
         if abs(dot - 1.0) < 0.0001:
             # Already aligned
-            model_data['rotation'] = [0.0, 0.0, 0.0]
+            model_data['rotation'][:] = 0.0
+            self.mark_transform_dirty(model_data)
             self.update()
             return
         elif abs(dot + 1.0) < 0.0001:
             # Opposite direction - rotate 180 around X or Z
-            model_data['rotation'] = [180.0, 0.0, 0.0]
+            model_data['rotation'][:] = (180.0, 0.0, 0.0)
+            self.mark_transform_dirty(model_data)
             self.update()
             return
 
-        # Calculate rotation axis (cross product)
-        axis = np.cross(normal, target)
-        axis_length = np.linalg.norm(axis)
+        # Calculate rotation axis: normal x (0, -1, 0) = (nz, 0, -nx),
+        # written out since np.cross/np.linalg.norm cost more than the
+        # arithmetic for single 3-vectors
+        axis_length = math.hypot(nz, nx)
         if axis_length < 0.0001:
             return
 
-        axis = axis / axis_length
-
         # Calculate rotation angle
-        angle = np.arccos(np.clip(dot, -1.0, 1.0))
-        angle_deg = np.degrees(angle)
+        angle_deg = math.degrees(math.acos(min(1.0, max(-1.0, dot))))
 
         # Convert axis-angle to Euler angles (approximate)
         # This is a simplified conversion - for more accuracy, use quaternions
-        # For now, we'll compute a rotation matrix and extract Euler angles
-
-        # Rodrigues' rotation formula to get rotation matrix
-        K = np.array([
-            [0, -axis[2], axis[1]],
-            [axis[2], 0, -axis[0]],
-            [-axis[1], axis[0], 0]
-        ])
-        R = np.eye(3) + np.sin(angle) * K + (1 - np.cos(angle)) * (K @ K)
+        # For now, we'll compute a rotation matrix (Rodrigues' formula, as in
+        # glRotate) and extract Euler angles
+        R = rotation_matrix(angle_deg, nz / axis_length, 0.0, -nx / axis_length)[:3, :3]
 
         # Extract Euler angles (XYZ order) from rotation matrix
         # This assumes the rotation order is X, then Y, then Z
@@ -1882,11 +2231,8 @@ class OpenGLWidget(QOpenGLWidget):
                 rot_x = np.arctan2(-R[0, 1], -R[0, 2])
 
         # Convert to degrees and update model
-        model_data['rotation'] = [
-            np.degrees(rot_x),
-            np.degrees(rot_y),
-            np.degrees(rot_z)
-        ]
+        model_data['rotation'][:] = np.degrees((rot_x, rot_y, rot_z))
+        self.mark_transform_dirty(model_data)
 
         self.update()
 
@@ -1903,6 +2249,8 @@ class OpenGLWidget(QOpenGLWidget):
             # Clear slices and hatching
             self.sliced_layers = []
             self.hatching_data = {}
+            self._hatching_signature = None
+            self._pending_hatching_signature = None
 
         self.update()
 
@@ -1919,6 +2267,7 @@ class OpenGLWidget(QOpenGLWidget):
     def request_hatching_generation(self):
         """Request async hatching generation (UI will handle the worker)."""
         if self.sliced_layers and self.hatching_params:
+            self._pending_hatching_signature = self.hatching_signature()
             self.hatching_requested.emit(
                 self.sliced_layers,
                 self.hatching_params,
@@ -1928,8 +2277,14 @@ class OpenGLWidget(QOpenGLWidget):
     def set_hatching_data(self, hatching_data):
         """Set the hatching data after async hatching generation completes."""
         self.hatching_data = hatching_data
+        self._hatching_signature = self._pending_hatching_signature
+        self._pending_hatching_signature = None
         self.update()
 
+    def discard_hatching_request(self):
+        """Forget the hatching request in flight after it failed or was cancelled."""
+        self._pending_hatching_signature = None
+
     def update_slice_thickness(self, layer_thickness):
         """Update the layer thickness and re-slice"""
         self.layer_thickness = layer_thickness
@@ -1942,417 +2297,147 @@ class OpenGLWidget(QOpenGLWidget):
         self.current_layer_index = layer_index
         self.update()
 
-    def slice_all_models(self):
-        """Slice all loaded models into layers"""
-        self.sliced_layers = []
-
-        for model_data in self.models:
-            layers = self.slice_model(model_data)
-            self.sliced_layers.append(layers)
-
-    def slice_model(self, model_data):
-        """Slice a single model into horizontal sections with unique outlines
-
-        Returns a list of sections, where each section represents a range of layers
-        with the same outline shape
-        """
-        cad_model = model_data.get('model')
-        if not cad_model or not cad_model.vertices or not cad_model.indices:
-            return []
-
-        # Get model bounds and transformation
-        model_bounds = model_data.get('bounds')
-        position = model_data.get('position', [0, 0, 0])
-        rotation = model_data.get('rotation', [0, 0, 0])
-        scale = model_data.get('scale', [1, 1, 1])
-
-        if not model_bounds:
-            return []
-
-        min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-
-        # Calculate model height in world space (after transformations)
-        model_height = (max_y - min_y) * scale[1]
-        # Bottom of model sits on top of build plate + user position offset
-        model_bottom = self.BUILD_PLATE_TOP_Y + position[1]
-
-        # Calculate number of layers
-        num_layers = int(np.ceil(model_height / self.layer_thickness))
-        if num_layers == 0:
-            return []
-
-        # Slice all layers first
-        all_layers = []
-        for layer_idx in range(num_layers):
-            layer_z = model_bottom + (layer_idx + 0.5) * self.layer_thickness
-            segments = self.slice_at_height(cad_model, model_data, layer_z)
-            all_layers.append({
-                'z_height': layer_z,
-                'layer_index': layer_idx,
-                'segments': segments
-            })
-
-        # Group consecutive layers with the same outline into sections
-        sections = self.group_layers_into_sections(all_layers, model_bottom)
-
-        return sections
-
-    def group_layers_into_sections(self, all_layers, model_bottom):
-        """Group consecutive layers with identical outlines into sections
-
-        Returns a list of sections:
-        [{
-            'start_layer': int,
-            'end_layer': int,
-            'z_start': float,
-            'z_end': float,
-            'segments': [...],
-            'layer_count': int
-        }, ...]
-        """
-        if not all_layers:
-            return []
-
-        sections = []
-        current_section = {
-            'start_layer': 0,
-            'end_layer': 0,
-            'z_start': all_layers[0]['z_height'],
-            'z_end': all_layers[0]['z_height'],
-            'segments': all_layers[0]['segments'],
-            'layer_count': 1
-        }
-
-        for i in range(1, len(all_layers)):
-            current_layer = all_layers[i]
-            prev_layer = all_layers[i - 1]
-
-            # Check if this layer has the same outline as the previous
-            if self.outlines_are_equal(current_layer['segments'], prev_layer['segments']):
-                # Extend current section
-                current_section['end_layer'] = i
-                current_section['z_end'] = current_layer['z_height']
-                current_section['layer_count'] += 1
-            else:
-                # Save current section and start a new one
-                sections.append(current_section)
-                current_section = {
-                    'start_layer': i,
-                    'end_layer': i,
-                    'z_start': current_layer['z_height'],
-                    'z_end': current_layer['z_height'],
-                    'segments': current_layer['segments'],
-                    'layer_count': 1
-                }
-
-        # Don't forget the last section
-        sections.append(current_section)
-
-        return sections
-
-    def outlines_are_equal(self, segments1, segments2, tolerance=0.01):
-        """Check if two sets of outline segments are equal (within tolerance)
-
-        Two outlines are considered equal if they have the same number of segments
-        and each segment matches (order may differ)
-        """
-        if len(segments1) != len(segments2):
-            return False
-
-        if len(segments1) == 0:
-            return True
-
-        # Sort segments for comparison
-        # Sort by first point, then second point
-        def segment_key(seg):
-            x1, z1, x2, z2 = seg
-            # Normalize so smaller point comes first
-            if (x1, z1) > (x2, z2):
-                x1, z1, x2, z2 = x2, z2, x1, z1
-            return (round(x1 / tolerance), round(z1 / tolerance),
-                    round(x2 / tolerance), round(z2 / tolerance))
-
-        sorted_seg1 = sorted(segments1, key=segment_key)
-        sorted_seg2 = sorted(segments2, key=segment_key)
-
-        # Compare each segment
-        for seg1, seg2 in zip(sorted_seg1, sorted_seg2):
-            x1_1, z1_1, x2_1, z2_1 = seg1
-            x1_2, z1_2, x2_2, z2_2 = seg2
-
-            # Check if segments match (considering both orderings)
-            if not (self.points_equal((x1_1, z1_1), (x1_2, z1_2), tolerance) and
-                    self.points_equal((x2_1, z2_1), (x2_2, z2_2), tolerance)) and \
-               not (self.points_equal((x1_1, z1_1), (x2_2, z2_2), tolerance) and
-                    self.points_equal((x2_1, z2_1), (x1_2, z1_2), tolerance)):
-                return False
-
-        return True
-
-    def points_equal(self, p1, p2, tolerance=0.01):
-        """Check if two 2D points are equal within tolerance"""
-        return abs(p1[0] - p2[0]) < tolerance and abs(p1[1] - p2[1]) < tolerance
-
-    def slice_at_height(self, cad_model, model_data, z_height):
-        """Find all line segments where triangles intersect a horizontal plane at z_height
-
-        Returns a list of line segments [(x1, y1, x2, y2), ...]
-        """
-        vertices = np.array(cad_model.vertices)
-        indices = cad_model.indices
-
-        # Get transformation parameters
-        position = model_data.get('position', [0, 0, 0])
-        rotation = model_data.get('rotation', [0, 0, 0])
-        scale = model_data.get('scale', [1, 1, 1])
-        model_bounds = model_data.get('bounds')
-        model_center = model_data.get('center')
-
-        if not model_bounds:
-            return []
-
-        min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-
-        segments = []
-
-        # Process each triangle
-        num_triangles = len(indices) // 3
-        for tri_idx in range(num_triangles):
-            i0 = indices[tri_idx * 3]
-            i1 = indices[tri_idx * 3 + 1]
-            i2 = indices[tri_idx * 3 + 2]
-
-            # Get triangle vertices
-            v0 = np.array(vertices[i0])
-            v1 = np.array(vertices[i1])
-            v2 = np.array(vertices[i2])
-
-            # Apply transformations to get world space coordinates
-            v0_world = self.transform_vertex(v0, model_data)
-            v1_world = self.transform_vertex(v1, model_data)
-            v2_world = self.transform_vertex(v2, model_data)
-
-            # Check if triangle intersects the Z plane
-            segment = self.intersect_triangle_plane(v0_world, v1_world, v2_world, z_height)
-            if segment:
-                segments.append(segment)
-
-        return segments
-
-    def transform_vertex(self, vertex, model_data):
-        """Transform a vertex from model space to world space
-
-        This must match the transformation pipeline in draw_cad_model exactly
-        """
-        position = model_data.get('position', [0, 0, 0])
-        rotation = model_data.get('rotation', [0, 0, 0])
-        scale = model_data.get('scale', [1, 1, 1])
-        model_bounds = model_data.get('bounds')
-        model_center = model_data.get('center')
-
-        if not model_bounds:
-            return vertex
-
-        min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
-
-        # Start with the vertex in model space
-        v = np.array(vertex, dtype=float)
-
-        # Step 1: Center the model (align bottom to Y=0, center in X and Z)
-        v[0] -= model_center[0]
-        v[1] -= min_y
-        v[2] -= model_center[2]
-
-        # Step 2: Apply scale around geometric center
-        center_y = (max_y - min_y) / 2
-        center_x = model_center[0]
-        center_z = model_center[2]
-
-        # Translate to geometric center
-        v[0] -= center_x
-        v[1] -= center_y
-        v[2] -= center_z
-
-        # Apply scale
-        v = v * scale
-
-        # Translate back
-        v[0] += center_x
-        v[1] += center_y
-        v[2] += center_z
-
-        # Step 3: Apply rotation around geometric center
-        # Translate to geometric center
-        v[0] -= center_x
-        v[1] -= center_y
-        v[2] -= center_z
-
-        # Apply rotations in order: Z, Y, X
-        # Convert degrees to radians
-        rx = np.radians(rotation[0])
-        ry = np.radians(rotation[1])
-        rz = np.radians(rotation[2])
-
-        # Z rotation
-        if abs(rz) > 1e-6:
-            cos_z = np.cos(rz)
-            sin_z = np.sin(rz)
-            x_new = v[0] * cos_z - v[1] * sin_z
-            y_new = v[0] * sin_z + v[1] * cos_z
-            v[0] = x_new
-            v[1] = y_new
-
-        # Y rotation
-        if abs(ry) > 1e-6:
-            cos_y = np.cos(ry)
-            sin_y = np.sin(ry)
-            x_new = v[0] * cos_y + v[2] * sin_y
-            z_new = -v[0] * sin_y + v[2] * cos_y
-            v[0] = x_new
-            v[2] = z_new
-
-        # X rotation
-        if abs(rx) > 1e-6:
-            cos_x = np.cos(rx)
-            sin_x = np.sin(rx)
-            y_new = v[1] * cos_x - v[2] * sin_x
-            z_new = v[1] * sin_x + v[2] * cos_x
-            v[1] = y_new
-            v[2] = z_new
-
-        # Translate back
-        v[0] += center_x
-        v[1] += center_y
-        v[2] += center_z
-
-        # Step 4: Apply position translation
-        v = v + position
-
-        return v
-
-    def intersect_triangle_plane(self, v0, v1, v2, z_height):
-        """Find where a triangle intersects a horizontal plane at z_height
-
-        Returns a line segment (x1, y1, x2, y2) or None if no intersection
-        Note: y here refers to the horizontal plane coordinate (model's Z in our system)
-        """
-        # Check which vertices are above and below the plane
-        # We're slicing on the Y axis (vertical in our system)
-        y0, y1, y2 = v0[1], v1[1], v2[1]
-
-        # Find intersection points
-        intersections = []
-
-        # Check edge v0-v1
-        if (y0 <= z_height <= y1) or (y1 <= z_height <= y0):
-            if abs(y1 - y0) > 1e-6:  # Avoid division by zero
-                t = (z_height - y0) / (y1 - y0)
-                x = v0[0] + t * (v1[0] - v0[0])
-                z = v0[2] + t * (v1[2] - v0[2])
-                intersections.append((x, z))
-
-        # Check edge v1-v2
-        if (y1 <= z_height <= y2) or (y2 <= z_height <= y1):
-            if abs(y2 - y1) > 1e-6:
-                t = (z_height - y1) / (y2 - y1)
-                x = v1[0] + t * (v2[0] - v1[0])
-                z = v1[2] + t * (v2[2] - v1[2])
-                intersections.append((x, z))
-
-        # Check edge v2-v0
-        if (y2 <= z_height <= y0) or (y0 <= z_height <= y2):
-            if abs(y0 - y2) > 1e-6:
-                t = (z_height - y2) / (y0 - y2)
-                x = v2[0] + t * (v0[0] - v2[0])
-                z = v2[2] + t * (v0[2] - v2[2])
-                intersections.append((x, z))
-
-        # Remove duplicates
-        unique_intersections = []
-        for p in intersections:
-            is_duplicate = False
-            for existing in unique_intersections:
-                if abs(p[0] - existing[0]) < 1e-6 and abs(p[1] - existing[1]) < 1e-6:
-                    is_duplicate = True
-                    break
-            if not is_duplicate:
-                unique_intersections.append(p)
-
-        # Should have exactly 2 intersection points for a valid slice
-        if len(unique_intersections) == 2:
-            p1, p2 = unique_intersections
-            return (p1[0], p1[1], p2[0], p2[1])
-
-        return None
-
     def draw_sliced_layers(self):
         """Draw the current layer's outlines for all models"""
         if not self.sliced_layers:
             return
 
-        # Disable lighting for line drawing
-        glDisable(GL_LIGHTING)
         glLineWidth(2.0)
 
-        # Draw each model's sections
-        for model_idx, model_sections in enumerate(self.sliced_layers):
-            if not model_sections:
-                continue
+        # Draw each model's section outline from the slice buffer
+        self.update_slice_buffer()
+        glBindBuffer(GL_ARRAY_BUFFER, self._slice_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
 
+        for model_idx, layer_sections in enumerate(self.get_layer_sections()):
             # Find which section contains the current layer index
-            section = self.find_section_for_layer(model_sections, self.current_layer_index)
+            section = self.section_at_layer(layer_sections, self.current_layer_index)
             if not section:
                 continue
 
-            segments = section['segments']
-            # Use the middle Z height of the section for display
-            z_height = (section['z_start'] + section['z_end']) / 2
-
             # Set color - use different colors for different models
             if model_idx == self.selected_model_index:
                 glColor3f(0.2, 0.4, 0.9)  # Blue for selected
             else:
                 glColor3f(0.2, 0.2, 0.2)  # Dark gray for unselected
 
-            # Draw all segments
-            glBegin(GL_LINES)
-            for seg in segments:
-                x1, z1, x2, z2 = seg
-                # Remember: in our coordinate system, the slice Y is the world Y
-                glVertex3f(x1, z_height, z1)
-                glVertex3f(x2, z_height, z2)
-            glEnd()
+            glDrawArrays(GL_LINES, *section['vbo_range'])
+
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         # Draw hatching if enabled
         if self.hatching_enabled:
             self.draw_hatching_for_layer(self.current_layer_index)
 
-        # Re-enable lighting
-        glEnable(GL_LIGHTING)
+    def update_slice_buffer(self):
+        """Upload the outlines of all sections, if the slicing result changed
+
+        Must be called with the GL context current. Sections only change on
+        a re-slice, so scrolling through layers never touches the buffer.
+        """
+        if self._slice_vbo_layers is self.sliced_layers:
+            return
+
+        chunks = []
+        first = 0
+        for model_sections in self.sliced_layers:
+            for section in model_sections or ():
+                vertices = self.section_line_vertices(section)
+                chunks.append(vertices)
+                section['vbo_range'] = (first, len(vertices))
+                first += len(vertices)
+        data = np.concatenate(chunks) if chunks else np.empty((0, 3), dtype=np.float32)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._slice_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data if data.nbytes else None,
+                     GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        # Keep a reference so the identity check stays valid
+        self._slice_vbo_layers = self.sliced_layers
+
+    def section_line_vertices(self, section):
+        """
+        Build the line endpoints of a section's outline segments.
+
+        Args:
+            section: Section dict with 'segments' (x1, z1, x2, z2) and its
+                z_start/z_end slice heights
+
+        Returns:
+            float32 array (2 * n, 3) of (x, height, z) endpoints drawn at the
+            middle height of the section
+        """
+        segments = np.asarray(section['segments'], dtype=np.float32).reshape(-1, 4)
+        # Remember: in our coordinate system, the slice Y is the world Y
+        z_height = (section['z_start'] + section['z_end']) / 2
+        return self.line_vertices(segments, z_height)
+
+    @staticmethod
+    def line_vertices(segments, height):
+        """
+        Build the 3D line endpoints of horizontal (x1, z1, x2, z2) segments.
 
-    def find_section_for_layer(self, sections, layer_index):
-        """Find the section that contains the given layer index"""
-        for section in sections:
-            if section['start_layer'] <= layer_index <= section['end_layer']:
-                return section
+        Args:
+            segments: Array (n, 4) of segments in the horizontal plane
+            height: World Y to draw them at, a scalar or one per segment
+
+        Returns:
+            float32 array (2 * n, 3) of (x, height, z) endpoints
+        """
+        vertices = np.empty((2 * len(segments), 3), dtype=np.float32)
+        vertices[0::2, 1] = height
+        vertices[1::2, 1] = height
+        vertices[0::2, 0] = segments[:, 0]
+        vertices[0::2, 2] = segments[:, 1]
+        vertices[1::2, 0] = segments[:, 2]
+        vertices[1::2, 2] = segments[:, 3]
+        return vertices
+
+    def get_layer_sections(self):
+        """
+        Get each model's sections indexed by layer, built once per slicing result.
+
+        Returns:
+            One list per model whose entry i is the section containing
+            layer i, or None where no section does
+        """
+        if self._layer_sections[0] is self.sliced_layers:
+            return self._layer_sections[1]
+
+        tables = []
+        for model_sections in self.sliced_layers:
+            table = []
+            # Fill backwards so the first section containing a layer wins
+            for section in reversed(model_sections or ()):
+                start, end = section['start_layer'], section['end_layer'] + 1
+                if end > len(table):
+                    table.extend([None] * (end - len(table)))
+                table[start:end] = [section] * (end - start)
+            tables.append(table)
+
+        self._layer_sections = (self.sliced_layers, tables)
+        return tables
+
+    @staticmethod
+    def section_at_layer(layer_sections, layer_index):
+        """Find the section that contains the given layer index in a get_layer_sections table"""
+        if 0 <= layer_index < len(layer_sections):
+            return layer_sections[layer_index]
         return None
 
     def get_total_layers(self):
         """Get the total number of layers across all models"""
-        if not self.sliced_layers:
-            return 0
-
-        max_layers = 0
-        for model_sections in self.sliced_layers:
-            if model_sections:
-                # Find the highest end_layer across all sections
-                for section in model_sections:
-                    max_layers = max(max_layers, section['end_layer'] + 1)
+        # Each model's table ends at its highest end_layer
+        return max(map(len, self.get_layer_sections()), default=0)
 
-        return max_layers
+    def draw_scrollbar_gizmo(self, painter=None):
+        """Draw a scrollbar gizmo on the right side of the viewport for layer navigation
 
-    def draw_scrollbar_gizmo(self):
-        """Draw a scrollbar gizmo on the right side of the viewport for layer navigation"""
+        Drawn with QPainter after the GL scene, so no GL state is touched.
+        """
         if not self.sliced_layers:
             return
 
@@ -2360,65 +2445,40 @@ class OpenGLWidget(QOpenGLWidget):
         if total_layers <= 0:
             return
 
-        # Switch to 2D orthographic projection for UI overlay
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, self.width(), self.height(), 0, -1, 1)
-
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
-
-        # Disable depth test and lighting for 2D overlay
-        glDisable(GL_DEPTH_TEST)
-        glDisable(GL_LIGHTING)
-
         # Calculate scrollbar dimensions
         viewport_height = self.height()
         scrollbar_x = self.width() - self.scrollbar_width - self.scrollbar_margin
         scrollbar_y = self.scrollbar_margin
         scrollbar_height = viewport_height - 2 * self.scrollbar_margin
 
-        # Draw scrollbar track (background)
-        glColor4f(0.3, 0.3, 0.3, 0.5)
-        glBegin(GL_QUADS)
-        glVertex2f(scrollbar_x, scrollbar_y)
-        glVertex2f(scrollbar_x + self.scrollbar_width, scrollbar_y)
-        glVertex2f(scrollbar_x + self.scrollbar_width, scrollbar_y + scrollbar_height)
-        glVertex2f(scrollbar_x, scrollbar_y + scrollbar_height)
-        glEnd()
-
         # Calculate thumb position and size
         thumb_height = max(20, scrollbar_height / max(total_layers, 1))
         thumb_y = scrollbar_y + (scrollbar_height - thumb_height) * (self.current_layer_index / max(total_layers - 1, 1))
 
-        # Draw scrollbar thumb (handle)
+        # Use shared painter if provided (preferred on macOS), otherwise create one
+        own_painter = painter is None
+        if own_painter:
+            painter = QPainter(self)
+
+        # Draw scrollbar track (background)
+        painter.fillRect(QRectF(scrollbar_x, scrollbar_y, self.scrollbar_width, scrollbar_height),
+                         self._scrollbar_track_color)
+
+        # Draw scrollbar thumb (handle), lighter when hovered/dragging
         if self.scrollbar_hover or self.scrollbar_dragging:
-            glColor4f(0.6, 0.6, 0.8, 0.9)  # Lighter when hovered/dragging
+            thumb_color = self._scrollbar_thumb_active_color
         else:
-            glColor4f(0.4, 0.4, 0.6, 0.8)  # Normal color
+            thumb_color = self._scrollbar_thumb_color
+        painter.fillRect(QRectF(scrollbar_x + 2, thumb_y, self.scrollbar_width - 4, thumb_height),
+                         thumb_color)
 
-        glBegin(GL_QUADS)
-        glVertex2f(scrollbar_x + 2, thumb_y)
-        glVertex2f(scrollbar_x + self.scrollbar_width - 2, thumb_y)
-        glVertex2f(scrollbar_x + self.scrollbar_width - 2, thumb_y + thumb_height)
-        glVertex2f(scrollbar_x + 2, thumb_y + thumb_height)
-        glEnd()
+        if own_painter:
+            painter.end()
 
         # Store layer info for text rendering
         self.slice_info_text = f"{self.current_layer_index + 1}/{total_layers}"
         self.slice_info_position = (scrollbar_x - 60, scrollbar_y + scrollbar_height // 2)
 
-        # Restore matrices and state
-        glPopMatrix()
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-
         # Store scrollbar info for mouse interaction
         self.scrollbar_rect = (scrollbar_x, scrollbar_y, self.scrollbar_width, scrollbar_height)
         self.scrollbar_thumb_rect = (scrollbar_x, thumb_y, self.scrollbar_width, thumb_height)
@@ -2459,13 +2519,17 @@ class OpenGLWidget(QOpenGLWidget):
         self.hatching_enabled = enabled
         self.update()
 
-    def set_hatching_parameters(self, hatch_params, strategy=None):
+    def set_hatching_parameters(self, hatch_params, strategy=None, force=False):
         """
         Set hatching parameters and optionally strategy.
 
+        Hatching is only regenerated if it would differ from the current
+        hatching (or from the hatching already requested), unless forced.
+
         Args:
             hatch_params: HatchingParameters instance
             strategy: HatchingStrategy enum value (optional)
+            force: Regenerate even if nothing changed
         """
         from hatching import HatchingParameters, HatchingStrategy
 
@@ -2475,32 +2539,35 @@ class OpenGLWidget(QOpenGLWidget):
         elif self.hatching_strategy is None:
             self.hatching_strategy = HatchingStrategy.LINES
 
-        # Regenerate hatching if in slice mode
+        # Regenerate hatching in the background if in slice mode. While a
+        # request is in flight its result is what will end up on screen, so
+        # compare against that rather than the hatching shown now
         if self.view_mode == 'slice' and self.hatching_enabled:
-            self.generate_all_hatching()
-            self.update()
-
-    def generate_all_hatching(self):
-        """Generate hatching for all sliced layers."""
-        if not self.sliced_layers or not self.hatching_params:
-            return
+            signature = self._pending_hatching_signature
+            if signature is None:
+                signature = self._hatching_signature
+            if force or not self.hatching_matches(signature):
+                self.request_hatching_generation()
 
-        from hatching_integration import prepare_hatching_for_all_layers
-
-        self.hatching_data = {}
+    def hatching_signature(self):
+        """
+        Get what hatching generated now would depend on.
 
-        # Generate hatching for each model
-        for model_idx, layer_sections in enumerate(self.sliced_layers):
-            model_hatching = prepare_hatching_for_all_layers(
-                layer_sections,
-                self.hatching_params,
-                self.hatching_strategy
-            )
+        Returns:
+            (sliced_layers, parameter values, strategy). The parameters are
+            copied by value, since the hatching dialog edits them in place.
+        """
+        return (self.sliced_layers, dataclasses.astuple(self.hatching_params),
+                self.hatching_strategy)
 
-            # Store hatching data with (model_idx, layer_idx) keys to avoid collisions
-            for layer_idx, hatch_lines in model_hatching.items():
-                key = (model_idx, layer_idx)
-                self.hatching_data[key] = hatch_lines
+    def hatching_matches(self, signature):
+        """Check whether hatching with the given signature is what would be generated now"""
+        if signature is None or self.hatching_params is None:
+            return False
+        sliced_layers, params, strategy = signature
+        return (sliced_layers is self.sliced_layers
+                and params == dataclasses.astuple(self.hatching_params)
+                and strategy == self.hatching_strategy)
 
     def draw_hatching_for_layer(self, layer_index):
         """
@@ -2512,53 +2579,137 @@ class OpenGLWidget(QOpenGLWidget):
         if not self.hatching_enabled:
             return
 
-        glDisable(GL_LIGHTING)
-        glDisable(GL_DEPTH_TEST)
+        layer_ranges = self.update_hatching_buffer().get(layer_index)
+        if layer_ranges is None:
+            return
+        contour_firsts, contour_counts, infill_firsts, infill_counts = layer_ranges
 
-        # Draw hatching for each model at this layer index
-        for model_idx in range(len(self.sliced_layers)):
-            key = (model_idx, layer_index)
-            if key not in self.hatching_data:
-                continue
+        # Depth testing is already off in the slice view (see paintGL)
+        if self._hatching_vao is not None:
+            glBindVertexArray(self._hatching_vao)
+        else:
+            glBindBuffer(GL_ARRAY_BUFFER, self._hatching_vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(3, GL_FLOAT, 0, None)
 
-            hatch_lines = self.hatching_data[key]
+        # Draw every model's hatching at this layer index, one call per kind:
+        # contour lines (red, thicker)
+        if len(contour_counts):
+            glColor3f(0.8, 0.1, 0.1)  # Red
+            glLineWidth(2.0)
+            glMultiDrawArrays(GL_LINES, contour_firsts, contour_counts, len(contour_counts))
+
+        # Then infill lines (blue, thinner)
+        if len(infill_counts):
+            glColor3f(0.1, 0.4, 0.8)  # Blue
+            glLineWidth(1.0)
+            glMultiDrawArrays(GL_LINES, infill_firsts, infill_counts, len(infill_counts))
+
+        if self._hatching_vao is not None:
+            glBindVertexArray(0)
+        else:
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        # Drawing infill already left the default line width
+        if not len(infill_counts):
+            glLineWidth(1.0)
+
+    def create_position_vertex_array(self, vbo):
+        """
+        Record a vertex array object that draws positions from a VBO.
 
+        The VBO holds tightly packed float32 (x, y, z) positions for the
+        fixed-function vertex array. Its contents may be re-uploaded later;
+        the VAO only refers to the buffer.
+        Must be called with the GL context current.
+
+        Returns:
+            Vertex array object id, or None when the context has no VAOs
+        """
+        if not self._use_vertex_arrays:
+            return None
+
+        vao = glGenVertexArrays(1)
+        glBindVertexArray(vao)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return vao
+
+    def update_hatching_buffer(self):
+        """Upload the hatching of all layers, if the hatching or slicing result changed
+
+        Must be called with the GL context current.
+
+        Returns:
+            Dict layer_idx -> (contour_firsts, contour_counts, infill_firsts,
+            infill_counts): int32 glMultiDrawArrays ranges in the hatching
+            buffer over the models with hatching and a section at that layer
+        """
+        if (self._hatching_vbo_source[0] is self.hatching_data
+                and self._hatching_vbo_source[1] is self.sliced_layers):
+            return self._hatching_ranges
+
+        from hatching_integration import hatch_line_arrays
+
+        # Layers to upload, with the height to draw them at
+        keys = []
+        layer_heights = []
+        layer_lines = []
+        all_layer_sections = self.get_layer_sections()
+        for (model_idx, layer_idx), hatch_lines in self.hatching_data.items():
             # Get the actual Z height for this model's layer
-            model_sections = self.sliced_layers[model_idx]
-            section = self.find_section_for_layer(model_sections, layer_index)
+            if model_idx >= len(all_layer_sections):
+                continue
+            section = self.section_at_layer(all_layer_sections[model_idx], layer_idx)
             if not section:
                 continue
 
             # Use the middle Z height of the section
-            layer_y = (section['z_start'] + section['z_end']) / 2
-
-            # Draw contour lines (red, thicker)
-            contour_lines = [line for line in hatch_lines if line.is_contour]
-            if contour_lines:
-                glColor3f(0.8, 0.1, 0.1)  # Red
-                glLineWidth(2.0)
-                glBegin(GL_LINES)
-                for line in contour_lines:
-                    # Note: segments are (x, z) but we render in 3D (x, y, z)
-                    # where y is the height dimension
-                    glVertex3f(line.start[0], layer_y, line.start[1])
-                    glVertex3f(line.end[0], layer_y, line.end[1])
-                glEnd()
-
-            # Draw infill lines (blue, thinner)
-            infill_lines = [line for line in hatch_lines if not line.is_contour]
-            if infill_lines:
-                glColor3f(0.1, 0.4, 0.8)  # Blue
-                glLineWidth(1.0)
-                glBegin(GL_LINES)
-                for line in infill_lines:
-                    glVertex3f(line.start[0], layer_y, line.start[1])
-                    glVertex3f(line.end[0], layer_y, line.end[1])
-                glEnd()
-
-        glLineWidth(1.0)
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+            keys.append((model_idx, layer_idx))
+            layer_heights.append((section['z_start'] + section['z_end']) / 2)
+            layer_lines.append(hatch_lines)
+
+        # Read every line's points and kind in one pass, then order the
+        # lines by layer with each layer's contour lines first
+        counts = np.fromiter(map(len, layer_lines), dtype=np.intp, count=len(layer_lines))
+        segments, is_contour, _ = hatch_line_arrays(
+            list(itertools.chain.from_iterable(layer_lines)))
+        segments = segments.astype(np.float32)
+        layer_ids = np.repeat(np.arange(len(keys)), counts)
+        order = np.lexsort((~is_contour, layer_ids))
+        data = self.line_vertices(segments[order],
+                                  np.repeat(np.asarray(layer_heights, dtype=np.float32), counts))
+
+        # Vertex ranges per model layer (two vertices per line)
+        contour_counts = 2 * np.bincount(layer_ids[is_contour], minlength=len(keys))
+        firsts = 2 * (np.cumsum(counts) - counts)
+        infill_counts = 2 * counts - contour_counts
+        by_layer = {}
+        for (model_idx, layer_idx), first, contour_count, infill_count in zip(
+                keys, firsts.tolist(), contour_counts.tolist(), infill_counts.tolist()):
+            by_layer.setdefault(layer_idx, []).append(
+                (first, contour_count, first + contour_count, infill_count))
+
+        # Gather them across models, leaving out empty ranges
+        ranges = {}
+        for layer_idx, rows in by_layer.items():
+            rows = np.array(rows, dtype=np.int32)
+            contour = rows[:, 1] > 0
+            infill = rows[:, 3] > 0
+            ranges[layer_idx] = (rows[contour, 0], rows[contour, 1], rows[infill, 2], rows[infill, 3])
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._hatching_vbo)
+        glBufferData(GL_ARRAY_BUFFER, data.nbytes, data if data.nbytes else None,
+                     GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        # Keep references so the identity check stays valid
+        self._hatching_vbo_source = (self.hatching_data, self.sliced_layers)
+        self._hatching_ranges = ranges
+        return ranges
 
     def get_hatching_statistics(self):
         """
@@ -2572,6 +2723,21 @@ class OpenGLWidget(QOpenGLWidget):
 
         from hatching_integration import get_hatching_statistics
 
+        return get_hatching_statistics(self.get_merged_hatching())
+
+    def get_merged_hatching(self):
+        """
+        Get the hatching of all models merged per layer.
+
+        Computed once per hatching result. The lists are shared between
+        callers, so they must not be modified.
+
+        Returns:
+            Dict layer_idx -> list of HatchLines of every model in that layer
+        """
+        if self._merged_hatching[0] is self.hatching_data:
+            return self._merged_hatching[1]
+
         # Convert from {(model_idx, layer_idx): [HatchLine]} to {layer_idx: [HatchLine]}
         # by merging all models' hatching for each layer
         merged_data = {}
@@ -2580,7 +2746,8 @@ class OpenGLWidget(QOpenGLWidget):
                 merged_data[layer_idx] = []
             merged_data[layer_idx].extend(hatch_lines)
 
-        return get_hatching_statistics(merged_data)
+        self._merged_hatching = (self.hatching_data, merged_data)
+        return merged_data
 
     def export_to_obp(self, filepath):
         """
@@ -2596,27 +2763,21 @@ class OpenGLWidget(QOpenGLWidget):
             return False
 
         try:
-            from hatching_integration import convert_hatching_to_obp_format
-
-            # Convert from {(model_idx, layer_idx): [HatchLine]} to {layer_idx: [HatchLine]}
-            # by merging all models' hatching for each layer
-            merged_data = {}
-            for (model_idx, layer_idx), hatch_lines in self.hatching_data.items():
-                if layer_idx not in merged_data:
-                    merged_data[layer_idx] = []
-                merged_data[layer_idx].extend(hatch_lines)
-
-            # Convert hatching data to OBP format
-            obp_layers = convert_hatching_to_obp_format(
-                merged_data,
-                self.layer_thickness
-            )
+            from hatching_integration import iter_obp_layers
 
             # TODO: Use obplib from Freemelt to write OBP file
             # This is a placeholder until obplib integration is complete
             import json
             with open(filepath, 'w') as f:
-                json.dump(obp_layers, f, indent=2)
+                # Stream the JSON array a layer at a time, converting each
+                # layer to OBP format only when it is written
+                f.write('[')
+                separator = '\n'
+                for layer_data in iter_obp_layers(self.get_merged_hatching(), self.layer_thickness):
+                    f.write(separator)
+                    f.write(json.dumps(layer_data))
+                    separator = ',\n'
+                f.write('\n]\n')
 
             return True
 
@@ -0,0 +1,79 @@
+"""
+Tests for the picking BVH.
+
+Run with: python -m pytest test_bvh.py
+"""
+
+import numpy as np
+
+from bvh import build_bvh
+
+
+def random_mesh(rng, num_triangles=200):
+    """Small random triangles scattered through a 20mm cube."""
+    centers = rng.uniform(-10.0, 10.0, size=(num_triangles, 1, 3))
+    vertices = (centers + rng.uniform(-1.5, 1.5, size=(num_triangles, 3, 3))).reshape(-1, 3)
+    indices = np.arange(len(vertices), dtype=np.uint32)
+    return vertices.astype(np.float32), indices
+
+
+def brute_force_hit(vertices, indices, origin, direction):
+    """Closest hit by testing every triangle with scalar Moller-Trumbore."""
+    best = None
+    for tri, (a, b, c) in enumerate(vertices[indices].astype(np.float64).reshape(-1, 3, 3)):
+        edge1, edge2 = b - a, c - a
+        pvec = np.cross(direction, edge2)
+        det = edge1 @ pvec
+        if abs(det) <= 1e-12:
+            continue
+        tvec = origin - a
+        u = (tvec @ pvec) / det
+        qvec = np.cross(tvec, edge1)
+        v = (direction @ qvec) / det
+        t = (edge2 @ qvec) / det
+        if u >= 0.0 and v >= 0.0 and u + v <= 1.0 and t >= 0.0:
+            if best is None or t < best[1]:
+                best = (tri, t)
+    return best
+
+
+def test_intersect_ray_matches_brute_force():
+    """The BVH finds the same closest hit as testing every triangle."""
+    rng = np.random.default_rng(1)
+    vertices, indices = random_mesh(rng)
+    bvh = build_bvh(vertices, indices)
+
+    hits = 0
+    for _ in range(100):
+        origin = rng.uniform(-15.0, 15.0, size=3)
+        direction = rng.uniform(-10.0, 10.0, size=3) - origin
+
+        expected = brute_force_hit(vertices, indices, origin, direction)
+        result = bvh.intersect_ray(origin, direction)
+        if expected is None:
+            assert result is None, "Ray should miss every triangle"
+        else:
+            hits += 1
+            assert result is not None, "Ray should hit a triangle"
+            assert result[0] == expected[0], "Should hit the closest triangle"
+            assert np.isclose(result[1], expected[1]), "Hit distance should match"
+
+    assert hits > 20, "Enough rays should hit something to compare"
+
+
+def test_axis_aligned_ray():
+    """Rays parallel to an axis (infinite inverse direction) still hit."""
+    vertices = np.array([(0, 0, 0), (1, 0, 0), (0, 1, 0),
+                         (0, 0, 2), (1, 0, 2), (0, 1, 2)], dtype=np.float32)
+    indices = np.arange(6, dtype=np.uint32)
+    bvh = build_bvh(vertices, indices, leaf_size=1)
+
+    assert bvh.intersect_ray((0.2, 0.2, 5.0), (0.0, 0.0, -1.0)) == (1, 3.0)
+    assert bvh.intersect_ray((0.2, 0.2, -5.0), (0.0, 0.0, 1.0)) == (0, 5.0)
+    assert bvh.intersect_ray((2.0, 2.0, 5.0), (0.0, 0.0, -1.0)) is None
+
+
+def test_build_bvh_without_triangles():
+    """No tree is built for a mesh without triangles."""
+    assert build_bvh(np.zeros((0, 3)), np.zeros(0, dtype=np.uint32)) is None
+    assert build_bvh(None, None) is None
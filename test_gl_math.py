@@ -0,0 +1,114 @@
+"""
+Tests for the CPU matrix helpers.
+
+Run with: python -m pytest test_gl_math.py
+"""
+
+import numpy as np
+
+from gl_math import (
+    ortho_matrix,
+    perspective_matrix,
+    project_points,
+    ray_segment_distances,
+    rotation_matrix,
+    translation_matrix,
+    unproject_points,
+)
+
+VIEWPORT = (0, 0, 800, 600)
+
+
+def point_ray_distance(point, origin, direction):
+    """Distance from a point to a ray."""
+    s = max((point - origin) @ direction / (direction @ direction), 0.0)
+    return np.linalg.norm(origin + s * direction - point)
+
+
+def scalar_ray_segment_distance(origin, direction, start, end):
+    """Closest approach of a ray and a segment, by ternary search along the segment.
+
+    The distance to the ray is convex along the segment, so the search
+    converges to the closest point.
+    """
+    lo, hi = 0.0, 1.0
+    for _ in range(100):
+        a, b = lo + (hi - lo) / 3, hi - (hi - lo) / 3
+        if (point_ray_distance(start + a * (end - start), origin, direction)
+                <= point_ray_distance(start + b * (end - start), origin, direction)):
+            hi = b
+        else:
+            lo = a
+    return point_ray_distance(start + lo * (end - start), origin, direction)
+
+
+def camera():
+    """A modelview looking at the origin from 200mm away, tilted like the default view."""
+    return (translation_matrix(0.0, 0.0, -200.0)
+            @ rotation_matrix(30.0, 1.0, 0.0, 0.0)
+            @ rotation_matrix(45.0, 0.0, 1.0, 0.0))
+
+
+def test_project_unproject_round_trip():
+    """Unprojecting projected points gives the points back, for both projections."""
+    rng = np.random.default_rng(2)
+    points = rng.uniform(-50.0, 50.0, size=(100, 3))
+    modelview = camera()
+
+    for projection in (perspective_matrix(45.0, 800 / 600, 0.1, 1000.0),
+                       ortho_matrix(-60.0, 60.0, -45.0, 45.0, -500.0, 500.0)):
+        window = project_points(points, modelview, projection, VIEWPORT)
+        restored = unproject_points(window, modelview, projection, VIEWPORT)
+        assert np.allclose(restored, points, atol=1e-6), "Round trip should restore the points"
+
+
+def test_project_points_viewport():
+    """The view axis lands in the middle of the viewport, and depth follows the near/far range."""
+    projection = perspective_matrix(45.0, 800 / 600, 1.0, 100.0)
+    window = project_points([(0.0, 0.0, -1.0), (0.0, 0.0, -100.0)],
+                            np.eye(4), projection, (10, 20, 800, 600))
+
+    assert np.allclose(window[:, :2], (410.0, 320.0)), "Should be at the viewport center"
+    assert np.allclose(window[:, 2], (0.0, 1.0)), "Near and far planes map to depth 0 and 1"
+
+
+def test_unproject_window_ray():
+    """Unprojecting one pixel at depth 0 and 1 gives a ray through the projected point."""
+    modelview = camera()
+    projection = perspective_matrix(45.0, 800 / 600, 0.1, 1000.0)
+    point = np.array((12.0, -7.0, 30.0))
+
+    x, y, _ = project_points(point, modelview, projection, VIEWPORT)[0]
+    near, far = unproject_points([(x, y, 0.0), (x, y, 1.0)], modelview, projection, VIEWPORT)
+
+    direction = (far - near) / np.linalg.norm(far - near)
+    offset = point - near
+    assert np.linalg.norm(offset - (offset @ direction) * direction) < 1e-6, \
+        "The point should lie on the unprojected ray"
+
+
+def test_ray_segment_distances_match_scalar():
+    """The batched closest approach matches a scalar search per segment."""
+    rng = np.random.default_rng(3)
+    origin = np.array((5.0, 40.0, 120.0))
+    direction = np.array((-0.1, -0.3, -1.0))
+    starts = rng.uniform(-30.0, 30.0, size=(200, 3))
+    ends = starts + rng.uniform(-20.0, 20.0, size=(200, 3))
+    # Include a segment parallel to the ray, one behind its origin and a point
+    starts[:3] = ((0.0, 0.0, 0.0), (0.0, 0.0, 200.0), (1.0, 2.0, 3.0))
+    ends[:3] = ((-1.0, -3.0, -10.0), (10.0, 0.0, 200.0), (1.0, 2.0, 3.0))
+
+    distances, ray_params, segment_params = ray_segment_distances(origin, direction, starts, ends)
+
+    for i in range(len(starts)):
+        expected = scalar_ray_segment_distance(origin, direction, starts[i], ends[i])
+        assert np.isclose(distances[i], expected, atol=1e-6), f"Distance {i} should match"
+
+    # The parameters describe the closest points themselves
+    assert np.all(ray_params >= 0.0), "Closest points should be on the ray"
+    assert np.all((segment_params >= 0.0) & (segment_params <= 1.0)), \
+        "Closest points should be on the segments"
+    gaps = (origin + ray_params[:, None] * direction
+            - (starts + segment_params[:, None] * (ends - starts)))
+    assert np.allclose(np.linalg.norm(gaps, axis=1), distances), \
+        "Distances should be between the closest points"
@@ -0,0 +1,62 @@
+"""
+Tests for the hatching array helpers and statistics.
+
+Run with: python -m pytest test_hatching_integration.py
+"""
+
+import numpy as np
+
+from hatching import HatchLine
+from hatching_integration import estimate_build_time, get_hatching_statistics, hatch_line_arrays
+
+
+def sample_lines():
+    """A contour square and two infill lines, one without a speed."""
+    square = [(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]
+    contour = [HatchLine(start=a, end=b, speed=500.0, is_contour=True)
+               for a, b in zip(square, square[1:] + square[:1])]
+    infill = [HatchLine(start=(1.0, 1.0), end=(4.0, 5.0), speed=1000.0),
+              HatchLine(start=(2.0, 2.0), end=(2.0, 8.0))]
+    return contour + infill
+
+
+def test_hatch_line_arrays():
+    """Each line becomes one row of segments, contour flags and speeds."""
+    lines = sample_lines()
+    segments, is_contour, speeds = hatch_line_arrays(lines)
+
+    assert segments.shape == (len(lines), 4), "One (x1, y1, x2, y2) row per line"
+    assert segments.dtype == np.float64
+    for row, line in zip(segments, lines):
+        assert tuple(row) == (*line.start, *line.end), "Rows should hold the line's points"
+    assert is_contour.tolist() == [line.is_contour for line in lines]
+    assert speeds.tolist() == [500.0] * 4 + [1000.0, 0.0], "Missing speeds should be 0"
+
+
+def test_hatch_line_arrays_empty():
+    """No lines give empty arrays of the right shape."""
+    segments, is_contour, speeds = hatch_line_arrays([])
+
+    assert segments.shape == (0, 4)
+    assert is_contour.shape == (0,) and speeds.shape == (0,)
+
+
+def test_statistics_match_per_line_totals():
+    """Statistics from the arrays agree with summing HatchLine by HatchLine."""
+    lines = sample_lines()
+    hatching_data = {0: lines[:3], 1: lines[3:]}
+    stats = get_hatching_statistics(hatching_data)
+
+    contour = [line for line in lines if line.is_contour]
+    infill = [line for line in lines if not line.is_contour]
+    expected_time = sum(line.length() / line.speed for line in lines if line.speed)
+
+    assert stats['total_layers'] == 2
+    assert stats['total_lines'] == len(lines)
+    assert stats['contour_lines'] == len(contour)
+    assert stats['infill_lines'] == len(infill)
+    assert np.isclose(stats['contour_length_mm'], sum(line.length() for line in contour))
+    assert np.isclose(stats['infill_length_mm'], sum(line.length() for line in infill))
+    assert np.isclose(stats['total_scan_length_mm'], sum(line.length() for line in lines))
+    assert np.isclose(stats['estimated_time_seconds'], expected_time)
+    assert np.isclose(estimate_build_time(hatching_data), expected_time)
@@ -2,7 +2,10 @@
 Worker threads for long-running operations to prevent UI blocking.
 """
 from typing import Callable, Any, Optional
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal
+
+# Number of (triangle, layer) pairs intersected per batch when slicing
+SLICE_BATCH_SIZE = 1 << 20
 
 
 class WorkerThread(QThread):
@@ -58,18 +61,19 @@ class WorkerThread(QThread):
         self._is_cancelled = True
 
 
-class CADLoadWorker(QThread):
+class CADLoadWorker(QRunnable):
     """
     Specialized worker for loading CAD files with progress reporting.
 
-    Signals:
+    Signals (on the .signals object):
         progress: Emitted with (stage, message) during loading
         finished: Emitted with CADModel when loading completes
         error: Emitted with error message when loading fails
     """
-    progress = pyqtSignal(str, str)  # stage, message
-    finished = pyqtSignal(object)  # CADModel
-    error = pyqtSignal(str)  # error message
+    class Signals(QObject):
+        progress = pyqtSignal(str, str)  # stage, message
+        finished = pyqtSignal(object)  # CADModel
+        error = pyqtSignal(str)  # error message
 
     def __init__(self, file_path: str):
         """
@@ -79,6 +83,8 @@ class CADLoadWorker(QThread):
             file_path: Path to the CAD file to load
         """
         super().__init__()
+        # Created on the caller's (GUI) thread so connected slots run there
+        self.signals = self.Signals()
         self.file_path = file_path
         self._is_cancelled = False
 
@@ -89,33 +95,34 @@ class CADLoadWorker(QThread):
 
             def progress_callback(stage: str, message: str):
                 if not self._is_cancelled:
-                    self.progress.emit(stage, message)
+                    self.signals.progress.emit(stage, message)
 
             model = load_cad_file_with_progress(self.file_path, progress_callback)
 
             if not self._is_cancelled:
-                self.finished.emit(model)
+                self.signals.finished.emit(model)
         except Exception as e:
             if not self._is_cancelled:
-                self.error.emit(str(e))
+                self.signals.error.emit(str(e))
 
     def cancel(self):
         """Request cancellation of the loading operation."""
         self._is_cancelled = True
 
 
-class SlicingWorker(QThread):
+class SlicingWorker(QRunnable):
     """
     Specialized worker for slicing models with progress reporting.
 
-    Signals:
+    Signals (on the .signals object):
         progress: Emitted with (current_layer, total_layers, message) during slicing
         finished: Emitted with sliced layers when complete
         error: Emitted with error message when slicing fails
     """
-    progress = pyqtSignal(int, int, str)  # current, total, message
-    finished = pyqtSignal(list)  # list of sliced layers
-    error = pyqtSignal(str)  # error message
+    class Signals(QObject):
+        progress = pyqtSignal(int, int, str)  # current, total, message
+        finished = pyqtSignal(list)  # list of sliced layers
+        error = pyqtSignal(str)  # error message
 
     def __init__(self, models: list, layer_thickness: float):
         """
@@ -126,6 +133,7 @@ class SlicingWorker(QThread):
             layer_thickness: Thickness of each layer in mm
         """
         super().__init__()
+        self.signals = self.Signals()
         self.models = models
         self.layer_thickness = layer_thickness
         self._is_cancelled = False
@@ -142,17 +150,17 @@ class SlicingWorker(QThread):
                 if self._is_cancelled:
                     return
 
-                self.progress.emit(i, len(self.models), f"Slicing model {i+1}/{len(self.models)}")
+                self.signals.progress.emit(i, len(self.models), f"Slicing model {i+1}/{len(self.models)}")
 
                 # Perform slicing using standalone implementation
                 sliced_layers = self._slice_model_standalone(model_data, self.layer_thickness)
                 all_sliced_layers.append(sliced_layers)
 
             if not self._is_cancelled:
-                self.finished.emit(all_sliced_layers)
+                self.signals.finished.emit(all_sliced_layers)
         except Exception as e:
             if not self._is_cancelled:
-                self.error.emit(str(e))
+                self.signals.error.emit(str(e))
 
     def _slice_model_standalone(self, model_data, layer_thickness):
         """
@@ -163,16 +171,16 @@ class SlicingWorker(QThread):
         import numpy as np
 
         cad_model = model_data.get('model')
-        if not cad_model or not cad_model.vertices or not cad_model.indices:
+        if not cad_model or not cad_model.has_mesh():
             return []
 
         model_bounds = model_data.get('bounds')
         if not model_bounds:
             return []
 
-        position = np.asarray(model_data.get('position', [0, 0, 0]), dtype=np.float64)
-        rotation = np.asarray(model_data.get('rotation', [0, 0, 0]), dtype=np.float64)
-        scale    = np.asarray(model_data.get('scale',    [1, 1, 1]), dtype=np.float64)
+        # Copy the transform by value; the UI updates its arrays in place
+        transform = self._transform_key(model_data)
+        position, rotation, scale = (np.array(values, dtype=np.float64) for values in transform)
 
         min_x, min_y, min_z, max_x, max_y, max_z = model_bounds
         model_height = (max_y - min_y) * scale[1]
@@ -186,36 +194,10 @@ class SlicingWorker(QThread):
         # ------------------------------------------------------------------
         # Pre-process: convert and transform ALL vertices exactly ONCE
         # ------------------------------------------------------------------
-        verts_raw = cad_model.vertices
-        idx_raw   = cad_model.indices
-
-        verts = (verts_raw.flatten() if isinstance(verts_raw, np.ndarray)
-                 else np.array(verts_raw, dtype=np.float64).flatten()).astype(np.float64)
+        idx_raw = cad_model.indices
         indices = (idx_raw.flatten() if isinstance(idx_raw, np.ndarray)
                    else np.array(idx_raw, dtype=np.int32).flatten()).astype(np.int32)
-
-        # Reshape to (N_verts, 3) and apply scale
-        verts = verts.reshape(-1, 3) * scale
-
-        # Apply rotations (X → Y → Z, same order as original _transform_vertex)
-        rx, ry, rz = np.radians(rotation)
-        if rotation[0] != 0:
-            cx, sx = np.cos(rx), np.sin(rx)
-            y, z = verts[:, 1].copy(), verts[:, 2].copy()
-            verts[:, 1] = y * cx - z * sx
-            verts[:, 2] = y * sx + z * cx
-        if rotation[1] != 0:
-            cy, sy = np.cos(ry), np.sin(ry)
-            x, z = verts[:, 0].copy(), verts[:, 2].copy()
-            verts[:, 0] = x * cy + z * sy
-            verts[:, 2] = -x * sy + z * cy
-        if rotation[2] != 0:
-            cz, sz = np.cos(rz), np.sin(rz)
-            x, y = verts[:, 0].copy(), verts[:, 1].copy()
-            verts[:, 0] = x * cz - y * sz
-            verts[:, 1] = x * sz + y * cz
-
-        verts += position  # apply translation
+        verts = self._world_vertices(model_data, transform)
 
         # Build per-triangle vertex arrays: shapes (N_tris, 3)
         tris = indices.reshape(-1, 3)
@@ -229,81 +211,178 @@ class SlicingWorker(QThread):
         tri_ymax = np.maximum(np.maximum(y0, y1), y2)
 
         # ------------------------------------------------------------------
-        # Slice each layer using vectorized intersection
+        # Intersect every triangle with every layer plane it spans at once
         # ------------------------------------------------------------------
-        all_layers = []
-        for layer_idx in range(num_layers):
+        plane_ys = model_bottom + (np.arange(num_layers) + 0.5) * layer_thickness
+
+        # Candidate layer range per triangle, with a layer of slack on both
+        # sides for rounding; the exact span test below decides
+        first_layer = np.floor((tri_ymin - model_bottom) / layer_thickness - 0.5)
+        last_layer = np.ceil((tri_ymax - model_bottom) / layer_thickness - 0.5)
+        first_layer = np.clip(first_layer, 0, num_layers).astype(np.int64)
+        last_layer = np.clip(last_layer, -1, num_layers - 1).astype(np.int64)
+        spans = np.maximum(last_layer - first_layer + 1, 0)
+
+        # Expand into (triangle, layer) pairs
+        tri_ids = np.repeat(np.arange(len(tris)), spans)
+        layer_ids = (np.repeat(first_layer, spans) + np.arange(len(tri_ids))
+                     - np.repeat(np.cumsum(spans) - spans, spans))
+        pair_y = plane_ys[layer_ids]
+        # A triangle is cut when a corner is above the plane and one isn't
+        spanned = (tri_ymin[tri_ids] <= pair_y) & (tri_ymax[tri_ids] > pair_y)
+        tri_ids = tri_ids[spanned]
+        layer_ids = layer_ids[spanned]
+        pair_y = pair_y[spanned]
+
+        self.signals.progress.emit(0, num_layers, f"Slicing {num_layers} layers")
+
+        # Work in batches to bound memory and stay responsive to cancel
+        seg_parts, layer_parts, edge_parts, tri_parts = [], [], [], []
+        for start in range(0, len(tri_ids), SLICE_BATCH_SIZE):
             if self._is_cancelled:
                 return []
 
-            plane_y = float(model_bottom + (layer_idx + 0.5) * layer_thickness)
+            batch = slice(start, start + SLICE_BATCH_SIZE)
+            t = tri_ids[batch]
+            segs, pair_index, edge_pair = self._intersect_triangles_vectorized(
+                v0[t], v1[t], v2[t], y0[t], y1[t], y2[t], pair_y[batch])
+            seg_parts.append(segs)
+            layer_parts.append(layer_ids[batch][pair_index])
+            edge_parts.append(edge_pair)
+            tri_parts.append(t[pair_index])
 
-            # Cull triangles whose Y range doesn't span this plane
-            active = (tri_ymin <= plane_y) & (tri_ymax >= plane_y)
-            if not np.any(active):
-                segments = []
-            else:
-                segments = self._intersect_triangles_vectorized(
-                    v0[active], v1[active], v2[active],
-                    y0[active], y1[active], y2[active],
-                    plane_y
-                )
+        if self._is_cancelled:
+            return []
 
+        # Order segments by layer; within a layer by edge pair, then triangle
+        if seg_parts:
+            segs = np.concatenate(seg_parts)
+            seg_layers = np.concatenate(layer_parts)
+            order = np.lexsort((np.concatenate(tri_parts), np.concatenate(edge_parts), seg_layers))
+            segs = segs[order]
+            seg_layers = seg_layers[order]
+        else:
+            segs = np.empty((0, 4))
+            seg_layers = np.empty(0, dtype=np.int64)
+        bounds = np.searchsorted(seg_layers, np.arange(num_layers + 1))
+
+        # Snap all segments at once for comparing the layers' outlines
+        snapped = self._snap_segments(segs)
+
+        all_layers = []
+        for layer_idx in range(num_layers):
+            layer_slice = slice(bounds[layer_idx], bounds[layer_idx + 1])
+            layer_snapped = snapped[layer_slice]
             all_layers.append({
-                'z_height': plane_y,
+                'z_height': float(plane_ys[layer_idx]),
                 'layer_index': layer_idx,
-                'segments': segments
+                'segments': [tuple(row) for row in segs[layer_slice].tolist()],
+                'segments_snapped': layer_snapped,
+                'segments_hash': self._outline_hash(layer_snapped)
             })
 
-            if layer_idx % 10 == 0:
-                self.progress.emit(layer_idx, num_layers, f"Slicing layer {layer_idx}/{num_layers}")
+        self.signals.progress.emit(num_layers, num_layers, f"Sliced {num_layers} layers")
 
         return self._group_layers_into_sections(all_layers, model_bottom)
 
+    @staticmethod
+    def _transform_key(model_data):
+        """Get a model's (position, rotation, scale) as tuples."""
+        return (tuple(model_data.get('position', [0, 0, 0])),
+                tuple(model_data.get('rotation', [0, 0, 0])),
+                tuple(model_data.get('scale', [1, 1, 1])))
+
+    def _world_vertices(self, model_data, transform):
+        """
+        Get a model's vertices transformed for slicing.
+
+        The result is kept on the model data until its transform changes, so
+        re-slicing at another layer thickness doesn't transform the mesh again.
+
+        Args:
+            model_data: Model data dictionary
+            transform: (position, rotation, scale) from _transform_key
+
+        Returns:
+            float64 array (N_verts, 3), shared with the cache
+        """
+        import numpy as np
+        from gl_math import rotation_matrix, scale_matrix
+
+        cached = model_data.get('_world_verts_cache')
+        if cached is not None and cached[0] == transform:
+            return cached[1]
+
+        position, rotation, scale = (np.array(values, dtype=np.float64) for values in transform)
+        verts_raw = model_data['model'].vertices
+        verts = (verts_raw.flatten() if isinstance(verts_raw, np.ndarray)
+                 else np.array(verts_raw, dtype=np.float64).flatten()).astype(np.float64)
+
+        # Scale, then rotate about X → Y → Z (same order as original
+        # _transform_vertex), then translate: one 3x3 matrix and an offset
+        linear = (rotation_matrix(rotation[2], 0.0, 0.0, 1.0)
+                  @ rotation_matrix(rotation[1], 0.0, 1.0, 0.0)
+                  @ rotation_matrix(rotation[0], 1.0, 0.0, 0.0)
+                  @ scale_matrix(*scale))[:3, :3]
+        # One (N, 3) x (3, 3) matmul, then the offset added in place
+        verts = verts.reshape(-1, 3) @ linear.T
+        verts += position
+
+        # Replaced as a whole, so a job slicing concurrently sees either entry
+        model_data['_world_verts_cache'] = (transform, verts)
+        return verts
+
     def _intersect_triangles_vectorized(self, v0, v1, v2, y0, y1, y2, plane_y):
         """
-        Vectorized plane-triangle intersection for a batch of pre-culled triangles.
+        Vectorized plane-triangle intersection for a batch of (triangle, plane) pairs.
 
-        Returns a list of (x1, z1, x2, z2) segment tuples.
+        Args:
+            v0, v1, v2: Triangle corners, shape (N, 3) each
+            y0, y1, y2: Corner heights, shape (N,) each
+            plane_y: Height of the plane to intersect each triangle with, shape (N,)
+
+        Returns:
+            (segments, pair_index, edge_pair): (K, 4) array of (x1, z1, x2, z2)
+            segments, the pair each segment came from, and which pair of
+            edges it joins (0: 01-12, 1: 01-20, 2: 12-20)
         """
         import numpy as np
 
-        def _edge_cross(va, vb, ya, yb):
-            """Return (crosses_mask, x, z) for edge va→vb."""
-            crosses = (((ya <= plane_y) & (yb >= plane_y)) |
-                       ((yb <= plane_y) & (ya >= plane_y)))
-            non_degen = np.abs(yb - ya) > 1e-10
-            crosses &= non_degen
-            safe_dy = np.where(non_degen, yb - ya, 1.0)  # avoid div/0
+        # Classify the corners as above the plane or not. An edge crosses
+        # when its ends differ, so a triangle has either no crossing edge or
+        # exactly two, and a corner on the plane is only ever counted once.
+        above0, above1, above2 = y0 > plane_y, y1 > plane_y, y2 > plane_y
+
+        def _edge_cross(va, vb, ya, yb, crosses):
+            """Return (x, z) where edge va→vb crosses the plane, where it does."""
+            # A crossing edge has one end above and one not, so dy != 0 there
+            safe_dy = np.where(crosses, yb - ya, 1.0)
             t = (plane_y - ya) / safe_dy
             x = va[:, 0] + t * (vb[:, 0] - va[:, 0])
             z = va[:, 2] + t * (vb[:, 2] - va[:, 2])
-            return crosses, x, z
+            return x, z
 
-        c01, x01, z01 = _edge_cross(v0, v1, y0, y1)
-        c12, x12, z12 = _edge_cross(v1, v2, y1, y2)
-        c20, x20, z20 = _edge_cross(v2, v0, y2, y0)
+        c01, c12, c20 = above0 != above1, above1 != above2, above2 != above0
+        x01, z01 = _edge_cross(v0, v1, y0, y1, c01)
+        x12, z12 = _edge_cross(v1, v2, y1, y2, c12)
+        x20, z20 = _edge_cross(v2, v0, y2, y0, c20)
 
-        # Priority: prefer (01,12) > (01,20) > (12,20) to get exactly one
-        # segment per triangle even in degenerate vertex-on-plane cases.
+        # The segment runs between the two crossing edges
         m01_12 = c01 & c12
-        m01_20 = c01 & c20 & ~m01_12
-        m12_20 = c12 & c20 & ~m01_12 & ~m01_20
+        m01_20 = c01 & c20
+        m12_20 = c12 & c20
 
-        parts = []
-        for mask, xa, za, xb, zb in (
+        segments, pair_index, edge_pair = [], [], []
+        for edge_id, (mask, xa, za, xb, zb) in enumerate((
             (m01_12, x01, z01, x12, z12),
             (m01_20, x01, z01, x20, z20),
             (m12_20, x12, z12, x20, z20),
-        ):
-            if np.any(mask):
-                parts.append(np.stack(
-                    [xa[mask], za[mask], xb[mask], zb[mask]], axis=1))
+        )):
+            segments.append(np.stack([xa[mask], za[mask], xb[mask], zb[mask]], axis=1))
+            pair_index.append(np.flatnonzero(mask))
+            edge_pair.append(np.full(np.count_nonzero(mask), edge_id))
 
-        if not parts:
-            return []
-        segs = np.vstack(parts)
-        return [tuple(row) for row in segs]
+        return np.vstack(segments), np.concatenate(pair_index), np.concatenate(edge_pair)
 
     def _group_layers_into_sections(self, all_layers, model_bottom):
         """Group consecutive layers with identical outlines into sections."""
@@ -324,8 +403,10 @@ class SlicingWorker(QThread):
             current_layer = all_layers[i]
             prev_layer = all_layers[i - 1]
 
-            # Check if outlines are equal
-            if self._outlines_are_equal(current_layer['segments'], prev_layer['segments']):
+            # Check if outlines are equal; only equal hashes need the exact check
+            if (current_layer['segments_hash'] == prev_layer['segments_hash']
+                    and self._outlines_match(current_layer['segments_snapped'],
+                                             prev_layer['segments_snapped'])):
                 current_section['end_layer'] = i
                 current_section['z_end'] = current_layer['z_height']
                 current_section['layer_count'] += 1
@@ -343,41 +424,74 @@ class SlicingWorker(QThread):
         sections.append(current_section)
         return sections
 
-    def _outlines_are_equal(self, segments1, segments2, tolerance=1e-6):
-        """Check if two sets of segments represent the same outline."""
-        if len(segments1) != len(segments2):
-            return False
+    @staticmethod
+    def _snap_segments(segments, tolerance=1e-6):
+        """
+        Snap outline segments to a tolerance grid for comparing layers.
+
+        Each segment is ordered so the smaller point comes first, so segment
+        direction doesn't matter.
+
+        Args:
+            segments: Array (K, 4) of (x1, z1, x2, z2) segments
 
-        if len(segments1) == 0:
-            return True
+        Returns:
+            int64 array (K, 4)
+        """
+        import numpy as np
 
-        # Simple comparison (can be improved with better matching)
-        for s1, s2 in zip(segments1, segments2):
-            if abs(s1[0] - s2[0]) > tolerance or \
-               abs(s1[1] - s2[1]) > tolerance or \
-               abs(s1[2] - s2[2]) > tolerance or \
-               abs(s1[3] - s2[3]) > tolerance:
-                return False
+        snapped = np.round(np.asarray(segments, dtype=np.float64).reshape(-1, 4) / tolerance)
+        snapped = snapped.astype(np.int64)
+        # Normalize so smaller point comes first
+        swap = ((snapped[:, 0] > snapped[:, 2])
+                | ((snapped[:, 0] == snapped[:, 2]) & (snapped[:, 1] > snapped[:, 3])))
+        snapped[swap] = snapped[swap][:, [2, 3, 0, 1]]
+        return snapped
+
+    @staticmethod
+    def _outline_hash(snapped):
+        """
+        Hash snapped segments independently of their order.
+
+        Each segment's coordinates are mixed into one 64-bit value, and the
+        values are XOR-ed together. Equal outlines always hash equal; equal
+        hashes are confirmed with _outlines_match.
+        """
+        import numpy as np
 
-        return True
+        mix = np.array((0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F,
+                        0x165667B19E3779F9, 0xD6E8FEB86659FD93), dtype=np.uint64)
+        rows = (snapped.astype(np.uint64) * mix).sum(axis=1, dtype=np.uint64)
+        return int(np.bitwise_xor.reduce(rows ^ (rows >> np.uint64(29)), initial=np.uint64(len(rows))))
+
+    @staticmethod
+    def _outlines_match(snapped1, snapped2):
+        """Check if two snapped outlines have the same segments, in any order."""
+        import numpy as np
+
+        if snapped1.shape != snapped2.shape:
+            return False
+        return np.array_equal(snapped1[np.lexsort(snapped1.T[::-1])],
+                              snapped2[np.lexsort(snapped2.T[::-1])])
 
     def cancel(self):
         """Request cancellation of the slicing operation."""
         self._is_cancelled = True
 
 
-class HatchingWorker(QThread):
+class HatchingWorker(QRunnable):
     """
     Specialized worker for generating hatching with progress reporting.
 
-    Signals:
+    Signals (on the .signals object):
         progress: Emitted with (current_layer, total_layers, message) during hatching
         finished: Emitted with hatching data when complete
         error: Emitted with error message when hatching fails
     """
-    progress = pyqtSignal(int, int, str)  # current, total, message
-    finished = pyqtSignal(dict)  # hatching data dictionary
-    error = pyqtSignal(str)  # error message
+    class Signals(QObject):
+        progress = pyqtSignal(int, int, str)  # current, total, message
+        finished = pyqtSignal(dict)  # hatching data dictionary
+        error = pyqtSignal(str)  # error message
 
     def __init__(self, sliced_layers: list, hatching_params, hatching_strategy):
         """
@@ -389,6 +503,7 @@ class HatchingWorker(QThread):
             hatching_strategy: HatchingStrategy enum value
         """
         super().__init__()
+        self.signals = self.Signals()
         self.sliced_layers = sliced_layers
         self.hatching_params = hatching_params
         self.hatching_strategy = hatching_strategy
@@ -406,13 +521,13 @@ class HatchingWorker(QThread):
                 if self._is_cancelled:
                     return
 
-                self.progress.emit(model_idx, len(self.sliced_layers),
+                self.signals.progress.emit(model_idx, len(self.sliced_layers),
                                  f"Generating hatching for model {model_idx+1}/{len(self.sliced_layers)}")
 
                 # Progress callback for individual layers
                 def layer_progress(layer_idx, total_layers, message):
                     if not self._is_cancelled:
-                        self.progress.emit(layer_idx, total_layers, message)
+                        self.signals.progress.emit(layer_idx, total_layers, message)
 
                 model_hatching = prepare_hatching_for_all_layers(
                     layer_sections,
@@ -427,10 +542,10 @@ class HatchingWorker(QThread):
                     hatching_data[key] = hatch_lines
 
             if not self._is_cancelled:
-                self.finished.emit(hatching_data)
+                self.signals.finished.emit(hatching_data)
         except Exception as e:
             if not self._is_cancelled:
-                self.error.emit(str(e))
+                self.signals.error.emit(str(e))
 
     def cancel(self):
         """Request cancellation of the hatching operation."""